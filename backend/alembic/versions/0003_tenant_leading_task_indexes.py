@@ -0,0 +1,74 @@
+"""
+Tenant-leading composite and partial indexes for list queries
+
+Every list query filters on tenant_id first, then optionally project_id,
+status or priority, and orders by created_at, due_date or priority with id
+as the keyset tie-breaker. The single-column status/priority/due_date
+indexes do not match that shape and only add write cost, so they are
+replaced. ix_task_project_tenant stays: it serves ON DELETE CASCADE from
+project.
+
+Indexes are built CONCURRENTLY so large tables stay writable.
+
+Revision ID: 0003_tenant_leading_indexes
+Revises: 0002_task_priority_due_date
+Create Date: 2025-08-27 00:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0003_tenant_leading_indexes'
+down_revision: Union[str, None] = '0002_task_priority_due_date'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+DUE_DATE_SET = sa.text('due_date IS NOT NULL')
+
+TASK_INDEXES = [
+    ('ix_task_tenant_created', ['tenant_id', 'created_at', 'id'], None),
+    ('ix_task_tenant_project_created', ['tenant_id', 'project_id', 'created_at', 'id'], None),
+    ('ix_task_tenant_status_created', ['tenant_id', 'status', 'created_at', 'id'], None),
+    ('ix_task_tenant_project_status_created', ['tenant_id', 'project_id', 'status', 'created_at', 'id'], None),
+    ('ix_task_tenant_priority', ['tenant_id', 'priority', 'id'], None),
+    ('ix_task_tenant_project_priority', ['tenant_id', 'project_id', 'priority', 'id'], None),
+    ('ix_task_tenant_due', ['tenant_id', 'due_date', 'id'], DUE_DATE_SET),
+    ('ix_task_tenant_project_due', ['tenant_id', 'project_id', 'due_date', 'id'], DUE_DATE_SET),
+]
+
+REPLACED_TASK_INDEXES = [
+    ('ix_task_status', ['status']),
+    ('ix_task_priority', ['priority']),
+    ('ix_task_due_date', ['due_date']),
+    ('ix_task_tenant', ['tenant_id']),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, columns, where in TASK_INDEXES:
+            op.create_index(
+                name, 'task', columns, postgresql_where=where, postgresql_concurrently=True, if_not_exists=True
+            )
+        op.create_index(
+            'ix_project_tenant_created', 'project', ['tenant_id', 'created_at', 'id'],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+
+        for name, _ in REPLACED_TASK_INDEXES:
+            op.drop_index(name, table_name='task', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_project_tenant', table_name='project', postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_project_tenant', 'project', ['tenant_id'], postgresql_concurrently=True, if_not_exists=True)
+        for name, columns in REPLACED_TASK_INDEXES:
+            op.create_index(name, 'task', columns, postgresql_concurrently=True, if_not_exists=True)
+
+        op.drop_index('ix_project_tenant_created', table_name='project', postgresql_concurrently=True, if_exists=True)
+        for name, _, _ in reversed(TASK_INDEXES):
+            op.drop_index(name, table_name='task', postgresql_concurrently=True, if_exists=True)
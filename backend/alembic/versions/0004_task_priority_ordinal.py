@@ -0,0 +1,49 @@
+"""
+Store task priority as a SMALLINT ordinal (low=1, medium=2, high=3)
+
+Sorting the VARCHAR column ordered priorities alphabetically
+(high < low < medium). Converting in place backfills every row through the
+USING expression and rebuilds the priority indexes from migration 0003 on
+the new type. The rewrite takes an ACCESS EXCLUSIVE lock on task for its
+duration, so run it in a maintenance window on large tables.
+
+Revision ID: 0004_task_priority_ordinal
+Revises: 0003_tenant_leading_indexes
+Create Date: 2025-08-29 00:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0004_task_priority_ordinal'
+down_revision: Union[str, None] = '0003_tenant_leading_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column('task', 'priority', server_default=None)
+    op.alter_column(
+        'task',
+        'priority',
+        type_=sa.SmallInteger(),
+        existing_type=sa.String(length=20),
+        existing_nullable=False,
+        postgresql_using="CASE priority WHEN 'low' THEN 1 WHEN 'high' THEN 3 ELSE 2 END",
+    )
+    op.alter_column('task', 'priority', server_default=sa.text('2'))
+
+
+def downgrade() -> None:
+    op.alter_column('task', 'priority', server_default=None)
+    op.alter_column(
+        'task',
+        'priority',
+        type_=sa.String(length=20),
+        existing_type=sa.SmallInteger(),
+        existing_nullable=False,
+        postgresql_using="CASE priority WHEN 1 THEN 'low' WHEN 3 THEN 'high' ELSE 'medium' END",
+    )
+    op.alter_column('task', 'priority', server_default='medium')
@@ -0,0 +1,104 @@
+"""
+Per-project task counters maintained by statement-level triggers
+
+project_stats holds task counts by status and priority for each project.
+AFTER INSERT/UPDATE/DELETE triggers on task aggregate their transition
+tables and apply the deltas in the same transaction as the write. Single
+writes, bulk writes and ON DELETE CASCADE from project all go through
+them, and a multi-row statement costs one counter update per project it
+touches rather than one per row.
+
+Revision ID: 0005_project_task_stats
+Revises: 0004_task_priority_ordinal
+Create Date: 2025-09-03 00:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '0005_project_task_stats'
+down_revision: Union[str, None] = '0004_task_priority_ordinal'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COUNTERS = ['total', 'todo', 'in_progress', 'done', 'low', 'medium', 'high']
+
+# Aggregates one transition table into per-project counter deltas.
+DELTAS = """
+    SELECT project_id, tenant_id,
+           count(*) AS total,
+           count(*) FILTER (WHERE status = 'todo') AS todo,
+           count(*) FILTER (WHERE status = 'in_progress') AS in_progress,
+           count(*) FILTER (WHERE status = 'done') AS done,
+           count(*) FILTER (WHERE priority = 1) AS low,
+           count(*) FILTER (WHERE priority = 2) AS medium,
+           count(*) FILTER (WHERE priority = 3) AS high
+    FROM {rows}
+    GROUP BY project_id, tenant_id
+"""
+
+APPLY_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION project_stats_apply() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE project_stats s SET
+            {', '.join(f'{c} = s.{c} - d.{c}' for c in COUNTERS)},
+            updated_at = now()
+        FROM ({DELTAS.format(rows='old_rows')}) d
+        WHERE s.project_id = d.project_id;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO project_stats (project_id, tenant_id, {', '.join(COUNTERS)}, updated_at)
+        SELECT d.project_id, d.tenant_id, {', '.join(f'd.{c}' for c in COUNTERS)}, now()
+        FROM ({DELTAS.format(rows='new_rows')}) d
+        ON CONFLICT (project_id) DO UPDATE SET
+            {', '.join(f'{c} = project_stats.{c} + EXCLUDED.{c}' for c in COUNTERS)},
+            updated_at = now();
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+"""
+
+TRIGGERS = [
+    ('task_stats_insert', 'INSERT', 'REFERENCING NEW TABLE AS new_rows'),
+    ('task_stats_update', 'UPDATE', 'REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows'),
+    ('task_stats_delete', 'DELETE', 'REFERENCING OLD TABLE AS old_rows'),
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        'project_stats',
+        sa.Column('project_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('project.id', ondelete='CASCADE'), primary_key=True, nullable=False),
+        sa.Column('tenant_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('tenant.id', ondelete='CASCADE'), nullable=False),
+        *[sa.Column(c, sa.Integer(), nullable=False, server_default='0') for c in COUNTERS],
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+    )
+    op.create_index('ix_project_stats_tenant', 'project_stats', ['tenant_id', 'project_id'])
+
+    op.execute(APPLY_FUNCTION)
+    for name, event, referencing in TRIGGERS:
+        op.execute(
+            f'CREATE TRIGGER {name} AFTER {event} ON task {referencing} '
+            f'FOR EACH STATEMENT EXECUTE FUNCTION project_stats_apply()'
+        )
+
+    # Backfill from existing tasks; projects without tasks read as zero.
+    op.execute(
+        f"INSERT INTO project_stats (project_id, tenant_id, {', '.join(COUNTERS)}) "
+        f"SELECT d.project_id, d.tenant_id, {', '.join(f'd.{c}' for c in COUNTERS)} "
+        f"FROM ({DELTAS.format(rows='task')}) d"
+    )
+
+
+def downgrade() -> None:
+    for name, _, _ in TRIGGERS:
+        op.execute(f'DROP TRIGGER IF EXISTS {name} ON task')
+    op.execute('DROP FUNCTION IF EXISTS project_stats_apply()')
+    op.drop_index('ix_project_stats_tenant', table_name='project_stats')
+    op.drop_table('project_stats')
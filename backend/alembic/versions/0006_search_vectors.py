@@ -0,0 +1,68 @@
+"""
+Full-text and trigram search over task titles and project names
+
+Adds generated search_vector columns ('simple' config, so no stemming and
+prefix matching works on any language) and GIN indexes that lead with
+tenant_id through btree_gin, so a search reads only the tenant's postings.
+pg_trgm indexes back the fuzzy fallback for typos.
+
+Adding a STORED generated column rewrites the table; run this in a
+maintenance window on large installs. Indexes are built CONCURRENTLY.
+
+Revision ID: 0006_search_vectors
+Revises: 0005_project_task_stats
+Create Date: 2025-09-05 00:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '0006_search_vectors'
+down_revision: Union[str, None] = '0005_project_task_stats'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TASK_VECTOR = "to_tsvector('simple', coalesce(title, ''))"
+PROJECT_VECTOR = (
+    "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'B')"
+)
+
+SEARCH_INDEXES = [
+    ('ix_task_tenant_search', 'task', ['tenant_id', 'search_vector'], {}),
+    ('ix_task_tenant_title_trgm', 'task', ['tenant_id', 'title'], {'title': 'gin_trgm_ops'}),
+    ('ix_project_tenant_search', 'project', ['tenant_id', 'search_vector'], {}),
+    ('ix_project_tenant_name_trgm', 'project', ['tenant_id', 'name'], {'name': 'gin_trgm_ops'}),
+]
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.execute('CREATE EXTENSION IF NOT EXISTS btree_gin')
+    op.add_column(
+        'task',
+        sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed(TASK_VECTOR, persisted=True), nullable=True),
+    )
+    op.add_column(
+        'project',
+        sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed(PROJECT_VECTOR, persisted=True), nullable=True),
+    )
+
+    with op.get_context().autocommit_block():
+        for name, table, columns, ops in SEARCH_INDEXES:
+            op.create_index(
+                name, table, columns, postgresql_using='gin', postgresql_ops=ops,
+                postgresql_concurrently=True, if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(SEARCH_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+    op.drop_column('project', 'search_vector')
+    op.drop_column('task', 'search_vector')
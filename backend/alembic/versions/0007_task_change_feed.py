@@ -0,0 +1,137 @@
+"""
+Per-tenant change sequence and delete tombstones for task delta sync
+
+Every task insert or content change gets the tenant's next change_seq and
+a fresh updated_at from a BEFORE row trigger; deletes (including ON DELETE
+CASCADE from project) leave a row in task_tombstone. All writes of one
+transaction share a single sequence value, allocated by bumping the
+tenant's row in tenant_change_seq. That row stays locked until commit, so a
+tenant's transactions commit in sequence order and a reader that has seen
+sequence N has seen every change at or below N.
+
+Existing tasks keep change_seq 0 and are returned by a full sync. Adding
+the columns does not rewrite the table; the index is built CONCURRENTLY.
+
+Revision ID: 0007_task_change_feed
+Revises: 0006_search_vectors
+Create Date: 2025-09-08 00:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '0007_task_change_feed'
+down_revision: Union[str, None] = '0006_search_vectors'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# The allocated value is cached in a transaction-local setting per tenant, so
+# a bulk statement bumps the counter once rather than once per row.
+SEQ_FUNCTION = """
+CREATE OR REPLACE FUNCTION tenant_change_seq_next(p_tenant uuid) RETURNS bigint AS $$
+DECLARE
+    setting text := 'change_seq.t' || replace(p_tenant::text, '-', '');
+    seq bigint := nullif(current_setting(setting, true), '')::bigint;
+BEGIN
+    IF seq IS NULL THEN
+        INSERT INTO tenant_change_seq AS s (tenant_id, last_seq) VALUES (p_tenant, 1)
+        ON CONFLICT (tenant_id) DO UPDATE SET last_seq = s.last_seq + 1
+        RETURNING s.last_seq INTO seq;
+        PERFORM set_config(setting, seq::text, true);
+    END IF;
+    RETURN seq;
+END
+$$ LANGUAGE plpgsql;
+"""
+
+STAMP_FUNCTION = """
+CREATE OR REPLACE FUNCTION task_change_stamp() RETURNS trigger AS $$
+BEGIN
+    NEW.change_seq := tenant_change_seq_next(NEW.tenant_id);
+    NEW.updated_at := now();
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+"""
+
+# Tasks removed by deleting their tenant need no tombstone (and could not
+# reference the tenant any more), so those rows are skipped.
+TOMBSTONE_FUNCTION = """
+CREATE OR REPLACE FUNCTION task_tombstone_record() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO task_tombstone (task_id, tenant_id, project_id, change_seq, deleted_at)
+    SELECT o.id, o.tenant_id, o.project_id, tenant_change_seq_next(o.tenant_id), now()
+    FROM old_rows o
+    WHERE EXISTS (SELECT 1 FROM tenant t WHERE t.id = o.tenant_id)
+    ON CONFLICT (task_id) DO NOTHING;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+"""
+
+CONTENT_COLUMNS = ['title', 'status', 'assignee', 'priority', 'due_date', 'project_id']
+
+
+def upgrade() -> None:
+    op.create_table(
+        'tenant_change_seq',
+        sa.Column('tenant_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('tenant.id', ondelete='CASCADE'), primary_key=True, nullable=False),
+        sa.Column('last_seq', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('pruned_seq', sa.BigInteger(), nullable=False, server_default='0'),
+    )
+    op.create_table(
+        'task_tombstone',
+        sa.Column('task_id', postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
+        sa.Column('tenant_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('tenant.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('project_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('change_seq', sa.BigInteger(), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+    )
+    op.create_index('ix_task_tombstone_tenant_seq', 'task_tombstone', ['tenant_id', 'change_seq', 'task_id'])
+    op.create_index('ix_task_tombstone_deleted_at', 'task_tombstone', ['deleted_at'])
+
+    op.add_column('task', sa.Column('change_seq', sa.BigInteger(), nullable=False, server_default='0'))
+    op.add_column('task', sa.Column('updated_at', sa.DateTime(), nullable=True))
+
+    op.execute(SEQ_FUNCTION)
+    op.execute(STAMP_FUNCTION)
+    op.execute(TOMBSTONE_FUNCTION)
+    op.execute(
+        'CREATE TRIGGER task_change_insert BEFORE INSERT ON task '
+        'FOR EACH ROW EXECUTE FUNCTION task_change_stamp()'
+    )
+    changed = ' OR '.join(f'OLD.{c} IS DISTINCT FROM NEW.{c}' for c in CONTENT_COLUMNS)
+    op.execute(
+        f'CREATE TRIGGER task_change_update BEFORE UPDATE ON task '
+        f'FOR EACH ROW WHEN ({changed}) EXECUTE FUNCTION task_change_stamp()'
+    )
+    op.execute(
+        'CREATE TRIGGER task_change_delete AFTER DELETE ON task REFERENCING OLD TABLE AS old_rows '
+        'FOR EACH STATEMENT EXECUTE FUNCTION task_tombstone_record()'
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_task_tenant_change_seq', 'task', ['tenant_id', 'change_seq', 'id'],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_task_tenant_change_seq', table_name='task', postgresql_concurrently=True, if_exists=True)
+    for name in ('task_change_insert', 'task_change_update', 'task_change_delete'):
+        op.execute(f'DROP TRIGGER IF EXISTS {name} ON task')
+    op.execute('DROP FUNCTION IF EXISTS task_tombstone_record()')
+    op.execute('DROP FUNCTION IF EXISTS task_change_stamp()')
+    op.execute('DROP FUNCTION IF EXISTS tenant_change_seq_next(uuid)')
+    op.drop_column('task', 'updated_at')
+    op.drop_column('task', 'change_seq')
+    op.drop_index('ix_task_tombstone_deleted_at', table_name='task_tombstone')
+    op.drop_index('ix_task_tombstone_tenant_seq', table_name='task_tombstone')
+    op.drop_table('task_tombstone')
+    op.drop_table('tenant_change_seq')
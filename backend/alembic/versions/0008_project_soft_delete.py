@@ -0,0 +1,44 @@
+"""
+Soft-delete marker for projects purged in the background
+
+Deleting a project with many tasks in the request cascades to every task
+in one statement and holds the connection for as long as that takes.
+Large projects are instead stamped with deleted_at, hidden from every read,
+and their tasks deleted in batches by the purge worker, which finally
+removes the project row.
+
+Adding a nullable column without a default does not rewrite the table. The
+partial index holds only projects waiting to be purged, so it stays tiny
+and lets reads exclude them cheaply; it is built CONCURRENTLY.
+
+Revision ID: 0008_project_soft_delete
+Revises: 0007_task_change_feed
+Create Date: 2025-09-10 00:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0008_project_soft_delete'
+down_revision: Union[str, None] = '0007_task_change_feed'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('project', sa.Column('deleted_at', sa.DateTime(), nullable=True))
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_project_purging', 'project', ['tenant_id', 'id'],
+            postgresql_where=sa.text('deleted_at IS NOT NULL'),
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_project_purging', table_name='project', postgresql_concurrently=True, if_exists=True)
+    op.drop_column('project', 'deleted_at')
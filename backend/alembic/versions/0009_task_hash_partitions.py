@@ -0,0 +1,210 @@
+"""
+Hash-partition task by tenant_id, copying existing rows online
+
+Every task query is tenant-scoped, so with declarative hash partitioning
+on tenant_id each one reads a single partition: indexes stay shallow and
+vacuum works per partition instead of on one table sized by the largest
+tenants. The primary key becomes (tenant_id, id), as Postgres requires the
+partition key in every unique index.
+
+The move is a copy-and-swap that keeps the app writable until the end:
+
+1. Create task_partitioned with TASK_PARTITIONS hash partitions (default
+   16; fixed once created) and all task indexes, while the table is still
+   empty. A row trigger on task mirrors every insert, update and delete
+   into it from then on.
+2. Backfill existing rows in id order, TASK_PARTITION_COPY_BATCH rows per
+   transaction. Each batch locks its source rows FOR SHARE, so a
+   concurrent update or delete waits for the copy and its mirrored write
+   lands after it.
+3. In one short transaction: lock task, drop it, rename task_partitioned
+   and its indexes into place, and re-create the counter, change-feed and
+   tombstone triggers from migrations 0005 and 0007.
+
+Offline (--sql) the backfill is emitted as a single INSERT ... SELECT.
+The downgrade copies back into a plain table and needs a maintenance
+window.
+
+Revision ID: 0009_task_hash_partitions
+Revises: 0008_project_soft_delete
+Create Date: 2025-09-12 00:00:00
+"""
+import os
+import uuid
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+from sqlalchemy.exc import DBAPIError
+
+# revision identifiers, used by Alembic.
+revision: str = '0009_task_hash_partitions'
+down_revision: Union[str, None] = '0008_project_soft_delete'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TASK_PARTITIONS = int(os.getenv('TASK_PARTITIONS', '16'))
+COPY_BATCH = int(os.getenv('TASK_PARTITION_COPY_BATCH', '10000'))
+
+# search_vector is generated, so it is never copied.
+COLUMNS = [
+    'id', 'title', 'status', 'assignee', 'priority', 'due_date',
+    'project_id', 'tenant_id', 'created_at', 'change_seq', 'updated_at',
+]
+COLUMN_LIST = ', '.join(COLUMNS)
+
+DUE_DATE_SET = sa.text('due_date IS NOT NULL')
+
+# (name, columns, create_index kwargs) for every index on task.
+TASK_INDEXES = [
+    ('ix_task_project_tenant', ['project_id', 'tenant_id'], {}),
+    ('ix_task_tenant_created', ['tenant_id', 'created_at', 'id'], {}),
+    ('ix_task_tenant_project_created', ['tenant_id', 'project_id', 'created_at', 'id'], {}),
+    ('ix_task_tenant_status_created', ['tenant_id', 'status', 'created_at', 'id'], {}),
+    ('ix_task_tenant_project_status_created', ['tenant_id', 'project_id', 'status', 'created_at', 'id'], {}),
+    ('ix_task_tenant_priority', ['tenant_id', 'priority', 'id'], {}),
+    ('ix_task_tenant_project_priority', ['tenant_id', 'project_id', 'priority', 'id'], {}),
+    ('ix_task_tenant_due', ['tenant_id', 'due_date', 'id'], {'postgresql_where': DUE_DATE_SET}),
+    ('ix_task_tenant_project_due', ['tenant_id', 'project_id', 'due_date', 'id'], {'postgresql_where': DUE_DATE_SET}),
+    ('ix_task_tenant_search', ['tenant_id', 'search_vector'], {'postgresql_using': 'gin'}),
+    (
+        'ix_task_tenant_title_trgm', ['tenant_id', 'title'],
+        {'postgresql_using': 'gin', 'postgresql_ops': {'title': 'gin_trgm_ops'}},
+    ),
+    ('ix_task_tenant_change_seq', ['tenant_id', 'change_seq', 'id'], {}),
+]
+SHADOW_SUFFIX = '_new'
+
+MIRROR_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION task_partition_mirror() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        DELETE FROM task_partitioned WHERE tenant_id = OLD.tenant_id AND id = OLD.id;
+    ELSE
+        INSERT INTO task_partitioned ({COLUMN_LIST})
+        VALUES ({', '.join(f'NEW.{c}' for c in COLUMNS)})
+        ON CONFLICT (tenant_id, id) DO UPDATE SET
+            {', '.join(f'{c} = EXCLUDED.{c}' for c in COLUMNS if c not in ('id', 'tenant_id'))};
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+"""
+
+# Returns the last id copied; NULL once the source is exhausted.
+COPY_BATCH_SQL = f"""
+WITH batch AS (
+    SELECT {COLUMN_LIST} FROM task WHERE id > :after ORDER BY id LIMIT :batch_size FOR SHARE
+), copied AS (
+    INSERT INTO task_partitioned ({COLUMN_LIST}) SELECT {COLUMN_LIST} FROM batch
+    ON CONFLICT (tenant_id, id) DO NOTHING
+)
+SELECT id FROM batch ORDER BY id DESC LIMIT 1
+"""
+
+# Deadlock and serialization failures: a batch racing a project delete.
+RETRYABLE = ('40P01', '40001')
+
+CONTENT_COLUMNS = ['title', 'status', 'assignee', 'priority', 'due_date', 'project_id']
+STATS_TRIGGERS = [
+    ('task_stats_insert', 'INSERT', 'REFERENCING NEW TABLE AS new_rows'),
+    ('task_stats_update', 'UPDATE', 'REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows'),
+    ('task_stats_delete', 'DELETE', 'REFERENCING OLD TABLE AS old_rows'),
+]
+
+
+def create_task_triggers() -> None:
+    """Re-create the triggers of migrations 0005 and 0007 on the current task table."""
+    for name, event, referencing in STATS_TRIGGERS:
+        op.execute(
+            f'CREATE TRIGGER {name} AFTER {event} ON task {referencing} '
+            f'FOR EACH STATEMENT EXECUTE FUNCTION project_stats_apply()'
+        )
+    op.execute(
+        'CREATE TRIGGER task_change_insert BEFORE INSERT ON task '
+        'FOR EACH ROW EXECUTE FUNCTION task_change_stamp()'
+    )
+    changed = ' OR '.join(f'OLD.{c} IS DISTINCT FROM NEW.{c}' for c in CONTENT_COLUMNS)
+    op.execute(
+        f'CREATE TRIGGER task_change_update BEFORE UPDATE ON task '
+        f'FOR EACH ROW WHEN ({changed}) EXECUTE FUNCTION task_change_stamp()'
+    )
+    op.execute(
+        'CREATE TRIGGER task_change_delete AFTER DELETE ON task REFERENCING OLD TABLE AS old_rows '
+        'FOR EACH STATEMENT EXECUTE FUNCTION task_tombstone_record()'
+    )
+
+
+def add_task_foreign_keys(table: str) -> None:
+    op.create_foreign_key('task_project_id_fkey', table, 'project', ['project_id'], ['id'], ondelete='CASCADE')
+    op.create_foreign_key('task_tenant_id_fkey', table, 'tenant', ['tenant_id'], ['id'], ondelete='CASCADE')
+
+
+def backfill() -> None:
+    if context.is_offline_mode():
+        op.execute(
+            f'INSERT INTO task_partitioned ({COLUMN_LIST}) SELECT {COLUMN_LIST} FROM task '
+            f'ON CONFLICT (tenant_id, id) DO NOTHING'
+        )
+        return
+
+    bind = op.get_bind()
+    statement = sa.text(COPY_BATCH_SQL)
+    after, attempts = uuid.UUID(int=0), 0
+    while True:
+        try:
+            last = bind.execute(statement, {'after': after, 'batch_size': COPY_BATCH}).scalar()
+        except DBAPIError as exc:
+            attempts += 1
+            if getattr(exc.orig, 'sqlstate', None) not in RETRYABLE or attempts > 5:
+                raise
+            continue
+        if last is None:
+            return
+        after, attempts = last, 0
+
+
+def upgrade() -> None:
+    op.execute(
+        'CREATE TABLE task_partitioned (LIKE task INCLUDING DEFAULTS INCLUDING GENERATED, '
+        'CONSTRAINT task_partitioned_pkey PRIMARY KEY (tenant_id, id)) PARTITION BY HASH (tenant_id)'
+    )
+    for remainder in range(TASK_PARTITIONS):
+        op.execute(
+            f'CREATE TABLE task_p{remainder:03d} PARTITION OF task_partitioned '
+            f'FOR VALUES WITH (MODULUS {TASK_PARTITIONS}, REMAINDER {remainder})'
+        )
+    add_task_foreign_keys('task_partitioned')
+    for name, columns, options in TASK_INDEXES:
+        op.create_index(name + SHADOW_SUFFIX, 'task_partitioned', columns, **options)
+    op.execute(MIRROR_FUNCTION)
+    op.execute(
+        'CREATE TRIGGER task_partition_mirror AFTER INSERT OR UPDATE OR DELETE ON task '
+        'FOR EACH ROW EXECUTE FUNCTION task_partition_mirror()'
+    )
+
+    # Commits the shadow table and mirror trigger; each batch then commits on its own.
+    with op.get_context().autocommit_block():
+        backfill()
+
+    op.execute('LOCK TABLE task IN ACCESS EXCLUSIVE MODE')
+    op.execute('DROP TABLE task')
+    op.execute('DROP FUNCTION task_partition_mirror()')
+    op.rename_table('task_partitioned', 'task')
+    op.execute('ALTER INDEX task_partitioned_pkey RENAME TO task_pkey')
+    for name, _, _ in TASK_INDEXES:
+        op.execute(f'ALTER INDEX {name}{SHADOW_SUFFIX} RENAME TO {name}')
+    create_task_triggers()
+
+
+def downgrade() -> None:
+    op.execute('CREATE TABLE task_unpartitioned (LIKE task INCLUDING DEFAULTS INCLUDING GENERATED)')
+    op.execute(f'INSERT INTO task_unpartitioned ({COLUMN_LIST}) SELECT {COLUMN_LIST} FROM task')
+    op.execute('DROP TABLE task')
+    op.rename_table('task_unpartitioned', 'task')
+    op.create_primary_key('task_pkey', 'task', ['id'])
+    add_task_foreign_keys('task')
+    for name, columns, options in TASK_INDEXES:
+        op.create_index(name, 'task', columns, **options)
+    create_task_triggers()
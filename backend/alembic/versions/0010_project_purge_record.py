@@ -0,0 +1,39 @@
+"""
+Record finished background project purges
+
+GET /projects/{id}/purge reported "done" for any id without a project row,
+including ids that never existed. The purge worker now writes a row here in
+the transaction that removes the project, so the status URL can tell a
+finished purge from an unknown id; rows are pruned after
+PROJECT_PURGE_RECORD_DAYS.
+
+Revision ID: 0010_project_purge_record
+Revises: 0009_task_hash_partitions
+Create Date: 2025-09-20 00:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '0010_project_purge_record'
+down_revision: Union[str, None] = '0009_task_hash_partitions'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'project_purge',
+        sa.Column('project_id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('tenant_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('tenant.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('purged_at', sa.DateTime(), nullable=False),
+    )
+    op.create_index('ix_project_purge_purged_at', 'project_purge', ['purged_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_project_purge_purged_at', table_name='project_purge')
+    op.drop_table('project_purge')
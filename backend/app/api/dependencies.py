@@ -1,15 +1,45 @@
-from fastapi import Depends
+import math
+from fastapi import Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 import uuid
 
-from ..infrastructure.security.jwt import get_current_user
-from ..infrastructure.db.session import get_session
-from ..infrastructure.db.models import User
+from ..infrastructure.admission import AdmissionRejected, AdmissionSlot, TenantThrottled, admission
+from ..infrastructure.security.jwt import Principal, get_current_principal
+from ..infrastructure.db.session import get_session, read_session
 
 
 async def get_db_session(session: AsyncSession = Depends(get_session)) -> AsyncSession:
     return session
 
 
-async def get_current_tenant_id(current_user: User = Depends(get_current_user)) -> uuid.UUID:
-    return current_user.tenant_id
+async def get_current_tenant_id(principal: Principal = Depends(get_current_principal)) -> uuid.UUID:
+    return principal.tenant_id
+
+
+async def get_db_read_session(tenant_id: uuid.UUID = Depends(get_current_tenant_id)) -> AsyncSession:
+    """Session for read-only routes: the read replica when usable, else the primary."""
+    async with read_session(tenant_id) as session:
+        yield session
+
+
+async def admit_tenant_request(tenant_id: uuid.UUID = Depends(get_current_tenant_id)) -> AdmissionSlot:
+    """Hold an admission slot for the request; 429/503 with Retry-After when rejected.
+
+    The slot is released when the handler is done, unless a streaming handler
+    took it over with ``slot.hand_off()`` (declaring this dependency again
+    gives the handler the same slot).
+    """
+    try:
+        slot = admission.acquire(tenant_id)
+    except AdmissionRejected as exc:
+        throttled = isinstance(exc, TenantThrottled)
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS if throttled else status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many requests, please retry" if throttled else "Server is busy, please retry",
+            headers={"Retry-After": str(max(1, math.ceil(exc.retry_after)))},
+        )
+    try:
+        yield slot
+    finally:
+        if not slot.handed_off:
+            slot.release()
@@ -1,37 +1,37 @@
-from fastapi import FastAPI
+"""Application factory.
+
+Run with ``uvicorn --factory app.api.main:create_app``. Importing this
+module only loads FastAPI and the settings: routers, models, the database
+engine and the background jobs are loaded by :func:`create_app` and its
+lifespan. ``app.api.main:app`` still works and builds the app on first
+access.
+"""
+
+import asyncio
+import contextlib
+from typing import AsyncIterator
+
+from fastapi import Depends, FastAPI
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi import HTTPException, Request
 from fastapi.exceptions import RequestValidationError
 
-from .routes import auth, projects, tasks
 from ..infrastructure.config import get_settings
 
-app = FastAPI(title="AskBob AI PMS", version="0.1.0")
-
 settings = get_settings()
-origins = settings.allowed_origins
-allow_credentials = False if origins == ["*"] else True
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=origins,
-    allow_credentials=allow_credentials,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-
-@app.exception_handler(HTTPException)
+
+
 async def http_exception_handler(request: Request, exc: HTTPException):
     return JSONResponse(
         status_code=exc.status_code,
         content={
             "error": {"code": exc.status_code, "message": exc.detail, "path": str(request.url.path)}
         },
+        headers=getattr(exc, "headers", None),
     )
 
 
-@app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     return JSONResponse(
         status_code=422,
@@ -46,7 +46,6 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     )
 
 
-@app.exception_handler(Exception)
 async def unhandled_exception_handler(request: Request, exc: Exception):
     return JSONResponse(
         status_code=500,
@@ -60,12 +59,124 @@ async def unhandled_exception_handler(request: Request, exc: Exception):
     )
 
 
-@app.get("/")
-async def root():
-    """Basic health endpoint."""
-    return JSONResponse({"status": "ok"})
+def preload_deferred_imports() -> None:
+    """Import what request paths otherwise import on first use (python-jose, passlib)."""
+    import jose.jwt  # noqa: F401
+
+    from ..infrastructure.security.password import get_pwd_context
+
+    get_pwd_context()
+
+
+def start_background_jobs() -> list[asyncio.Task]:
+    from ..infrastructure.db.changes import run_tombstone_pruner
+    from ..infrastructure.db.purge import run_project_purger
+    from ..infrastructure.db.replica import run_replica_monitor
+    from ..infrastructure.db.session import AsyncSessionLocal, get_read_engine
+    from ..infrastructure.db.stats import run_stats_reconciler
+
+    jobs = []
+    if settings.stats_reconcile_interval_seconds > 0:
+        jobs.append(
+            asyncio.create_task(run_stats_reconciler(AsyncSessionLocal, settings.stats_reconcile_interval_seconds))
+        )
+    if settings.project_purge_interval_seconds > 0:
+        jobs.append(
+            asyncio.create_task(
+                run_project_purger(
+                    AsyncSessionLocal,
+                    settings.project_purge_interval_seconds,
+                    settings.project_purge_batch_size,
+                    settings.project_purge_record_days,
+                )
+            )
+        )
+    if settings.task_tombstone_retention_days > 0:
+        jobs.append(
+            asyncio.create_task(run_tombstone_pruner(AsyncSessionLocal, settings.task_tombstone_retention_days))
+        )
+    read_engine = get_read_engine()
+    if read_engine is not None:
+        jobs.append(asyncio.create_task(run_replica_monitor(read_engine, settings.replica_lag_check_seconds)))
+    return jobs
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Open the pools and start the event broker and background jobs; undo it all on shutdown.
+
+    Warming the pool (see ``warmup.py``) and the deferred imports overlap,
+    and startup waits up to ``DB_POOL_TIMEOUT`` for both; if the database
+    is not reachable by then, warm-up keeps retrying in the background and
+    ``/ready`` stays 503 until it succeeds.
+    """
+    from ..infrastructure.db.session import dispose_engines, get_engine
+    from ..infrastructure.db.warmup import run_pool_warmer
+    from ..infrastructure.events import broker
+    from ..infrastructure.security.jwt import PRINCIPAL, invalidate_principal
+    from ..infrastructure.tenant_writes import invalidate_tenant
+
+    warm_connections = min(settings.db_pool_warm_connections, settings.db_pool_size)
+    warmer = asyncio.create_task(run_pool_warmer(get_engine(), warm_connections, settings.db_warmup_retry_seconds))
+    await asyncio.gather(
+        asyncio.to_thread(preload_deferred_imports),
+        asyncio.wait({warmer}, timeout=settings.db_pool_timeout),
+    )
+    await broker.start(invalidate_tenant, {PRINCIPAL: invalidate_principal})
+    jobs = [warmer, *start_background_jobs()]
+    try:
+        yield
+    finally:
+        for task in jobs:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        await broker.stop()
+        await dispose_engines()
+
+
+def create_app() -> FastAPI:
+    from . import metrics
+    from .dependencies import admit_tenant_request
+    from .routes import auth, events, health, projects, tasks
+
+    app = FastAPI(title="AskBob AI PMS", version="0.1.0", lifespan=lifespan)
+
+    origins = settings.allowed_origins
+    allow_credentials = False if origins == ["*"] else True
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=origins,
+        allow_credentials=allow_credentials,
+        allow_methods=["*"],
+        allow_headers=["*"],
+        expose_headers=["ETag"],
+    )
+    if settings.metrics_enabled:
+        # Added last so it is outermost and also times CORS handling.
+        app.add_middleware(metrics.MetricsMiddleware)
+
+    app.add_exception_handler(HTTPException, http_exception_handler)
+    app.add_exception_handler(RequestValidationError, validation_exception_handler)
+    app.add_exception_handler(Exception, unhandled_exception_handler)
+
+    app.include_router(health.router, tags=["health"])
+    if settings.metrics_enabled:
+        app.include_router(metrics.router)
+    app.include_router(auth.router, prefix="/auth", tags=["auth"])
+    # Tenant routes go through admission control; auth is bounded by the hashing pool.
+    admitted = [Depends(admit_tenant_request)]
+    app.include_router(projects.router, prefix="/projects", tags=["projects"], dependencies=admitted)
+    app.include_router(tasks.router, prefix="/tasks", tags=["tasks"], dependencies=admitted)
+    # Long-lived streams would pin admission slots, so events are not admitted.
+    app.include_router(events.router, prefix="/events", tags=["events"])
+    return app
 
 
-app.include_router(auth.router, prefix="/auth", tags=["auth"])
-app.include_router(projects.router, prefix="/projects", tags=["projects"])
-app.include_router(tasks.router, prefix="/tasks", tags=["tasks"])
+def __getattr__(name: str):
+    # Keeps ``app.api.main:app`` working for existing commands and imports.
+    if name == "app":
+        global app
+        app = create_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,89 @@
+"""Request metrics middleware and the ``GET /metrics`` endpoint.
+
+The middleware is plain ASGI (no ``BaseHTTPMiddleware`` task hop) and
+labels requests by route template, e.g. ``/tasks/{task_id}``, so label
+cardinality stays bounded; requests that match no route share the
+``unmatched`` label. Each request's :class:`RequestStats` (query count, DB
+time and per-fingerprint breakdown) is available to handlers as
+``request.state.query_stats`` and is passed to the query profiler when the
+request finishes.
+"""
+
+import os
+import time
+
+from fastapi import APIRouter, Response
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, generate_latest, multiprocess
+
+from ..infrastructure.config import get_settings
+from ..infrastructure.db.profiling import finish_request
+from ..infrastructure.metrics import (
+    DB_QUERIES_PER_REQUEST,
+    DB_SECONDS_PER_REQUEST,
+    HTTP_IN_PROGRESS,
+    HTTP_REQUEST_SECONDS,
+    HTTP_RESPONSE_BYTES,
+    RequestStats,
+    request_stats,
+)
+
+settings = get_settings()
+router = APIRouter()
+
+
+class MetricsMiddleware:
+    """Record latency, status, response size and DB usage for every HTTP request."""
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats(scope=scope)
+        scope.setdefault("state", {})["query_stats"] = stats
+        token = request_stats.set(stats)
+        response = {"status": 500, "bytes": 0}
+
+        async def send_and_measure(message) -> None:
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+                if settings.query_timing_header:
+                    timing = f'db;dur={stats.db_seconds * 1000:.1f};desc="{stats.queries} queries"'
+                    message["headers"] = [*message.get("headers", []), (b"server-timing", timing.encode())]
+            elif message["type"] == "http.response.body":
+                response["bytes"] += len(message.get("body", b""))
+            await send(message)
+
+        HTTP_IN_PROGRESS.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_and_measure)
+        finally:
+            elapsed = time.perf_counter() - started
+            HTTP_IN_PROGRESS.dec()
+            request_stats.reset(token)
+            template = stats.route
+            method = scope["method"]
+            HTTP_REQUEST_SECONDS.labels(method, template, str(response["status"])).observe(elapsed)
+            HTTP_RESPONSE_BYTES.labels(method, template).observe(response["bytes"])
+            DB_QUERIES_PER_REQUEST.labels(template).observe(stats.queries)
+            DB_SECONDS_PER_REQUEST.labels(template).observe(stats.db_seconds)
+            finish_request(stats)
+
+
+def metrics_registry():
+    """The default registry, or an aggregate over all workers in multiprocess mode."""
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return registry
+    return REGISTRY
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    """Prometheus text exposition of all metrics."""
+    return Response(generate_latest(metrics_registry()), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,72 @@
+"""Per-tenant cache of serialized list responses with ETag revalidation.
+
+Entries are keyed by tenant, the tenant's data version, the endpoint and
+the normalized query string. Any project or task write bumps the version
+(see ``record_tenant_write``), so stale pages are never served by the
+worker that handled the write; other workers pick the change up within
+``RESPONSE_CACHE_TTL_SECONDS``.
+
+ETags are a hash of the body, so a client revalidating with
+``If-None-Match`` gets ``304 Not Modified`` whenever the page is unchanged,
+even after unrelated writes forced a rebuild.
+"""
+
+import hashlib
+import uuid
+from typing import Awaitable, Callable, Union
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+from ..infrastructure.cache import TTLCache, tenant_versions
+from ..infrastructure.config import get_settings
+
+settings = get_settings()
+response_cache = TTLCache(
+    settings.response_cache_max_entries,
+    settings.response_cache_ttl_seconds,
+    max_bytes=settings.response_cache_max_bytes,
+    sizeof=lambda entry: len(entry[0]),
+)
+
+
+def make_etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison as used for ``If-None-Match`` (RFC 9110 section 13.1.2)."""
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def _not_modified_or_body(request: Request, body: bytes, etag: str) -> Response:
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def cached_response(
+    request: Request,
+    tenant_id: uuid.UUID,
+    build: Callable[[], Awaitable[Union[BaseModel, bytes]]],
+) -> Response:
+    """Serve a list response from cache, building and storing it on a miss.
+
+    ``build`` is only awaited on a miss, so hits and 304s never query the
+    database. It returns the response model, or the already serialized JSON
+    body (see ``PageSerializer``).
+    """
+    # Read the version before building so a concurrent write leaves the
+    # entry under a version that is already stale.
+    version = tenant_versions.get(tenant_id)
+    key = (tenant_id, version, request.url.path, tuple(sorted(request.query_params.multi_items())))
+    entry = response_cache.get(key)
+    if entry is None:
+        built = await build()
+        body = built if isinstance(built, bytes) else built.model_dump_json().encode()
+        entry = (body, make_etag(body))
+        response_cache.set(key, entry)
+    return _not_modified_or_body(request, *entry)
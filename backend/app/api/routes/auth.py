@@ -11,15 +11,25 @@ from fastapi.security import OAuth2PasswordRequestForm
 from pydantic import BaseModel, EmailStr
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 
 from ..dependencies import get_db_session
 from ...infrastructure.db.models import User, Tenant
-from ...infrastructure.security.password import hash_password, verify_password
+from ...infrastructure.security.password import HashQueueFull, hash_password_async, verify_password_async
 from ...infrastructure.security.jwt import create_access_token
 
 router = APIRouter()
 
 
+def hashing_busy() -> HTTPException:
+    """503 returned when the password hashing pool is saturated."""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Authentication is busy, please retry",
+        headers={"Retry-After": "1"},
+    )
+
+
 class RegisterRequest(BaseModel):
     """Registration payload to create a tenant and the first user."""
     email: EmailStr
@@ -35,19 +45,39 @@ class TokenResponse(BaseModel):
 
 @router.post("/register", response_model=TokenResponse)
 async def register(req: RegisterRequest, session: Annotated[AsyncSession, Depends(get_db_session)]):
-    """Register a new tenant and user, returning a JWT token for immediate use."""
+    """Register a new tenant and user, returning a JWT token for immediate use.
+
+    The email check is only a fast path: a concurrent signup with the same
+    email can still win the race while bcrypt runs, and then the unique
+    constraint decides.
+    """
+    email_taken = HTTPException(status_code=400, detail="Email already registered")
     # Check existing user
-    exists = await session.execute(select(User).where(User.email == req.email))
+    exists = await session.execute(select(User.id).where(User.email == req.email))
     if exists.scalar_one_or_none():
-        raise HTTPException(status_code=400, detail="Email already registered")
-
-    tenant = Tenant(name=req.tenant_name)
-    session.add(tenant)
-    await session.flush()
-
-    user = User(email=req.email, hashed_password=hash_password(req.password), tenant_id=tenant.id)
-    session.add(user)
-    await session.commit()
+        raise email_taken
+    # End the read transaction so no pooled connection is held while bcrypt runs
+    await session.rollback()
+
+    try:
+        hashed = await hash_password_async(req.password)
+    except HashQueueFull:
+        raise hashing_busy()
+
+    try:
+        tenant = Tenant(name=req.tenant_name)
+        session.add(tenant)
+        await session.flush()
+
+        user = User(email=req.email, hashed_password=hashed, tenant_id=tenant.id)
+        session.add(user)
+        await session.commit()
+    except IntegrityError:
+        await session.rollback()
+        exists = await session.execute(select(User.id).where(User.email == req.email))
+        if exists.scalar_one_or_none():
+            raise email_taken
+        raise
 
     token = create_access_token({"user_id": str(user.id), "tenant_id": str(user.tenant_id)})
     return TokenResponse(access_token=token)
@@ -56,9 +86,17 @@ async def register(req: RegisterRequest, session: Annotated[AsyncSession, Depend
 @router.post("/login", response_model=TokenResponse)
 async def login(form_data: Annotated[OAuth2PasswordRequestForm, Depends()], session: Annotated[AsyncSession, Depends(get_db_session)]):
     """Login with email/password and receive a JWT token."""
-    result = await session.execute(select(User).where(User.email == form_data.username))
-    user = result.scalar_one_or_none()
-    if user is None or not verify_password(form_data.password, user.hashed_password):
+    result = await session.execute(
+        select(User.id, User.tenant_id, User.hashed_password).where(User.email == form_data.username)
+    )
+    user = result.one_or_none()
+    # Return the pooled connection before the slow bcrypt verification
+    await session.rollback()
+    try:
+        valid = user is not None and await verify_password_async(form_data.password, user.hashed_password)
+    except HashQueueFull:
+        raise hashing_busy()
+    if not valid:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Incorrect username or password")
 
     token = create_access_token({"user_id": str(user.id), "tenant_id": str(user.tenant_id)})
@@ -0,0 +1,132 @@
+"""Live change feed: ``GET /events`` (Server-Sent Events) and ``/events/ws`` (WebSocket).
+
+Both stream the caller's tenant events as JSON objects ``{"type", "data"}``,
+e.g. ``task.updated`` with the task as returned by the tasks API, plus
+``resync`` when the client fell too far behind. Browsers cannot set headers
+on ``EventSource`` or WebSocket connections, so instead of the access token
+they pass a short-lived ticket from ``POST /events/ticket`` as ``?ticket=``;
+URLs end up in access and proxy logs. Streams end when the access token
+expires; clients reconnect with a fresh ticket.
+"""
+
+import asyncio
+import contextlib
+import time
+from typing import AsyncIterator, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, WebSocket, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from ...infrastructure.config import get_settings
+from ...infrastructure.db.session import read_session
+from ...infrastructure.events import Event, Subscription, broker
+from ...infrastructure.security.jwt import (
+    Principal,
+    create_stream_ticket,
+    get_current_principal,
+    get_ticket_principal,
+    oauth2_scheme,
+)
+
+router = APIRouter()
+settings = get_settings()
+
+PING = Event("ping")
+
+
+class StreamTicket(BaseModel):
+    ticket: str
+    expires_in: int
+
+
+@router.post("/ticket", response_model=StreamTicket)
+async def stream_ticket(principal: Principal = Depends(get_current_principal)) -> StreamTicket:
+    """Ticket for opening ``GET /events?ticket=`` or ``/events/ws?ticket=`` shortly after."""
+    return StreamTicket(ticket=create_stream_ticket(principal), expires_in=settings.events_ticket_ttl_seconds)
+
+
+async def authenticate_token(token: str) -> Principal:
+    async with read_session() as session:
+        return await get_current_principal(token, session)
+
+
+async def authenticate_ticket(ticket: str) -> Principal:
+    async with read_session() as session:
+        return await get_ticket_principal(ticket, session)
+
+
+async def stream_principal(request: Request, ticket: Optional[str] = Query(None)) -> Principal:
+    """Principal from the ``ticket`` query parameter (``EventSource``) or the Bearer header."""
+    if ticket is not None:
+        return await authenticate_ticket(ticket)
+    return await authenticate_token(await oauth2_scheme(request))
+
+
+async def tenant_events(subscription: Subscription, principal: Principal) -> AsyncIterator[Event]:
+    """Events for the subscription, :data:`PING` when idle, ending when the token expires."""
+    expires_at = principal.claims.get("exp")
+    while True:
+        timeout = settings.events_heartbeat_seconds
+        if expires_at is not None:
+            remaining = expires_at - time.time()
+            if remaining <= 0:
+                return
+            timeout = min(timeout, remaining)
+        event = await subscription.get(timeout)
+        yield PING if event is None else event
+
+
+async def sse_stream(principal: Principal) -> AsyncIterator[bytes]:
+    async with broker.subscribe(principal.tenant_id) as subscription:
+        # Ask EventSource to reconnect after 3s instead of its default.
+        yield b"retry: 3000\n\n"
+        async for event in tenant_events(subscription, principal):
+            yield b": ping\n\n" if event is PING else f"data: {event.to_json()}\n\n".encode()
+
+
+@router.get("")
+async def events(principal: Principal = Depends(stream_principal)) -> StreamingResponse:
+    """Server-Sent Events stream of the tenant's project and task changes."""
+    return StreamingResponse(
+        sse_stream(principal),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _send_events(websocket: WebSocket, subscription: Subscription, principal: Principal) -> None:
+    async for event in tenant_events(subscription, principal):
+        await websocket.send_text(event.to_json())
+    await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="token expired")
+
+
+async def _wait_for_disconnect(websocket: WebSocket) -> None:
+    while (await websocket.receive())["type"] != "websocket.disconnect":
+        pass
+
+
+@router.websocket("/ws")
+async def events_ws(websocket: WebSocket, ticket: str = Query(...)) -> None:
+    """WebSocket stream of the same events; ``ping`` messages keep idle connections alive."""
+    try:
+        principal = await authenticate_ticket(ticket)
+    except HTTPException:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    async with broker.subscribe(principal.tenant_id) as subscription:
+        await websocket.accept()
+        tasks = {
+            asyncio.create_task(_send_events(websocket, subscription, principal)),
+            asyncio.create_task(_wait_for_disconnect(websocket)),
+        }
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        for task in done:
+            # A send racing the client's disconnect fails; nothing to report.
+            with contextlib.suppress(Exception):
+                task.result()
@@ -0,0 +1,24 @@
+"""Liveness and readiness probes."""
+
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from ...infrastructure.db.warmup import readiness
+
+router = APIRouter()
+
+
+@router.get("/")
+async def root():
+    """Basic health endpoint."""
+    return JSONResponse({"status": "ok"})
+
+
+@router.get("/ready")
+async def ready():
+    """Readiness: 200 once this worker's database pool is warm, 503 until then.
+
+    Stays 503 while the database is unreachable at startup; ``error`` holds
+    the last warm-up failure.
+    """
+    return JSONResponse(readiness.snapshot(), status_code=200 if readiness.ready else 503)
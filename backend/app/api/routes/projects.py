@@ -1,17 +1,28 @@
 """Project endpoints with strict tenant isolation."""
 
 import uuid
-from typing import Annotated, Optional
+from datetime import datetime
+from typing import Annotated, Literal, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import delete, select, update
 
-from ..dependencies import get_db_session, get_current_tenant_id
+from ..dependencies import get_db_read_session, get_db_session, get_current_tenant_id
+from ..response_cache import cached_response
+from ..serialization import PageSerializer
+from .tasks import TaskOut
 from ...infrastructure.repositories.sqlalchemy_repositories import ProjectRepositorySQLAlchemy
+from ...application.repositories import InvalidCursor
 from ...application.use_cases import projects as project_uc
+from ...infrastructure.db.counting import TotalMode
+from ...infrastructure.db.purge import mark_for_purge, project_size_query, purge_record_query
+from ...infrastructure.db.stats import project_stats_query
 from ...infrastructure.config import get_settings
+from ...infrastructure.events import Event
+from ...infrastructure.tenant_writes import record_tenant_write
 
 router = APIRouter()
 settings = get_settings()
@@ -39,34 +50,176 @@ class ProjectOut(BaseModel):
         from_attributes = True
 
 
-class ProjectListResponse(BaseModel):
+class TaskCountsOut(BaseModel):
     total: int
+    todo: int
+    in_progress: int
+    done: int
+
+    class Config:
+        from_attributes = True
+
+
+class ProjectListItem(ProjectOut):
+    """A listed project; the task fields are only set when requested with ``include``."""
+    task_counts: Optional[TaskCountsOut] = None
+    recent_tasks: Optional[list[TaskOut]] = None
+
+
+class ProjectListResponse(BaseModel):
+    total: Optional[int] = None
     items: list[ProjectOut]
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+    total_mode: TotalMode = TotalMode.exact
+
+
+class ProjectOverviewListResponse(ProjectListResponse):
+    """List response when ``include`` asks for task counts or recent tasks."""
+    items: list[ProjectListItem]
+
+
+project_page_serializer = PageSerializer(ProjectListResponse, ProjectOut)
+
+INCLUDE_OPTIONS = ("task_counts", "recent_tasks")
+RECENT_TASKS_DEFAULT = 3
+RECENT_TASKS_MAX = 20
+
+
+def parse_include(include: Optional[str]) -> set[str]:
+    """Split a comma-separated ``include`` value; unknown names are a 400."""
+    names = {name.strip() for name in include.split(",") if name.strip()} if include else set()
+    unknown = names.difference(INCLUDE_OPTIONS)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown include: {', '.join(sorted(unknown))}")
+    return names
 
 
-@router.get("/", response_model=ProjectListResponse)
+@router.get("/", response_model=Union[ProjectListResponse, ProjectOverviewListResponse])
 async def list_projects(
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    request: Request,
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
     tenant_id: Annotated[uuid.UUID, Depends(get_current_tenant_id)],
     limit: int = Query(settings.default_page_size, ge=1, le=settings.max_page_size),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Opaque next_cursor from a previous page; overrides offset"),
+    total_mode: Optional[TotalMode] = Query(None, description="How to compute total: exact|estimated|cached|none"),
+    q: Optional[str] = Query(None, min_length=1, max_length=200, description="Search project names and descriptions"),
+    include: Optional[str] = Query(None, description="Comma-separated extras per project: task_counts,recent_tasks"),
+    recent_tasks_limit: int = Query(RECENT_TASKS_DEFAULT, ge=1, le=RECENT_TASKS_MAX, description="Newest tasks per project for include=recent_tasks"),
 ):
-    """List projects for current tenant with simple pagination."""
-    from ...infrastructure.db.models import Project
+    """List projects for current tenant, newest first, by offset or keyset cursor.
+
+    With ``q``, only matching projects are listed, best match first.
+    ``include=task_counts`` adds each project's task counts by status and
+    ``include=recent_tasks`` its ``recent_tasks_limit`` newest tasks; both
+    come from the same single query as the page, so an overview needs no
+    per-project requests. Responses carry an ETag and are served from the
+    tenant's response cache until its next write.
+    """
+    extras = parse_include(include)
+
+    async def build() -> Union[ProjectOverviewListResponse, bytes]:
+        mode = total_mode or TotalMode(settings.default_total_mode)
+        repo = ProjectRepositorySQLAlchemy(session)
+        try:
+            page = await project_uc.page_projects(
+                repo,
+                tenant_id,
+                limit=limit,
+                cursor=cursor,
+                offset=offset,
+                q=q,
+                total_mode=mode.value,
+                task_counts="task_counts" in extras,
+                recent_tasks=recent_tasks_limit if "recent_tasks" in extras else 0,
+            )
+        except InvalidCursor:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        if extras:
+            return ProjectOverviewListResponse(
+                items=[ProjectListItem.model_validate(project) for project in page.items],
+                total=page.total,
+                next_cursor=page.next_cursor,
+                has_more=page.has_more,
+                total_mode=mode,
+            )
+        return project_page_serializer.dump_json(
+            page.items, total=page.total, next_cursor=page.next_cursor, has_more=page.has_more, total_mode=mode
+        )
+
+    return await cached_response(request, tenant_id, build)
+
+
+class StatusCounts(BaseModel):
+    todo: int = 0
+    in_progress: int = 0
+    done: int = 0
+
 
-    total_q = select(func.count()).select_from(Project).where(Project.tenant_id == tenant_id)
-    total = (await session.execute(total_q)).scalar_one()
+class PriorityCounts(BaseModel):
+    low: int = 0
+    medium: int = 0
+    high: int = 0
 
-    result = await session.execute(
-        select(Project)
-        .where(Project.tenant_id == tenant_id)
-        .order_by(Project.created_at.desc())
-        .limit(limit)
-        .offset(offset)
+
+class ProjectStatsOut(BaseModel):
+    """Task counts for one project; ``overdue`` counts open tasks past their due date."""
+    project_id: uuid.UUID
+    total: int
+    by_status: StatusCounts
+    by_priority: PriorityCounts
+    overdue: int
+
+
+class ProjectStatsListResponse(BaseModel):
+    items: list[ProjectStatsOut]
+
+
+def stats_out(row) -> ProjectStatsOut:
+    return ProjectStatsOut(
+        project_id=row.project_id,
+        total=row.total,
+        by_status=StatusCounts(todo=row.todo, in_progress=row.in_progress, done=row.done),
+        by_priority=PriorityCounts(low=row.low, medium=row.medium, high=row.high),
+        overdue=row.overdue,
     )
-    projects = result.scalars().all()
-    items = [ProjectOut.model_validate(p) for p in projects]
-    return ProjectListResponse(total=total, items=items)
+
+
+@router.get("/stats", response_model=ProjectStatsListResponse)
+async def list_project_stats(
+    request: Request,
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
+    tenant_id: Annotated[uuid.UUID, Depends(get_current_tenant_id)],
+):
+    """Task counts for every project of the current tenant, in one query.
+
+    Counts come from the trigger-maintained ``project_stats`` table rather
+    than from scanning tasks.
+    """
+    async def build() -> ProjectStatsListResponse:
+        result = await session.execute(project_stats_query(tenant_id, datetime.utcnow()))
+        return ProjectStatsListResponse(items=[stats_out(row) for row in result])
+
+    return await cached_response(request, tenant_id, build)
+
+
+@router.get("/{project_id}/stats", response_model=ProjectStatsOut)
+async def get_project_stats(
+    project_id: uuid.UUID,
+    request: Request,
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
+    tenant_id: Annotated[uuid.UUID, Depends(get_current_tenant_id)],
+):
+    """Task counts for one project owned by the current tenant."""
+    async def build() -> ProjectStatsOut:
+        query = project_stats_query(tenant_id, datetime.utcnow(), project_id)
+        row = (await session.execute(query)).one_or_none()
+        if row is None:
+            raise HTTPException(status_code=404, detail="Project not found")
+        return stats_out(row)
+
+    return await cached_response(request, tenant_id, build)
 
 
 @router.post("/", response_model=ProjectOut, status_code=201)
@@ -78,7 +231,9 @@ async def create_project(
     """Create a project for current tenant."""
     repo = ProjectRepositorySQLAlchemy(session)
     created = await project_uc.create_project(repo, tenant_id, body.name, body.description)
-    return ProjectOut(id=created.id, name=created.name, description=created.description)
+    project = ProjectOut(id=created.id, name=created.name, description=created.description)
+    record_tenant_write(tenant_id, Event("project.created", project.model_dump(mode="json")))
+    return project
 
 
 @router.put("/{project_id}", response_model=ProjectOut)
@@ -88,38 +243,117 @@ async def update_project(
     session: Annotated[AsyncSession, Depends(get_db_session)],
     tenant_id: Annotated[uuid.UUID, Depends(get_current_tenant_id)],
 ):
-    """Update a project owned by current tenant."""
+    """Update a project owned by current tenant with one ``UPDATE ... RETURNING``."""
     from ...infrastructure.db.models import Project
 
-    result = await session.execute(select(Project).where(Project.id == project_id, Project.tenant_id == tenant_id))
-    project = result.scalar_one_or_none()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-
+    values = {}
     if body.name is not None:
-        project.name = body.name
+        values["name"] = body.name
     if body.description is not None:
-        project.description = body.description
+        values["description"] = body.description
+
+    scope = (Project.id == project_id, Project.tenant_id == tenant_id, Project.deleted_at.is_(None))
+    columns = (Project.id, Project.name, Project.description)
+    if values:
+        stmt = (
+            update(Project)
+            .where(*scope)
+            .values(values)
+            .returning(*columns)
+            .execution_options(synchronize_session=False)
+        )
+    else:
+        stmt = select(*columns).where(*scope)
+    row = (await session.execute(stmt)).one_or_none()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Project not found")
 
-    await session.commit()
-    await session.refresh(project)
-    return ProjectOut.model_validate(project)
+    project = ProjectOut.model_validate(row)
+    if values:
+        await session.commit()
+        record_tenant_write(tenant_id, Event("project.updated", project.model_dump(mode="json")))
+    return project
 
 
-@router.delete("/{project_id}", status_code=204)
+class ProjectPurgeStatus(BaseModel):
+    """Progress of a background project delete; ``remaining_tasks`` is 0 once done."""
+    project_id: uuid.UUID
+    state: Literal["purging", "done"]
+    remaining_tasks: int
+    status_url: str
+
+
+def purge_status(project_id: uuid.UUID, state: str, remaining_tasks: int) -> ProjectPurgeStatus:
+    return ProjectPurgeStatus(
+        project_id=project_id,
+        state=state,
+        remaining_tasks=remaining_tasks,
+        status_url=f"/projects/{project_id}/purge",
+    )
+
+
+@router.delete(
+    "/{project_id}",
+    status_code=204,
+    responses={202: {"model": ProjectPurgeStatus, "description": "Large project queued for background purge"}},
+)
 async def delete_project(
     project_id: uuid.UUID,
     session: Annotated[AsyncSession, Depends(get_db_session)],
     tenant_id: Annotated[uuid.UUID, Depends(get_current_tenant_id)],
 ):
-    """Delete a project owned by current tenant."""
+    """Delete a project owned by current tenant; its tasks go via ON DELETE CASCADE.
+
+    Projects with more than ``PROJECT_PURGE_THRESHOLD`` tasks are only
+    marked deleted, which hides them at once, and purged in batches in the
+    background: the response is then ``202`` with a status URL. Deleting a
+    project that is already being purged returns its status again.
+    """
     from ...infrastructure.db.models import Project
 
-    result = await session.execute(select(Project).where(Project.id == project_id, Project.tenant_id == tenant_id))
-    project = result.scalar_one_or_none()
-    if not project:
+    size = (await session.execute(project_size_query(tenant_id, project_id))).one_or_none()
+    if size is None:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    await session.delete(project)
-    await session.commit()
-    return None
+    if size.deleted_at is None and size.tasks <= settings.project_purge_threshold:
+        await session.execute(
+            delete(Project)
+            .where(Project.id == project_id, Project.tenant_id == tenant_id)
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+        record_tenant_write(tenant_id, Event("project.deleted", {"id": str(project_id)}))
+        return None
+
+    if size.deleted_at is None:
+        await mark_for_purge(session, tenant_id, project_id)
+        await session.commit()
+        record_tenant_write(tenant_id, Event("project.deleted", {"id": str(project_id)}))
+    body = purge_status(project_id, "purging", size.tasks)
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content=body.model_dump(mode="json"),
+        headers={"Location": body.status_url},
+    )
+
+
+@router.get("/{project_id}/purge", response_model=ProjectPurgeStatus)
+async def get_purge_status(
+    project_id: uuid.UUID,
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+    tenant_id: Annotated[uuid.UUID, Depends(get_current_tenant_id)],
+):
+    """Progress of a background project delete.
+
+    ``done`` once the project row is gone, for ``PROJECT_PURGE_RECORD_DAYS``
+    while the purge is on record; 404 for unknown ids and for projects that
+    are not being deleted. Reads the primary, so progress never goes back.
+    """
+    size = (await session.execute(project_size_query(tenant_id, project_id))).one_or_none()
+    if size is None:
+        if (await session.execute(purge_record_query(tenant_id, project_id))).one_or_none() is None:
+            raise HTTPException(status_code=404, detail="Project not found")
+        return purge_status(project_id, "done", 0)
+    if size.deleted_at is None:
+        raise HTTPException(status_code=404, detail="Project is not being deleted")
+    return purge_status(project_id, "purging", size.tasks)
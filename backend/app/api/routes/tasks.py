@@ -1,18 +1,57 @@
 """Task endpoints with tenant isolation and basic CRUD."""
 
+import csv
+import io
+import json
 import uuid
-from typing import Annotated, Optional
+from dataclasses import replace
+from operator import attrgetter
+from typing import Annotated, AsyncIterator, Literal, Optional, Sequence, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from pydantic import BaseModel
-from sqlalchemy import select, func
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+from pydantic import BaseModel, Field
+from sqlalchemy import delete, insert, literal, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from enum import Enum
 from datetime import datetime
 
-from ..dependencies import get_db_session, get_current_tenant_id
+from ..dependencies import admit_tenant_request, get_db_read_session, get_db_session, get_current_tenant_id
+from ..response_cache import cached_response
+from ..serialization import PageSerializer
+from ...application.repositories import InvalidCursor, TaskFilters
+from ...application.use_cases import projects as project_uc
+from ...application.use_cases import tasks as task_uc
+from ...domain.entities import TaskEntity
 from ...infrastructure.db.models import Task, Project
+from ...infrastructure.db.session import AsyncSessionLocal
+from ...infrastructure.db.changes import (
+    SyncTokenExpired,
+    changes_query,
+    check_not_pruned,
+    decode_sync_token,
+    encode_sync_token,
+    start_position,
+)
+from ...infrastructure.db.counting import TotalMode
+from ...infrastructure.db.purge import visible_tasks
+from ...infrastructure.db.task_queries import (  # noqa: F401 - re-exported for scripts and tests
+    NULLABLE_SORT_KEYS,
+    SORT_COLUMNS,
+    TASK_LIST_COLUMNS,
+    TASK_OUT_COLUMNS,
+    filtered_tasks_query,
+    resolve_sort,
+)
+from ...infrastructure.repositories.sqlalchemy_repositories import (
+    ProjectRepositorySQLAlchemy,
+    TaskRepositorySQLAlchemy,
+)
+from ...infrastructure.admission import AdmissionSlot
 from ...infrastructure.config import get_settings
+from ...infrastructure.events import Event
+from ...infrastructure.tenant_writes import record_tenant_write
 
 router = APIRouter()
 settings = get_settings()
@@ -49,6 +88,22 @@ class TaskUpdate(BaseModel):
     due_date: Optional[datetime] = None
 
 
+def update_values(body: TaskUpdate) -> dict:
+    """Column values to write for an update; fields left as ``None`` are unchanged."""
+    values = {}
+    if body.title is not None:
+        values["title"] = body.title
+    if body.status is not None:
+        values["status"] = body.status.value
+    if body.assignee is not None:
+        values["assignee"] = body.assignee
+    if body.priority is not None:
+        values["priority"] = body.priority.value
+    if body.due_date is not None:
+        values["due_date"] = body.due_date
+    return values
+
+
 class TaskOut(BaseModel):
     """Task response model."""
     id: uuid.UUID
@@ -64,13 +119,43 @@ class TaskOut(BaseModel):
 
 
 class TaskListResponse(BaseModel):
-    total: int
+    total: Optional[int] = None
     items: list[TaskOut]
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+    total_mode: TotalMode = TotalMode.exact
+
+
+task_page_serializer = PageSerializer(TaskListResponse, TaskOut)
+
+
+def task_filters(
+    project_id: Optional[uuid.UUID] = None,
+    status_filter: Optional[StatusEnum] = None,
+    priority_filter: Optional[PriorityEnum] = None,
+    due_before: Optional[datetime] = None,
+    due_after: Optional[datetime] = None,
+    priority_min: Optional[PriorityEnum] = None,
+    priority_max: Optional[PriorityEnum] = None,
+    q: Optional[str] = None,
+) -> TaskFilters:
+    """Repository filters from the list/export query parameters."""
+    return TaskFilters(
+        project_id=project_id,
+        status=status_filter.value if status_filter else None,
+        priority=priority_filter.value if priority_filter else None,
+        due_before=due_before,
+        due_after=due_after,
+        priority_min=priority_min.value if priority_min else None,
+        priority_max=priority_max.value if priority_max else None,
+        q=q,
+    )
 
 
 @router.get("/", response_model=TaskListResponse)
 async def list_tasks(
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    request: Request,
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
     tenant_id: Annotated[uuid.UUID, Depends(get_current_tenant_id)],
     project_id: Optional[uuid.UUID] = None,
     limit: int = Query(settings.default_page_size, ge=1, le=settings.max_page_size),
@@ -79,41 +164,199 @@ async def list_tasks(
     priority_filter: Optional[PriorityEnum] = None,
     due_before: Optional[datetime] = None,
     due_after: Optional[datetime] = None,
+    priority_min: Optional[PriorityEnum] = Query(None, description="Only tasks at or above this priority"),
+    priority_max: Optional[PriorityEnum] = Query(None, description="Only tasks at or below this priority"),
+    q: Optional[str] = Query(None, min_length=1, max_length=200, description="Search task titles (prefix and typo tolerant)"),
+    sort: Optional[str] = Query(None, description="Sort by: created_at|due_date|priority (prefix - for desc); default is best match when q is set"),
+    cursor: Optional[str] = Query(None, description="Opaque next_cursor from a previous page; overrides offset"),
+    total_mode: Optional[TotalMode] = Query(None, description="How to compute total: exact|estimated|cached|none"),
+):
+    """List tasks for current tenant; filter/sort/pagination supported.
+
+    Pages can be fetched by ``offset`` or, for deep pages, by passing back the
+    ``next_cursor`` of the previous response, which seeks directly in the index.
+    With ``q``, results are ranked by relevance unless ``sort`` is given.
+    Responses carry an ETag and are served from the tenant's response cache
+    until its next write.
+    """
+    filters = task_filters(
+        project_id, status_filter, priority_filter, due_before, due_after, priority_min, priority_max, q
+    )
+
+    async def build() -> bytes:
+        mode = total_mode or TotalMode(settings.default_total_mode)
+        repo = TaskRepositorySQLAlchemy(session)
+        try:
+            page = await task_uc.page_tasks(
+                repo, tenant_id, filters, limit=limit, sort=sort, cursor=cursor, offset=offset, total_mode=mode.value
+            )
+        except InvalidCursor:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        return task_page_serializer.dump_json(
+            page.items, total=page.total, next_cursor=page.next_cursor, has_more=page.has_more, total_mode=mode
+        )
+
+    return await cached_response(request, tenant_id, build)
+
+
+class ExportFormat(str, Enum):
+    ndjson = "ndjson"
+    csv = "csv"
+
+
+EXPORT_COLUMNS = TASK_OUT_COLUMNS + (Task.created_at,)
+EXPORT_FIELDS = [c.key for c in EXPORT_COLUMNS]
+export_row = attrgetter(*EXPORT_FIELDS)
+
+
+def _export_value(value):
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def ndjson_chunk(rows: Sequence) -> bytes:
+    """Encode rows as newline-delimited JSON objects."""
+    return "".join(
+        json.dumps({k: _export_value(v) for k, v in zip(EXPORT_FIELDS, row)}, separators=(",", ":")) + "\n"
+        for row in rows
+    ).encode()
+
+
+def csv_chunk(rows: Sequence, header: bool = False) -> bytes:
+    """Encode rows as CSV lines, optionally preceded by the header line."""
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    if header:
+        writer.writerow(EXPORT_FIELDS)
+    writer.writerows([_export_value(v) for v in row] for row in rows)
+    return buf.getvalue().encode()
+
+
+async def _stream_export(
+    tenant_id: uuid.UUID, filters: TaskFilters, sort: Optional[str], fmt: ExportFormat, slot: AdmissionSlot
+) -> AsyncIterator[bytes]:
+    # The request's session and admission slot are released before a
+    # StreamingResponse body is sent, so the export owns a session and keeps
+    # the slot for the lifetime of the stream.
+    try:
+        async with AsyncSessionLocal() as session:
+            if fmt is ExportFormat.csv:
+                yield csv_chunk([], header=True)
+            repo = TaskRepositorySQLAlchemy(session)
+            async for tasks in task_uc.stream_tasks(repo, tenant_id, filters, sort, settings.export_chunk_size):
+                rows = [export_row(task) for task in tasks]
+                yield csv_chunk(rows) if fmt is ExportFormat.csv else ndjson_chunk(rows)
+    finally:
+        slot.release()
+
+
+@router.get("/export")
+async def export_tasks(
+    tenant_id: Annotated[uuid.UUID, Depends(get_current_tenant_id)],
+    slot: Annotated[AdmissionSlot, Depends(admit_tenant_request)],
+    format: ExportFormat = ExportFormat.ndjson,
+    project_id: Optional[uuid.UUID] = None,
+    status_filter: Optional[StatusEnum] = None,
+    priority_filter: Optional[PriorityEnum] = None,
+    due_before: Optional[datetime] = None,
+    due_after: Optional[datetime] = None,
+    priority_min: Optional[PriorityEnum] = None,
+    priority_max: Optional[PriorityEnum] = None,
     sort: Optional[str] = Query(None, description="Sort by: created_at|due_date|priority (prefix - for desc)"),
 ):
-    """List tasks for current tenant; filter/sort/pagination supported."""
-    base = select(Task).where(Task.tenant_id == tenant_id)
-    if project_id:
-        base = base.where(Task.project_id == project_id)
-    if status_filter:
-        base = base.where(Task.status == status_filter.value)
-    if priority_filter:
-        base = base.where(Task.priority == priority_filter.value)
-    if due_before:
-        base = base.where(Task.due_date != None).where(Task.due_date <= due_before)  # noqa: E711
-    if due_after:
-        base = base.where(Task.due_date != None).where(Task.due_date >= due_after)  # noqa: E711
-
-    count_q = select(func.count()).select_from(base.subquery())
-    total = (await session.execute(count_q)).scalar_one()
-
-    # sort
-    order = Task.created_at.desc()
-    if sort:
-        s = sort.strip().lower()
-        desc = s.startswith('-')
-        key = s[1:] if desc else s
-        if key == 'created_at':
-            order = Task.created_at.desc() if desc else Task.created_at.asc()
-        elif key == 'due_date':
-            order = Task.due_date.desc() if desc else Task.due_date.asc()
-        elif key == 'priority':
-            order = Task.priority.desc() if desc else Task.priority.asc()
-
-    page_q = base.order_by(order).limit(limit).offset(offset)
-    result = await session.execute(page_q)
-    items = [TaskOut.model_validate(t) for t in result.scalars().all()]
-    return TaskListResponse(total=total, items=items)
+    """Stream all of the tenant's matching tasks as NDJSON or CSV.
+
+    Rows come from a server-side cursor in chunks of ``EXPORT_CHUNK_SIZE``,
+    so memory stays flat regardless of tenant size and the first bytes are
+    sent as soon as the first chunk is read. The request's admission slot is
+    held until the stream ends, so open exports count against
+    ``TENANT_MAX_CONCURRENT`` and ``MAX_CONCURRENT_DB_REQUESTS``.
+    """
+    filters = task_filters(
+        project_id, status_filter, priority_filter, due_before, due_after, priority_min, priority_max
+    )
+    if format is ExportFormat.csv:
+        media_type = "text/csv"
+    else:
+        media_type = "application/x-ndjson"
+    slot.hand_off()
+    return StreamingResponse(
+        _stream_export(tenant_id, filters, sort, format, slot),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="tasks.{format.value}"'},
+        # Releases the slot if the client went away before the body was read.
+        background=BackgroundTask(slot.release),
+    )
+
+
+CHANGES_DEFAULT_LIMIT = 500
+CHANGES_MAX_LIMIT = 5000
+
+
+class TaskChange(TaskOut):
+    """Current state of a task created or changed since the token."""
+    updated_at: Optional[datetime] = None
+
+
+class TaskDeletion(BaseModel):
+    id: uuid.UUID
+    project_id: uuid.UUID
+    deleted_at: datetime
+
+
+class TaskChangesResponse(BaseModel):
+    upserts: list[TaskChange]
+    deletions: list[TaskDeletion]
+    next_token: str
+    has_more: bool = False
+
+
+@router.get("/changes", response_model=TaskChangesResponse)
+async def task_changes(
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
+    tenant_id: Annotated[uuid.UUID, Depends(get_current_tenant_id)],
+    since: Optional[str] = Query(None, description="next_token from the previous call; omit for a full sync"),
+    limit: int = Query(CHANGES_DEFAULT_LIMIT, ge=1, le=CHANGES_MAX_LIMIT),
+):
+    """Tasks created, changed or deleted since ``since``, oldest change first.
+
+    Without ``since`` every current task is returned (in pages while
+    ``has_more``). Store ``next_token`` and pass it on the next call to get
+    only what changed since; a task changed several times appears once, in
+    its current state. 410 means the token is older than the retained
+    deletion history and the client must start over with a full sync.
+    """
+    if since is None:
+        position = await start_position(session, tenant_id)
+    else:
+        try:
+            position = decode_sync_token(since)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid sync token")
+        try:
+            await check_not_pruned(session, tenant_id, position)
+        except SyncTokenExpired:
+            raise HTTPException(status_code=410, detail="Sync token expired; start a full sync")
+
+    rows = (await session.execute(changes_query(tenant_id, position, limit + 1))).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    upserts, deletions = [], []
+    for row in rows:
+        if row.deleted:
+            deletions.append(TaskDeletion(id=row.id, project_id=row.project_id, deleted_at=row.updated_at))
+        else:
+            upserts.append(TaskChange.model_validate(row))
+    if rows:
+        last = rows[-1]
+        position = replace(position, seq=last.seq, deleted=last.deleted, row_id=last.id)
+    return TaskChangesResponse(
+        upserts=upserts, deletions=deletions, next_token=encode_sync_token(position), has_more=has_more
+    )
 
 
 @router.post("/", response_model=TaskOut, status_code=201)
@@ -122,25 +365,39 @@ async def create_task(
     session: Annotated[AsyncSession, Depends(get_db_session)],
     tenant_id: Annotated[uuid.UUID, Depends(get_current_tenant_id)],
 ):
-    """Create a task under a project owned by current tenant."""
-    # Validate project belongs to tenant
-    p = await session.execute(select(Project).where(Project.id == body.project_id, Project.tenant_id == tenant_id))
-    if p.scalar_one_or_none() is None:
-        raise HTTPException(status_code=404, detail="Project not found")
+    """Create a task under a project owned by current tenant.
 
-    task = Task(
-        title=body.title,
-        status=body.status.value,
-        assignee=body.assignee,
-        priority=body.priority.value,
-        due_date=body.due_date,
-        project_id=body.project_id,
-        tenant_id=tenant_id,
+    The project ownership check and the insert are a single
+    ``INSERT ... SELECT FROM project ... RETURNING`` statement: no row comes
+    back when the project does not belong to the tenant.
+    """
+    values = {
+        Task.id: uuid.uuid4(),
+        Task.title: body.title,
+        Task.status: body.status.value,
+        Task.assignee: body.assignee,
+        Task.priority: body.priority.value,
+        Task.due_date: body.due_date,
+        Task.created_at: datetime.utcnow(),
+    }
+    source = select(
+        *(literal(value, column.type) for column, value in values.items()),
+        Project.id,
+        Project.tenant_id,
+    ).where(Project.id == body.project_id, Project.tenant_id == tenant_id, Project.deleted_at.is_(None))
+    stmt = (
+        insert(Task)
+        .from_select([*values, Task.project_id, Task.tenant_id], source)
+        .returning(*TASK_OUT_COLUMNS)
     )
-    session.add(task)
+    row = (await session.execute(stmt)).one_or_none()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+
     await session.commit()
-    await session.refresh(task)
-    return TaskOut.model_validate(task)
+    task = TaskOut.model_validate(row)
+    record_tenant_write(tenant_id, Event("task.created", task.model_dump(mode="json")))
+    return task
 
 
 @router.put("/{task_id}", response_model=TaskOut)
@@ -150,26 +407,31 @@ async def update_task(
     session: Annotated[AsyncSession, Depends(get_db_session)],
     tenant_id: Annotated[uuid.UUID, Depends(get_current_tenant_id)],
 ):
-    """Update a task owned by current tenant."""
-    result = await session.execute(select(Task).where(Task.id == task_id, Task.tenant_id == tenant_id))
-    task = result.scalar_one_or_none()
-    if task is None:
-        raise HTTPException(status_code=404, detail="Task not found")
+    """Update a task owned by current tenant with one ``UPDATE ... RETURNING``.
 
-    if body.title is not None:
-        task.title = body.title
-    if body.status is not None:
-        task.status = body.status.value
-    if body.assignee is not None:
-        task.assignee = body.assignee
-    if body.priority is not None:
-        task.priority = body.priority.value
-    if body.due_date is not None:
-        task.due_date = body.due_date
+    Tasks of a project being purged are 404, as for reads.
+    """
+    values = update_values(body)
+    scope = (Task.id == task_id, *visible_tasks(tenant_id))
+    if values:
+        stmt = (
+            update(Task)
+            .where(*scope)
+            .values(values)
+            .returning(*TASK_OUT_COLUMNS)
+            .execution_options(synchronize_session=False)
+        )
+    else:
+        stmt = select(*TASK_OUT_COLUMNS).where(*scope)
+    row = (await session.execute(stmt)).one_or_none()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Task not found")
 
-    await session.commit()
-    await session.refresh(task)
-    return TaskOut.model_validate(task)
+    task = TaskOut.model_validate(row)
+    if values:
+        await session.commit()
+        record_tenant_write(tenant_id, Event("task.updated", task.model_dump(mode="json")))
+    return task
 
 
 @router.delete("/{task_id}", status_code=204)
@@ -178,12 +440,176 @@ async def delete_task(
     session: Annotated[AsyncSession, Depends(get_db_session)],
     tenant_id: Annotated[uuid.UUID, Depends(get_current_tenant_id)],
 ):
-    """Delete a task owned by current tenant."""
-    result = await session.execute(select(Task).where(Task.id == task_id, Task.tenant_id == tenant_id))
-    task = result.scalar_one_or_none()
-    if task is None:
+    """Delete a task owned by current tenant; 404 when no row matched or its project is being purged."""
+    project_id = (
+        await session.execute(
+            delete(Task)
+            .where(Task.id == task_id, *visible_tasks(tenant_id))
+            .returning(Task.project_id)
+            .execution_options(synchronize_session=False)
+        )
+    ).scalar_one_or_none()
+    if project_id is None:
         raise HTTPException(status_code=404, detail="Task not found")
 
-    await session.delete(task)
     await session.commit()
+    record_tenant_write(tenant_id, Event("task.deleted", {"id": str(task_id), "project_id": str(project_id)}))
     return None
+
+
+class BulkModeEnum(str, Enum):
+    """How a bulk request treats failing operations."""
+    atomic = "atomic"
+    best_effort = "best_effort"
+
+
+class BulkCreateOp(BaseModel):
+    op: Literal["create"]
+    data: TaskCreate
+
+
+class BulkUpdateOp(BaseModel):
+    op: Literal["update"]
+    id: uuid.UUID
+    data: TaskUpdate
+
+
+class BulkDeleteOp(BaseModel):
+    op: Literal["delete"]
+    id: uuid.UUID
+
+
+BulkOperation = Annotated[Union[BulkCreateOp, BulkUpdateOp, BulkDeleteOp], Field(discriminator="op")]
+
+
+class BulkTaskRequest(BaseModel):
+    """Batch of task operations applied in one transaction."""
+    mode: BulkModeEnum = BulkModeEnum.atomic
+    operations: list[BulkOperation] = Field(min_length=1, max_length=settings.bulk_max_operations)
+
+
+class BulkItemResult(BaseModel):
+    """Outcome of one operation, reported with an HTTP-style status code."""
+    index: int
+    op: str
+    status: int
+    id: Optional[uuid.UUID] = None
+    error: Optional[str] = None
+
+
+class BulkTaskResponse(BaseModel):
+    committed: bool
+    results: list[BulkItemResult]
+
+
+class BulkPlan:
+    """Set-based writes for the valid operations of a bulk request."""
+
+    def __init__(self) -> None:
+        self.results: list[BulkItemResult] = []
+        self.inserts: list[dict] = []
+        self.updates: list[dict] = []
+        self.delete_ids: list[uuid.UUID] = []
+
+    @property
+    def failed(self) -> bool:
+        return any(r.error is not None for r in self.results)
+
+
+def plan_bulk(
+    operations: list,
+    tenant_id: uuid.UUID,
+    owned_project_ids: set[uuid.UUID],
+    existing_task_ids: set[uuid.UUID],
+) -> BulkPlan:
+    """Validate each operation against the tenant's projects/tasks and group the valid ones by kind.
+
+    The writes run grouped by kind, not in request order, so a task may be
+    the target of only one operation per batch; later ones get 409.
+    """
+    plan = BulkPlan()
+    targeted: set[uuid.UUID] = set()
+    for index, op in enumerate(operations):
+        if isinstance(op, BulkCreateOp):
+            if op.data.project_id not in owned_project_ids:
+                plan.results.append(BulkItemResult(index=index, op=op.op, status=404, error="Project not found"))
+                continue
+            task_id = uuid.uuid4()
+            plan.inserts.append({
+                "id": task_id,
+                "title": op.data.title,
+                "status": op.data.status.value,
+                "assignee": op.data.assignee,
+                "priority": op.data.priority.value,
+                "due_date": op.data.due_date,
+                "project_id": op.data.project_id,
+                "tenant_id": tenant_id,
+                "created_at": datetime.utcnow(),
+            })
+            plan.results.append(BulkItemResult(index=index, op=op.op, status=201, id=task_id))
+            continue
+
+        if op.id in targeted:
+            plan.results.append(BulkItemResult(
+                index=index, op=op.op, status=409, id=op.id, error="Task already targeted earlier in this batch"
+            ))
+            continue
+        targeted.add(op.id)
+        if op.id not in existing_task_ids:
+            plan.results.append(BulkItemResult(index=index, op=op.op, status=404, id=op.id, error="Task not found"))
+        elif isinstance(op, BulkUpdateOp):
+            values = update_values(op.data)
+            if values:
+                # The full primary key, so the executemany UPDATE prunes to one partition.
+                plan.updates.append({"id": op.id, "tenant_id": tenant_id, **values})
+            plan.results.append(BulkItemResult(index=index, op=op.op, status=200, id=op.id))
+        else:
+            plan.delete_ids.append(op.id)
+            plan.results.append(BulkItemResult(index=index, op=op.op, status=204, id=op.id))
+    return plan
+
+
+@router.post("/bulk", response_model=BulkTaskResponse)
+async def bulk_tasks(
+    body: BulkTaskRequest,
+    response: Response,
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+    tenant_id: Annotated[uuid.UUID, Depends(get_current_tenant_id)],
+):
+    """Create, update and delete many tasks in one transaction.
+
+    Ownership is checked with one query for all referenced projects and one
+    for all referenced tasks; writes are one multi-row INSERT, one
+    executemany UPDATE and one DELETE. In ``atomic`` mode any failing
+    operation rejects the whole batch with 409; in ``best_effort`` mode the
+    valid operations are applied and failures are reported per item. A
+    second operation on the same task id fails with 409.
+    """
+    project_ids = {op.data.project_id for op in body.operations if isinstance(op, BulkCreateOp)}
+    task_ids = {op.id for op in body.operations if not isinstance(op, BulkCreateOp)}
+
+    repo = TaskRepositorySQLAlchemy(session)
+    projects = await project_uc.get_projects(ProjectRepositorySQLAlchemy(session), tenant_id, list(project_ids))
+    owned_project_ids = {p.id for p in projects}
+    existing_task_ids = {t.id for t in await task_uc.get_tasks(repo, tenant_id, list(task_ids))}
+
+    plan = plan_bulk(body.operations, tenant_id, owned_project_ids, existing_task_ids)
+    if plan.failed and body.mode is BulkModeEnum.atomic:
+        await session.rollback()
+        response.status_code = status.HTTP_409_CONFLICT
+        return BulkTaskResponse(committed=False, results=plan.results)
+
+    if plan.inserts:
+        await task_uc.create_tasks(repo, [TaskEntity(**values) for values in plan.inserts])
+    if plan.updates:
+        await session.execute(update(Task), plan.updates)
+    if plan.delete_ids:
+        await session.execute(
+            delete(Task).where(*visible_tasks(tenant_id), Task.id.in_(plan.delete_ids))
+        )
+    await session.commit()
+    if plan.inserts or plan.updates or plan.delete_ids:
+        # One summary event instead of one per row; subscribers refetch.
+        counts = {"created": len(plan.inserts), "updated": len(plan.updates), "deleted": len(plan.delete_ids)}
+        record_tenant_write(tenant_id, Event("task.bulk", counts))
+    return BulkTaskResponse(committed=True, results=plan.results)
@@ -0,0 +1,53 @@
+"""Direct-to-JSON serialization of list pages.
+
+List endpoints select plain column rows. Validating each row into a
+response model and then dumping the model costs far more CPU than the query
+itself on a warm cache. :class:`PageSerializer` skips validation and dumps
+the rows with a pydantic-core serializer compiled from the same response
+models, so the bytes are identical to ``Response(...).model_dump_json()``
+while the models stay the documented ``response_model``.
+"""
+
+from typing import Any, Iterable, Type
+
+from pydantic import BaseModel, TypeAdapter
+from typing_extensions import TypedDict
+
+
+def typed_dict_for(model: Type[BaseModel], **overrides: Any) -> type:
+    """A TypedDict with the model's fields (in order), for schema-driven serialization."""
+    fields = {name: overrides.get(name, field.annotation) for name, field in model.model_fields.items()}
+    return TypedDict(f"{model.__name__}Dict", fields)
+
+
+class PageSerializer:
+    """Serialize ``{..., "items": [rows]}`` list responses without building models.
+
+    Rows are result rows (anything with a ``_mapping``) or domain entities
+    carrying at least the item model's fields as attributes; extra columns such as keyset values are ignored.
+    Values are trusted to already have the declared types, which holds for
+    typed column selects.
+    """
+
+    def __init__(self, response_model: Type[BaseModel], item_model: Type[BaseModel], items_field: str = "items") -> None:
+        self.items_field = items_field
+        self.item_fields = tuple(item_model.model_fields)
+        self.response_fields = {
+            name: None if field.is_required() else field.get_default(call_default_factory=True)
+            for name, field in response_model.model_fields.items()
+        }
+        page = typed_dict_for(response_model, **{items_field: list[typed_dict_for(item_model)]})
+        self.adapter = TypeAdapter(page)
+
+    def dump_json(self, rows: Iterable, **fields: Any) -> bytes:
+        names = self.item_fields
+        items = []
+        for row in rows:
+            mapping = getattr(row, "_mapping", None)
+            if mapping is None:
+                items.append({name: getattr(row, name) for name in names})
+            else:
+                items.append({name: mapping[name] for name in names})
+        fields[self.items_field] = items
+        page = {name: fields.get(name, default) for name, default in self.response_fields.items()}
+        return self.adapter.dump_json(page)
@@ -1,21 +1,116 @@
 from __future__ import annotations
-from typing import Protocol, Sequence, Optional
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import AsyncIterator, Generic, Optional, Protocol, Sequence, TypeVar
 import uuid
 
 from ..domain.entities import ProjectEntity, TaskEntity
 
+T = TypeVar("T")
+
+
+class InvalidCursor(ValueError):
+    """A page cursor that is malformed or was issued for another sort order."""
+
+
+@dataclass(slots=True)
+class Page(Generic[T]):
+    """One page of a list query.
+
+    ``next_cursor`` is an opaque token for the following page (``None`` on
+    the last one); ``total`` is ``None`` when the caller did not ask for it.
+    """
+    items: list[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+
+@dataclass(frozen=True, slots=True)
+class TaskFilters:
+    """Task list filters; ``None`` means unfiltered. Hashable, so usable as a cache key."""
+    project_id: Optional[uuid.UUID] = None
+    status: Optional[str] = None
+    priority: Optional[str] = None
+    due_before: Optional[datetime] = None
+    due_after: Optional[datetime] = None
+    priority_min: Optional[str] = None
+    priority_max: Optional[str] = None
+    q: Optional[str] = None
+
 
 class IProjectRepository(Protocol):
     async def list_by_tenant(self, tenant_id: uuid.UUID) -> Sequence[ProjectEntity]:
         ...
 
+    async def page(
+        self,
+        tenant_id: uuid.UUID,
+        *,
+        limit: int,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+        q: Optional[str] = None,
+        total_mode: str = "none",
+        task_counts: bool = False,
+        recent_tasks: int = 0,
+    ) -> Page[ProjectEntity]:
+        """Newest first, or best match first with ``q``; :class:`InvalidCursor` on a bad cursor.
+
+        ``task_counts`` and ``recent_tasks`` (a count) fill the entities' overview fields.
+        """
+        ...
+
+    async def get_many(self, tenant_id: uuid.UUID, ids: Sequence[uuid.UUID]) -> Sequence[ProjectEntity]:
+        """The tenant's projects among ``ids``, in no particular order; unknown ids are skipped."""
+        ...
+
     async def create(self, tenant_id: uuid.UUID, name: str, description: Optional[str]) -> ProjectEntity:
         ...
 
+    async def create_many(self, projects: Sequence[ProjectEntity]) -> Sequence[ProjectEntity]:
+        """Insert fully populated entities in one round-trip; the caller commits."""
+        ...
+
+    def stream(self, tenant_id: uuid.UUID, chunk_size: int = 1000) -> AsyncIterator[Sequence[ProjectEntity]]:
+        """All of the tenant's projects, newest first, in chunks of ``chunk_size``."""
+        ...
+
 
 class ITaskRepository(Protocol):
     async def list_by_tenant(self, tenant_id: uuid.UUID, project_id: Optional[uuid.UUID] = None) -> Sequence[TaskEntity]:
         ...
 
+    async def page(
+        self,
+        tenant_id: uuid.UUID,
+        filters: TaskFilters,
+        *,
+        limit: int,
+        sort: Optional[str] = None,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+        total_mode: str = "none",
+    ) -> Page[TaskEntity]:
+        """Filtered page in ``sort`` order, best match first by default with ``q``; :class:`InvalidCursor` on a bad cursor."""
+        ...
+
+    async def get_many(self, tenant_id: uuid.UUID, ids: Sequence[uuid.UUID]) -> Sequence[TaskEntity]:
+        """The tenant's tasks among ``ids``, in no particular order; unknown ids are skipped."""
+        ...
+
     async def create(self, tenant_id: uuid.UUID, project_id: uuid.UUID, title: str, status: str, assignee: Optional[str]) -> TaskEntity:
         ...
+
+    async def create_many(self, tasks: Sequence[TaskEntity]) -> Sequence[TaskEntity]:
+        """Insert fully populated entities in one round-trip; the caller commits."""
+        ...
+
+    def stream(
+        self, tenant_id: uuid.UUID, filters: TaskFilters, sort: Optional[str] = None, chunk_size: int = 1000
+    ) -> AsyncIterator[Sequence[TaskEntity]]:
+        """Every matching task in ``sort`` order, in chunks of ``chunk_size`` from a server-side cursor."""
+        ...
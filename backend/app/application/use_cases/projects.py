@@ -5,9 +5,9 @@ infrastructure so it can be unit tested easily.
 """
 
 import uuid
-from typing import Optional, Sequence
+from typing import AsyncIterator, Optional, Sequence
 
-from ..repositories import IProjectRepository
+from ..repositories import IProjectRepository, Page
 from ...domain.entities import ProjectEntity
 
 
@@ -19,3 +19,45 @@ async def list_projects_for_tenant(repo: IProjectRepository, tenant_id: uuid.UUI
 async def create_project(repo: IProjectRepository, tenant_id: uuid.UUID, name: str, description: Optional[str]) -> ProjectEntity:
     """Create a project under the given tenant and return the domain entity."""
     return await repo.create(tenant_id, name, description)
+
+
+async def page_projects(
+    repo: IProjectRepository,
+    tenant_id: uuid.UUID,
+    *,
+    limit: int,
+    cursor: Optional[str] = None,
+    offset: int = 0,
+    q: Optional[str] = None,
+    total_mode: str = "none",
+    task_counts: bool = False,
+    recent_tasks: int = 0,
+) -> Page[ProjectEntity]:
+    """One page of the tenant's projects, optionally searched by ``q`` and with task overviews."""
+    return await repo.page(
+        tenant_id,
+        limit=limit,
+        cursor=cursor,
+        offset=offset,
+        q=q,
+        total_mode=total_mode,
+        task_counts=task_counts,
+        recent_tasks=recent_tasks,
+    )
+
+
+async def get_projects(repo: IProjectRepository, tenant_id: uuid.UUID, ids: Sequence[uuid.UUID]) -> Sequence[ProjectEntity]:
+    """The tenant's projects among ``ids`` in one lookup."""
+    return await repo.get_many(tenant_id, ids)
+
+
+async def create_projects(repo: IProjectRepository, projects: Sequence[ProjectEntity]) -> Sequence[ProjectEntity]:
+    """Insert many projects at once; the caller owns the transaction."""
+    return await repo.create_many(projects)
+
+
+def stream_projects(
+    repo: IProjectRepository, tenant_id: uuid.UUID, chunk_size: int = 1000
+) -> AsyncIterator[Sequence[ProjectEntity]]:
+    """All of the tenant's projects, in chunks, without loading them all at once."""
+    return repo.stream(tenant_id, chunk_size)
@@ -4,9 +4,9 @@ High-level business flows for listing and creating tasks.
 """
 
 import uuid
-from typing import Optional, Sequence
+from typing import AsyncIterator, Optional, Sequence
 
-from ..repositories import ITaskRepository
+from ..repositories import ITaskRepository, Page, TaskFilters
 from ...domain.entities import TaskEntity
 
 
@@ -18,3 +18,37 @@ async def list_tasks_for_tenant(repo: ITaskRepository, tenant_id: uuid.UUID, pro
 async def create_task(repo: ITaskRepository, tenant_id: uuid.UUID, project_id: uuid.UUID, title: str, status: str, assignee: Optional[str]) -> TaskEntity:
     """Create a task under a project for a tenant and return the domain entity."""
     return await repo.create(tenant_id, project_id, title, status, assignee)
+
+
+async def page_tasks(
+    repo: ITaskRepository,
+    tenant_id: uuid.UUID,
+    filters: TaskFilters,
+    *,
+    limit: int,
+    sort: Optional[str] = None,
+    cursor: Optional[str] = None,
+    offset: int = 0,
+    total_mode: str = "none",
+) -> Page[TaskEntity]:
+    """One page of the tenant's tasks matching ``filters``."""
+    return await repo.page(
+        tenant_id, filters, limit=limit, sort=sort, cursor=cursor, offset=offset, total_mode=total_mode
+    )
+
+
+async def get_tasks(repo: ITaskRepository, tenant_id: uuid.UUID, ids: Sequence[uuid.UUID]) -> Sequence[TaskEntity]:
+    """The tenant's tasks among ``ids`` in one lookup."""
+    return await repo.get_many(tenant_id, ids)
+
+
+async def create_tasks(repo: ITaskRepository, tasks: Sequence[TaskEntity]) -> Sequence[TaskEntity]:
+    """Insert many tasks at once; the caller owns the transaction."""
+    return await repo.create_many(tasks)
+
+
+def stream_tasks(
+    repo: ITaskRepository, tenant_id: uuid.UUID, filters: TaskFilters, sort: Optional[str] = None, chunk_size: int = 1000
+) -> AsyncIterator[Sequence[TaskEntity]]:
+    """Every matching task, in chunks, without loading them all at once."""
+    return repo.stream(tenant_id, filters, sort, chunk_size)
@@ -4,19 +4,36 @@ from typing import Optional
 import uuid
 
 
-@dataclass
+@dataclass(slots=True)
+class TaskCounts:
+    total: int = 0
+    todo: int = 0
+    in_progress: int = 0
+    done: int = 0
+
+
+# Entities use __slots__: list pages and exports build thousands of them, and
+# slotted instances are much smaller and faster to create than dict-backed ones.
+@dataclass(slots=True)
 class ProjectEntity:
     id: uuid.UUID
     tenant_id: uuid.UUID
     name: str
     description: Optional[str] = None
     created_at: datetime = field(default_factory=datetime.utcnow)
+    # Only filled when a page is asked to include them.
+    task_counts: Optional[TaskCounts] = None
+    recent_tasks: Optional[list["TaskEntity"]] = None
 
 
 ALLOWED_STATUSES = {"todo", "in_progress", "done"}
 
+# Priorities are stored as ordinals so they sort and range-filter by rank.
+PRIORITY_ORDINALS = {"low": 1, "medium": 2, "high": 3}
+PRIORITY_NAMES = {ordinal: name for name, ordinal in PRIORITY_ORDINALS.items()}
+
 
-@dataclass
+@dataclass(slots=True)
 class TaskEntity:
     id: uuid.UUID
     tenant_id: uuid.UUID
@@ -25,6 +42,8 @@ class TaskEntity:
     status: str = "todo"
     assignee: Optional[str] = None
     created_at: datetime = field(default_factory=datetime.utcnow)
+    priority: str = "medium"
+    due_date: Optional[datetime] = None
 
     def change_status(self, new_status: str) -> None:
         if new_status not in ALLOWED_STATUSES:
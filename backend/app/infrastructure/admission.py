@@ -0,0 +1,169 @@
+"""Admission control in front of DB-bound requests.
+
+Each tenant gets a token bucket (``TENANT_RATE_PER_SECOND`` refill,
+``TENANT_BURST`` capacity) and a cap on its concurrent requests, so one
+tenant's script cannot occupy every pool connection. On top of that a
+global cap limits concurrent DB-bound requests per worker, and when the
+primary pool's estimated checkout wait passes ``MAX_POOL_WAIT_MS`` new
+requests are turned away immediately instead of queueing until
+``DB_POOL_TIMEOUT``.
+
+Rejections raise :class:`TenantThrottled` (the tenant is over its own
+limits) or :class:`Overloaded` (the server is), each carrying a
+``retry_after`` hint in seconds. All state is per worker process and only
+touched from the event loop thread.
+"""
+
+import time
+import uuid
+from typing import Callable
+
+from .cache import TTLCache
+from .config import get_settings
+from .db.session import get_engine
+from .metrics import ADMISSION_REJECTED
+
+settings = get_settings()
+
+
+class AdmissionRejected(Exception):
+    """Base class for requests turned away by admission control."""
+
+    def __init__(self, reason: str, retry_after: float) -> None:
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class TenantThrottled(AdmissionRejected):
+    """The tenant exceeded its request rate or concurrency limit."""
+
+
+class Overloaded(AdmissionRejected):
+    """The worker is at its concurrency cap or the DB pool is backed up."""
+
+
+class TokenBucket:
+    """Classic token bucket refilled continuously at ``rate`` tokens per second."""
+
+    __slots__ = ("rate", "burst", "tokens", "updated")
+
+    def __init__(self, rate: float, burst: float, now: float) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = now
+
+    def take(self, now: float) -> float:
+        """Take one token; return 0 on success, else seconds until one is available."""
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class AdmissionSlot:
+    """One admitted request's place in the concurrency limits; released at most once.
+
+    A streaming response takes the slot over with :meth:`hand_off`, so it is
+    held until the body has been sent rather than until the handler returns.
+    """
+
+    __slots__ = ("controller", "tenant_id", "held", "handed_off")
+
+    def __init__(self, controller: "AdmissionController", tenant_id: uuid.UUID) -> None:
+        self.controller = controller
+        self.tenant_id = tenant_id
+        self.held = True
+        self.handed_off = False
+
+    def hand_off(self) -> "AdmissionSlot":
+        self.handed_off = True
+        return self
+
+    def release(self) -> None:
+        if self.held:
+            self.held = False
+            self.controller.release(self.tenant_id)
+
+
+class AdmissionController:
+    """Token buckets and concurrency caps; a limit of 0 disables that check."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        tenant_max_concurrent: int,
+        max_concurrent: int,
+        max_pool_wait: float,
+        pool_wait: Callable[[], float],
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.tenant_max_concurrent = tenant_max_concurrent
+        self.max_concurrent = max_concurrent
+        self.max_pool_wait = max_pool_wait
+        self._pool_wait = pool_wait
+        self._clock = clock
+        # An idle bucket is full again after burst / rate seconds, so dropping
+        # it after that long loses nothing.
+        ttl = max(self.burst / rate, 60.0) if rate > 0 else 60.0
+        self._buckets = TTLCache(maxsize=100_000, ttl=ttl)
+        self._active: dict[uuid.UUID, int] = {}
+        self.in_flight = 0
+
+    def _reject(self, error: AdmissionRejected) -> None:
+        ADMISSION_REJECTED.labels(error.reason).inc()
+        raise error
+
+    def admit(self, tenant_id: uuid.UUID) -> None:
+        """Admit one request for ``tenant_id`` or raise; pair with :meth:`release`."""
+        if self.max_pool_wait > 0:
+            wait = self._pool_wait()
+            if wait > self.max_pool_wait:
+                self._reject(Overloaded("pool_wait", wait))
+        if self.max_concurrent > 0 and self.in_flight >= self.max_concurrent:
+            self._reject(Overloaded("concurrency", 1.0))
+        active = self._active.get(tenant_id, 0)
+        if self.tenant_max_concurrent > 0 and active >= self.tenant_max_concurrent:
+            self._reject(TenantThrottled("tenant_concurrency", 1.0))
+        if self.rate > 0:
+            now = self._clock()
+            bucket = self._buckets.get(tenant_id)
+            if bucket is None:
+                bucket = TokenBucket(self.rate, self.burst, now)
+            # Re-set on every use so only idle buckets expire.
+            self._buckets.set(tenant_id, bucket)
+            retry_after = bucket.take(now)
+            if retry_after:
+                self._reject(TenantThrottled("tenant_rate", retry_after))
+
+        self.in_flight += 1
+        self._active[tenant_id] = active + 1
+
+    def acquire(self, tenant_id: uuid.UUID) -> AdmissionSlot:
+        """:meth:`admit` and return the slot to release."""
+        self.admit(tenant_id)
+        return AdmissionSlot(self, tenant_id)
+
+    def release(self, tenant_id: uuid.UUID) -> None:
+        self.in_flight -= 1
+        remaining = self._active.get(tenant_id, 1) - 1
+        if remaining:
+            self._active[tenant_id] = remaining
+        else:
+            self._active.pop(tenant_id, None)
+
+
+admission = AdmissionController(
+    rate=settings.tenant_rate_per_second,
+    burst=settings.tenant_burst,
+    tenant_max_concurrent=settings.tenant_max_concurrent,
+    max_concurrent=settings.max_concurrent_db_requests,
+    max_pool_wait=settings.max_pool_wait_ms / 1000,
+    pool_wait=lambda: get_engine().pool.estimated_wait(),
+)
@@ -12,15 +12,50 @@ class Settings:
     algorithm: str = os.getenv("ALGORITHM", "HS256")
     access_token_expire_minutes: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60"))
 
+    # Verified-principal cache: skips the per-request user lookup
+    auth_trust_token_claims: bool = os.getenv("AUTH_TRUST_TOKEN_CLAIMS", "false").lower() in ("1", "true", "yes")
+    principal_cache_ttl_seconds: int = int(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "60"))
+    principal_cache_max_entries: int = int(os.getenv("PRINCIPAL_CACHE_MAX_ENTRIES", "10000"))
+
+    # Password hashing pool (bcrypt runs off the event loop)
+    bcrypt_rounds: int = int(os.getenv("BCRYPT_ROUNDS", "12"))
+    password_hash_workers: int = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+    password_hash_max_queue: int = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", "32"))
+
     database_url_async: str = os.getenv("DATABASE_URL", "")
     database_url_sync: str = os.getenv("SYNC_DATABASE_URL", "")
 
+    # Optional read replica for read-only routes (empty disables)
+    database_url_read: str = os.getenv("DATABASE_READ_URL", "")
+    db_read_pool_size: int = int(os.getenv("DB_READ_POOL_SIZE", "10"))
+    db_read_max_overflow: int = int(os.getenv("DB_READ_MAX_OVERFLOW", "20"))
+    replica_connect_timeout_seconds: float = float(os.getenv("REPLICA_CONNECT_TIMEOUT_SECONDS", "2"))
+    replica_max_lag_seconds: float = float(os.getenv("REPLICA_MAX_LAG_SECONDS", "5"))
+    replica_lag_check_seconds: float = float(os.getenv("REPLICA_LAG_CHECK_SECONDS", "5"))
+    replica_retry_seconds: float = float(os.getenv("REPLICA_RETRY_SECONDS", "30"))
+    read_your_writes_seconds: float = float(os.getenv("READ_YOUR_WRITES_SECONDS", "10"))
+
     # Performance tuning
     db_pool_size: int = int(os.getenv("DB_POOL_SIZE", "10"))
     db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", "20"))
     db_pool_timeout: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))
     db_pool_recycle: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
 
+    # Startup warm-up: primary pool connections opened and primed with the hot
+    # list statements before /ready passes (0 skips it), and the retry delay
+    # while the database is unreachable
+    db_pool_warm_connections: int = int(os.getenv("DB_POOL_WARM_CONNECTIONS", "5"))
+    db_warmup_retry_seconds: float = float(os.getenv("DB_WARMUP_RETRY_SECONDS", "5"))
+
+    # Admission control for tenant routes (0 disables each limit): per-tenant
+    # token bucket and concurrency cap (429), per-worker concurrency cap and
+    # estimated primary pool wait above which requests are shed (503)
+    tenant_rate_per_second: float = float(os.getenv("TENANT_RATE_PER_SECOND", "20"))
+    tenant_burst: float = float(os.getenv("TENANT_BURST", "40"))
+    tenant_max_concurrent: int = int(os.getenv("TENANT_MAX_CONCURRENT", "10"))
+    max_concurrent_db_requests: int = int(os.getenv("MAX_CONCURRENT_DB_REQUESTS", "60"))
+    max_pool_wait_ms: float = float(os.getenv("MAX_POOL_WAIT_MS", "500"))
+
     # CORS
     allowed_origins: list[str] = [o.strip() for o in os.getenv("ALLOWED_ORIGINS", "*").split(",") if o.strip()]
 
@@ -28,6 +63,60 @@ class Settings:
     default_page_size: int = int(os.getenv("DEFAULT_PAGE_SIZE", "20"))
     max_page_size: int = int(os.getenv("MAX_PAGE_SIZE", "100"))
 
+    # Bulk task endpoint
+    bulk_max_operations: int = int(os.getenv("BULK_MAX_OPERATIONS", "1000"))
+
+    # Rows fetched per server-side cursor round-trip by GET /tasks/export
+    export_chunk_size: int = int(os.getenv("EXPORT_CHUNK_SIZE", "2000"))
+
+    # Prometheus metrics middleware and GET /metrics; set PROMETHEUS_MULTIPROC_DIR with several workers
+    metrics_enabled: bool = os.getenv("METRICS_ENABLED", "true").lower() in ("1", "true", "yes")
+
+    # Change events on GET /events and /events/ws: "memory" (single process) or
+    # "postgres" (LISTEN/NOTIFY fan-out across workers); per-client backlog
+    # before a resync, keepalive interval for idle streams, and how long a
+    # stream ticket from POST /events/ticket can be used to connect
+    events_broker: str = os.getenv("EVENTS_BROKER", "memory")
+    events_queue_size: int = int(os.getenv("EVENTS_QUEUE_SIZE", "1000"))
+    events_heartbeat_seconds: float = float(os.getenv("EVENTS_HEARTBEAT_SECONDS", "15"))
+    events_ticket_ttl_seconds: int = int(os.getenv("EVENTS_TICKET_TTL_SECONDS", "30"))
+
+    # Worker processes serving the app (uvicorn --workers / gunicorn.conf.py)
+    web_concurrency: int = int(os.getenv("WEB_CONCURRENCY", "1"))
+
+    # Query profiler: log statements slower than this (0 disables), flag requests
+    # repeating one statement more than N times (0 disables), and optionally
+    # report per-request DB time in a Server-Timing response header
+    slow_query_ms: float = float(os.getenv("SLOW_QUERY_MS", "200"))
+    n_plus_one_threshold: int = int(os.getenv("N_PLUS_ONE_THRESHOLD", "10"))
+    query_timing_header: bool = os.getenv("QUERY_TIMING_HEADER", "false").lower() in ("1", "true", "yes")
+
+    # Background rebuild of drifted project_stats counters (0 disables)
+    stats_reconcile_interval_seconds: int = int(os.getenv("STATS_RECONCILE_INTERVAL_SECONDS", "900"))
+
+    # Projects with more tasks than this are deleted in the background (202);
+    # the purge worker deletes their tasks in batches every interval (0 disables it),
+    # and GET /projects/{id}/purge reports "done" for this many days afterwards
+    project_purge_threshold: int = int(os.getenv("PROJECT_PURGE_THRESHOLD", "5000"))
+    project_purge_batch_size: int = int(os.getenv("PROJECT_PURGE_BATCH_SIZE", "5000"))
+    project_purge_interval_seconds: float = float(os.getenv("PROJECT_PURGE_INTERVAL_SECONDS", "5"))
+    project_purge_record_days: float = float(os.getenv("PROJECT_PURGE_RECORD_DAYS", "7"))
+
+    # Deleted-task tombstones kept for GET /tasks/changes (0 keeps them forever);
+    # sync tokens older than this get 410 and must resync
+    task_tombstone_retention_days: float = float(os.getenv("TASK_TOMBSTONE_RETENTION_DAYS", "30"))
+
+    # List totals: exact | estimated | cached | none
+    default_total_mode: str = os.getenv("DEFAULT_TOTAL_MODE", "exact")
+    estimated_count_exact_below: int = int(os.getenv("ESTIMATED_COUNT_EXACT_BELOW", "1000"))
+    count_cache_ttl_seconds: int = int(os.getenv("COUNT_CACHE_TTL_SECONDS", "60"))
+    count_cache_max_entries: int = int(os.getenv("COUNT_CACHE_MAX_ENTRIES", "10000"))
+
+    # Per-tenant cache of serialized list responses (ETag / 304)
+    response_cache_ttl_seconds: int = int(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "30"))
+    response_cache_max_entries: int = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "5000"))
+    response_cache_max_bytes: int = int(os.getenv("RESPONSE_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
 
 @lru_cache
 def get_settings() -> Settings:
@@ -0,0 +1,196 @@
+"""Delta sync over the per-tenant task change sequence.
+
+Triggers (migration 0007) stamp each inserted or changed task with the
+tenant's next ``change_seq`` and record deletes in ``task_tombstone``.
+A sync token is an opaque position ``(seq, deleted, id)`` in the combined
+stream of upserts and deletions ordered by that key, so a page may end in
+the middle of a large transaction and the next one resumes right after it.
+
+A token without a position (first sync) lists every current task. Its
+tombstone floor is the tenant's sequence when that sync started, so it
+skips deletes of tasks the client never received.
+
+Tombstones older than ``TASK_TOMBSTONE_RETENTION_DAYS`` are pruned by
+:func:`run_tombstone_pruner`. Tokens from before the pruned sequence are
+rejected with :class:`SyncTokenExpired`; the client must start over.
+"""
+
+import asyncio
+import base64
+import json
+import logging
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import CompoundSelect, func, literal, null, select, tuple_, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .locks import PRUNE_LOCK_KEY, exclusive_run
+from .models import Task, TaskTombstone, TenantChangeSeq
+from .purge import visible_tasks
+
+logger = logging.getLogger(__name__)
+
+PRUNE_BATCH_SIZE = 10_000
+
+
+class SyncTokenExpired(Exception):
+    """The token predates pruned tombstones, so deletions could be missed."""
+
+
+@dataclass(frozen=True)
+class SyncPosition:
+    """Position after the last change a client has received.
+
+    ``floor`` is the tombstone sequence below which deletions are skipped
+    (set for a first sync). ``seq`` is None until the first page returns.
+    """
+    floor: int = 0
+    seq: Optional[int] = None
+    deleted: bool = False
+    row_id: Optional[uuid.UUID] = None
+
+
+def encode_sync_token(position: SyncPosition) -> str:
+    data = {"f": position.floor}
+    if position.seq is not None:
+        data.update(q=position.seq, d=position.deleted, id=str(position.row_id))
+    raw = json.dumps(data, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_sync_token(token: str) -> SyncPosition:
+    """Decode a token from :func:`encode_sync_token`; ``ValueError`` when malformed."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if "q" not in data:
+            return SyncPosition(floor=int(data["f"]))
+        return SyncPosition(int(data["f"]), int(data["q"]), bool(data["d"]), uuid.UUID(data["id"]))
+    except (KeyError, TypeError, AttributeError, json.JSONDecodeError) as exc:
+        raise ValueError("Malformed sync token") from exc
+
+
+def changes_query(tenant_id: uuid.UUID, position: SyncPosition, limit: int) -> CompoundSelect:
+    """Upserts and deletions after ``position`` in ``(seq, deleted, id)`` order.
+
+    Each branch is limited on its own index first, so a page reads at most
+    ``limit`` rows from each side. Tasks of projects being purged are not
+    upserts; their tombstones arrive as the purger deletes them.
+    """
+    upserts = select(
+        Task.change_seq.label("seq"),
+        literal(False).label("deleted"),
+        Task.id,
+        Task.project_id,
+        Task.title,
+        Task.status,
+        Task.assignee,
+        Task.priority,
+        Task.due_date,
+        Task.updated_at,
+    ).where(*visible_tasks(tenant_id))
+    deletions = select(
+        TaskTombstone.change_seq,
+        literal(True),
+        TaskTombstone.task_id,
+        TaskTombstone.project_id,
+        null(),
+        null(),
+        null(),
+        null(),
+        null(),
+        TaskTombstone.deleted_at,
+    ).where(TaskTombstone.tenant_id == tenant_id, TaskTombstone.change_seq > position.floor)
+
+    if position.seq is not None:
+        after = tuple_(literal(position.seq, Task.change_seq.type), literal(position.row_id, Task.id.type))
+        if position.deleted:
+            upserts = upserts.where(Task.change_seq > position.seq)
+            deletions = deletions.where(
+                tuple_(TaskTombstone.change_seq, TaskTombstone.task_id) > after
+            )
+        else:
+            upserts = upserts.where(tuple_(Task.change_seq, Task.id) > after)
+            deletions = deletions.where(TaskTombstone.change_seq >= position.seq)
+
+    upserts = upserts.order_by(Task.change_seq, Task.id).limit(limit)
+    deletions = deletions.order_by(TaskTombstone.change_seq, TaskTombstone.task_id).limit(limit)
+    return union_all(upserts, deletions).order_by("seq", "deleted", "id").limit(limit)
+
+
+async def start_position(session: AsyncSession, tenant_id: uuid.UUID) -> SyncPosition:
+    """Position for a first sync: every task, and only deletes from now on."""
+    head = (
+        await session.execute(select(TenantChangeSeq.last_seq).where(TenantChangeSeq.tenant_id == tenant_id))
+    ).scalar_one_or_none()
+    return SyncPosition(floor=head or 0)
+
+
+async def check_not_pruned(session: AsyncSession, tenant_id: uuid.UUID, position: SyncPosition) -> None:
+    """Raise :class:`SyncTokenExpired` when tombstones after ``position`` were pruned."""
+    pruned = (
+        await session.execute(select(TenantChangeSeq.pruned_seq).where(TenantChangeSeq.tenant_id == tenant_id))
+    ).scalar_one_or_none()
+    if pruned and pruned > max(position.floor, position.seq or 0):
+        raise SyncTokenExpired()
+
+
+def prune_statement(cutoff: datetime, batch_size: int):
+    """Delete one batch of old tombstones and advance each tenant's ``pruned_seq``."""
+    batch = (
+        select(TaskTombstone.task_id)
+        .where(TaskTombstone.deleted_at < cutoff)
+        .limit(batch_size)
+        .scalar_subquery()
+    )
+    gone = (
+        TaskTombstone.__table__.delete()
+        .where(TaskTombstone.task_id.in_(batch))
+        .returning(TaskTombstone.tenant_id, TaskTombstone.change_seq)
+        .cte("gone")
+    )
+    highest = (
+        select(gone.c.tenant_id, func.max(gone.c.change_seq).label("max_seq"), func.count().label("n"))
+        .group_by(gone.c.tenant_id)
+        .subquery()
+    )
+    bump = (
+        TenantChangeSeq.__table__.update()
+        .where(TenantChangeSeq.tenant_id == highest.c.tenant_id)
+        .values(pruned_seq=func.greatest(TenantChangeSeq.pruned_seq, highest.c.max_seq))
+        .returning(highest.c.n)
+    )
+    return bump.add_cte(gone)
+
+
+async def prune_tombstones(session_factory, retention: timedelta, batch_size: int = PRUNE_BATCH_SIZE) -> int:
+    """Delete tombstones older than ``retention`` in short batches; returns rows deleted.
+
+    Only one worker prunes at a time; the others return 0 at once.
+    """
+    cutoff = datetime.utcnow() - retention
+    deleted = 0
+    async with exclusive_run(session_factory, PRUNE_LOCK_KEY) as leader:
+        while leader:
+            async with session_factory() as session:
+                counts = (await session.execute(prune_statement(cutoff, batch_size))).scalars().all()
+                await session.commit()
+            deleted += sum(counts)
+            if sum(counts) < batch_size:
+                break
+    return deleted
+
+
+async def run_tombstone_pruner(session_factory, retention_days: float, interval_seconds: float = 3600) -> None:
+    """Prune forever, every ``interval_seconds``; meant to run as a background task."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            pruned = await prune_tombstones(session_factory, timedelta(days=retention_days))
+            if pruned:
+                logger.info("pruned %d task tombstones", pruned)
+        except Exception:
+            logger.exception("task tombstone pruning failed")
@@ -0,0 +1,78 @@
+"""Strategies for computing the ``total`` of a paginated list query.
+
+``exact``      runs ``count(*)`` over the filtered query (the original behaviour).
+``estimated``  reads the planner's row estimate from ``EXPLAIN``; small results,
+               where the estimate is least reliable and counting is cheap, are
+               counted exactly instead.
+``cached``     serves exact counts from a per-tenant, per-filter cache that any
+               write to the tenant invalidates.
+``none``       skips counting; clients rely on ``has_more``.
+"""
+
+import json
+import uuid
+from enum import Enum
+from typing import Hashable, Optional
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..cache import TTLCache, tenant_versions
+from ..config import get_settings
+
+settings = get_settings()
+count_cache = TTLCache(settings.count_cache_max_entries, settings.count_cache_ttl_seconds)
+
+
+class TotalMode(str, Enum):
+    """How a list endpoint computes ``total``."""
+    exact = "exact"
+    estimated = "estimated"
+    cached = "cached"
+    none = "none"
+
+
+async def _exact_count(session: AsyncSession, query: Select) -> int:
+    count_q = select(func.count()).select_from(query.order_by(None).subquery())
+    return (await session.execute(count_q)).scalar_one()
+
+
+async def _estimated_count(session: AsyncSession, query: Select) -> int:
+    conn = await session.connection()
+    compiled = query.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True})
+    result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}")
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    estimate = int(plan[0]["Plan"]["Plan Rows"])
+    if estimate < settings.estimated_count_exact_below:
+        return await _exact_count(session, query)
+    return estimate
+
+
+async def count_total(
+    session: AsyncSession,
+    query: Select,
+    mode: TotalMode,
+    tenant_id: uuid.UUID,
+    cache_key: Hashable,
+) -> Optional[int]:
+    """Return the total row count of ``query`` using the given strategy.
+
+    ``cache_key`` identifies the query's filters within the tenant and is
+    only used by the ``cached`` strategy.
+    """
+    if mode is TotalMode.none:
+        return None
+    if mode is TotalMode.estimated:
+        return await _estimated_count(session, query)
+    if mode is TotalMode.cached:
+        # Read the version before counting so a concurrent write leaves the
+        # result under a version that is already stale.
+        key = (tenant_id, tenant_versions.get(tenant_id), cache_key)
+        total = count_cache.get(key)
+        if total is None:
+            total = await _exact_count(session, query)
+            count_cache.set(key, total)
+        return total
+    return await _exact_count(session, query)
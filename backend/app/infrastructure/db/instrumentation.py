@@ -0,0 +1,100 @@
+"""Engine and pool instrumentation feeding the Prometheus metrics.
+
+:class:`TimedAsyncAdaptedQueuePool` times every checkout, keeps the
+checked-out/overflow gauges current and estimates the wait a new checkout
+would see (used by admission control to shed load early); :func:`instrument_engine` hooks cursor
+execution to count statements and DB time per request and feed the query
+profiler. Both only do a couple of clock reads and counter updates per call.
+"""
+
+import time
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from ..metrics import (
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_OVERFLOW,
+    DB_POOL_TIMEOUTS,
+    DB_POOL_WAIT_SECONDS,
+)
+from .profiling import observe_query
+
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records checkout wait and occupancy.
+
+    The pool is labelled by ``pool_logging_name`` (``primary`` when unset).
+    """
+
+    # Weight of the newest checkout in the wait moving average.
+    wait_ewma_alpha = 0.2
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.wait_ewma = 0.0
+        self._waiting: list[float] = []
+
+    def estimated_wait(self) -> float:
+        """Seconds a checkout started now is expected to wait.
+
+        Zero while the pool has spare capacity; once it is exhausted, the
+        larger of the recent average wait and the age of the oldest checkout
+        still waiting, so a stalled pool is noticed before anyone times out.
+        """
+        if self._max_overflow < 0 or self.checkedout() < self.size() + self._max_overflow:
+            return 0.0
+        oldest = time.perf_counter() - self._waiting[0] if self._waiting else 0.0
+        return max(self.wait_ewma, oldest)
+
+    @property
+    def metrics_name(self) -> str:
+        return self._orig_logging_name or "primary"
+
+    def _update_gauges(self) -> None:
+        name = self.metrics_name
+        DB_POOL_CHECKED_OUT.labels(name).set(self.checkedout())
+        DB_POOL_OVERFLOW.labels(name).set(max(self.overflow(), 0))
+
+    def _observe_wait(self, seconds: float) -> None:
+        DB_POOL_WAIT_SECONDS.labels(self.metrics_name).observe(seconds)
+        self.wait_ewma += self.wait_ewma_alpha * (seconds - self.wait_ewma)
+
+    def _do_get(self):
+        started = time.perf_counter()
+        self._waiting.append(started)
+        try:
+            record = super()._do_get()
+        except exc.TimeoutError:
+            DB_POOL_TIMEOUTS.labels(self.metrics_name).inc()
+            self._observe_wait(time.perf_counter() - started)
+            raise
+        finally:
+            self._waiting.remove(started)
+        self._observe_wait(time.perf_counter() - started)
+        self._update_gauges()
+        return record
+
+    def _do_return_conn(self, record) -> None:
+        super()._do_return_conn(record)
+        self._update_gauges()
+
+
+def instrument_engine(engine) -> None:
+    """Count and profile statements and their execution time against the current request."""
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _start_timer(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _stop_timer(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_started"].pop()
+        observe_query(statement, time.perf_counter() - started)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _drop_timer(context):
+        # Failed statements never reach after_cursor_execute.
+        if context.connection is not None and context.connection.info.get("query_started"):
+            context.connection.info["query_started"].pop()
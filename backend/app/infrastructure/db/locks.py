@@ -0,0 +1,35 @@
+"""Cluster-wide single runner for periodic maintenance jobs.
+
+Every worker runs the same background loops, but a sweep over all tenants
+only needs to run once per interval. :func:`exclusive_run` holds a
+session-level advisory lock for the whole sweep, on a connection kept in
+autocommit mode so it is never left idle in a transaction; workers that
+do not get the lock skip that run.
+"""
+
+import contextlib
+from typing import AsyncIterator
+
+from sqlalchemy import func, select
+
+# Arbitrary but fixed advisory lock keys, one per job.
+RECONCILE_LOCK_KEY = 0x5EC0_0011
+PRUNE_LOCK_KEY = 0x5EC0_0020
+
+
+@contextlib.asynccontextmanager
+async def exclusive_run(session_factory, key: int) -> AsyncIterator[bool]:
+    """Yield True while this process holds lock ``key``; False when another one does."""
+    async with session_factory() as session:
+        connection = await session.connection(execution_options={"isolation_level": "AUTOCOMMIT"})
+        locked = (await connection.execute(select(func.pg_try_advisory_lock(key)))).scalar_one()
+        try:
+            yield locked
+        finally:
+            if locked:
+                try:
+                    await connection.execute(select(func.pg_advisory_unlock(key)))
+                except BaseException:
+                    # The lock lives as long as the connection; never return it to the pool held.
+                    await connection.invalidate()
+                    raise
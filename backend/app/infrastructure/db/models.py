@@ -2,11 +2,14 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import String, DateTime, ForeignKey, Boolean, Text, Index
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import (
+    BigInteger, String, DateTime, ForeignKey, Boolean, Integer, Text, Index, Computed, PrimaryKeyConstraint,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
+from .types import PriorityOrdinal
 
 
 class Tenant(Base):
@@ -20,8 +23,9 @@ class Tenant(Base):
     domain: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, unique=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
 
-    users: Mapped[list["User"]] = relationship(back_populates="tenant")
-    projects: Mapped[list["Project"]] = relationship(back_populates="tenant")
+    # Children go via ON DELETE CASCADE; passive_deletes keeps the ORM from loading them first.
+    users: Mapped[list["User"]] = relationship(back_populates="tenant", passive_deletes=True)
+    projects: Mapped[list["Project"]] = relationship(back_populates="tenant", passive_deletes=True)
 
 
 class User(Base):
@@ -43,30 +47,156 @@ class Project(Base):
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    tenant_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("tenant.id", ondelete="CASCADE"), nullable=False, index=True)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("tenant.id", ondelete="CASCADE"), nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    # Set when a large project is queued for background purge (migration 0008);
+    # such projects are hidden from every read.
+    deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    # Generated by PostgreSQL; deferred so entity loads never fetch it.
+    search_vector: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+            "setweight(to_tsvector('simple', coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
 
     tenant: Mapped[Tenant] = relationship(back_populates="projects")
-    tasks: Mapped[list["Task"]] = relationship(back_populates="project", cascade="all, delete-orphan")
+    # Tasks are removed by ON DELETE CASCADE in the database, never loaded and
+    # deleted row by row by the ORM.
+    tasks: Mapped[list["Task"]] = relationship(
+        back_populates="project", cascade="all, delete-orphan", passive_deletes=True
+    )
 
 
 class Task(Base):
-    """Task entry under a project, scoped by tenant for isolation."""
+    """Task entry under a project, scoped by tenant for isolation.
+
+    Hash-partitioned on ``tenant_id`` (migration 0009), which is therefore
+    part of the primary key. Queries filtered on one tenant read a single
+    partition; partitions themselves are created by the migration.
+    """
+
+    __table_args__ = (
+        PrimaryKeyConstraint("tenant_id", "id", name="task_pkey"),
+        {"postgresql_partition_by": "HASH (tenant_id)"},
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     status: Mapped[str] = mapped_column(String(50), default="todo", nullable=False)
     assignee: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
-    priority: Mapped[str] = mapped_column(String(20), default="medium", nullable=False)
+    priority: Mapped[str] = mapped_column(PriorityOrdinal, default="medium", server_default="2", nullable=False)
     due_date: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     project_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("project.id", ondelete="CASCADE"), nullable=False, index=True)
-    tenant_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("tenant.id", ondelete="CASCADE"), nullable=False, index=True)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("tenant.id", ondelete="CASCADE"), primary_key=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    # Stamped by a trigger on every insert and content change (migration 0007).
+    change_seq: Mapped[int] = mapped_column(BigInteger, server_default="0", nullable=False)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    search_vector: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR, Computed("to_tsvector('simple', coalesce(title, ''))", persisted=True), deferred=True
+    )
 
     project: Mapped[Project] = relationship(back_populates="tasks")
 
 
+class ProjectStats(Base):
+    """Per-project task counters by status and priority.
+
+    Maintained by statement-level triggers on task (migration 0005), so
+    rows change in the same transaction as the task writes they count.
+    """
+
+    __tablename__ = "project_stats"
+
+    project_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("project.id", ondelete="CASCADE"), primary_key=True)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("tenant.id", ondelete="CASCADE"), nullable=False)
+    total: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    todo: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    in_progress: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    done: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    low: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    medium: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    high: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+
+class ProjectPurge(Base):
+    """Record of a finished background project purge, kept for its status URL.
+
+    Written in the transaction that removes the project row; rows older than
+    ``PROJECT_PURGE_RECORD_DAYS`` are pruned by the purge worker.
+    """
+
+    __tablename__ = "project_purge"
+
+    # No foreign key: the project row is gone by the time this is written.
+    project_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("tenant.id", ondelete="CASCADE"), nullable=False)
+    purged_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+
+
+class TenantChangeSeq(Base):
+    """Last change sequence handed out per tenant, and the oldest still syncable."""
+
+    __tablename__ = "tenant_change_seq"
+
+    tenant_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("tenant.id", ondelete="CASCADE"), primary_key=True)
+    last_seq: Mapped[int] = mapped_column(BigInteger, server_default="0", nullable=False)
+    # Tombstones at or below this sequence have been pruned.
+    pruned_seq: Mapped[int] = mapped_column(BigInteger, server_default="0", nullable=False)
+
+
+class TaskTombstone(Base):
+    """Record of a deleted task, written by a trigger so delta sync can report deletes."""
+
+    __tablename__ = "task_tombstone"
+
+    task_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("tenant.id", ondelete="CASCADE"), nullable=False)
+    project_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    change_seq: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    deleted_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+Index("ix_project_tenant_created", Project.tenant_id, Project.created_at, Project.id)
+Index("ix_project_purging", Project.tenant_id, Project.id, postgresql_where=Project.deleted_at.isnot(None))
+# Search indexes (migration 0006); GIN over tenant_id needs btree_gin, trigram ops need pg_trgm.
+Index("ix_project_tenant_search", Project.tenant_id, Project.search_vector, postgresql_using="gin")
+Index(
+    "ix_project_tenant_name_trgm", Project.tenant_id, Project.name,
+    postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"},
+)
+
+# Tenant-leading indexes matching the list_tasks filter/sort shapes; see
+# migration 0003 and scripts/explain_task_indexes.py.
 Index("ix_task_project_tenant", Task.project_id, Task.tenant_id)
-Index("ix_task_status", Task.status)
-Index("ix_task_priority", Task.priority)
-Index("ix_task_due_date", Task.due_date)
+Index("ix_task_tenant_created", Task.tenant_id, Task.created_at, Task.id)
+Index("ix_task_tenant_project_created", Task.tenant_id, Task.project_id, Task.created_at, Task.id)
+Index("ix_task_tenant_status_created", Task.tenant_id, Task.status, Task.created_at, Task.id)
+Index("ix_task_tenant_project_status_created", Task.tenant_id, Task.project_id, Task.status, Task.created_at, Task.id)
+Index("ix_task_tenant_priority", Task.tenant_id, Task.priority, Task.id)
+Index("ix_task_tenant_project_priority", Task.tenant_id, Task.project_id, Task.priority, Task.id)
+Index("ix_task_tenant_due", Task.tenant_id, Task.due_date, Task.id, postgresql_where=Task.due_date.isnot(None))
+Index(
+    "ix_task_tenant_project_due",
+    Task.tenant_id, Task.project_id, Task.due_date, Task.id,
+    postgresql_where=Task.due_date.isnot(None),
+)
+
+Index("ix_task_tenant_search", Task.tenant_id, Task.search_vector, postgresql_using="gin")
+Index(
+    "ix_task_tenant_title_trgm", Task.tenant_id, Task.title,
+    postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"},
+)
+
+Index("ix_project_stats_tenant", ProjectStats.tenant_id, ProjectStats.project_id)
+
+# Delta sync (migration 0007).
+Index("ix_task_tenant_change_seq", Task.tenant_id, Task.change_seq, Task.id)
+Index("ix_task_tombstone_tenant_seq", TaskTombstone.tenant_id, TaskTombstone.change_seq, TaskTombstone.task_id)
+Index("ix_task_tombstone_deleted_at", TaskTombstone.deleted_at)
@@ -0,0 +1,82 @@
+"""Per-project task counts and newest tasks, joined onto a project page.
+
+Counts come from the trigger-maintained ``project_stats`` counters (see
+``stats.py``), so they cost one primary-key join per project instead of an
+aggregate over its tasks. The newest tasks come from a ``LATERAL`` subquery
+per project that reads ``ix_task_tenant_project_created`` backwards and
+stops after ``limit`` rows, aggregated into one JSON array. Both are added
+to the page query itself, so a project overview is a single statement.
+"""
+
+import uuid
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import JSON, Select, func, select, true
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+
+from ...domain.entities import PRIORITY_NAMES, TaskCounts, TaskEntity
+from .models import Project, ProjectStats, Task
+from .stats import STATUS_COUNTERS
+
+TASK_COUNT_FIELDS = ("total",) + STATUS_COUNTERS
+RECENT_TASK_COLUMNS = (
+    Task.id, Task.title, Task.status, Task.assignee, Task.priority, Task.due_date, Task.project_id, Task.created_at,
+)
+
+
+def recent_tasks_lateral(tenant_id: uuid.UUID, limit: int):
+    """``LATERAL`` subquery with a ``recent_tasks`` JSON array for the outer project row.
+
+    The bound tenant_id (rather than a correlation) lets the planner prune
+    task to the tenant's partition at plan time.
+    """
+    newest = (
+        select(*RECENT_TASK_COLUMNS)
+        .where(Task.tenant_id == tenant_id, Task.project_id == Project.id)
+        .order_by(Task.created_at.desc(), Task.id.desc())
+        .limit(limit)
+        .correlate(Project)
+        .subquery("newest")
+    )
+    row = newest.table_valued()
+    items = func.json_agg(aggregate_order_by(row, newest.c.created_at.desc(), newest.c.id.desc()), type_=JSON)
+    return select(items.label("recent_tasks")).select_from(newest).lateral("recent")
+
+
+def with_project_overview(query: Select, tenant_id: uuid.UUID, task_counts: bool, recent_tasks: int) -> Select:
+    """Add counter columns and/or the newest ``recent_tasks`` tasks to a project query."""
+    if task_counts:
+        query = query.outerjoin(ProjectStats, ProjectStats.project_id == Project.id).add_columns(
+            *[func.coalesce(getattr(ProjectStats, name), 0).label(f"tasks_{name}") for name in TASK_COUNT_FIELDS]
+        )
+    if recent_tasks:
+        recent = recent_tasks_lateral(tenant_id, recent_tasks)
+        query = query.join(recent, true()).add_columns(recent.c.recent_tasks)
+    return query
+
+
+def task_counts_from_row(row) -> TaskCounts:
+    return TaskCounts(**{name: getattr(row, f"tasks_{name}") for name in TASK_COUNT_FIELDS})
+
+
+def _timestamp(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value is not None else None
+
+
+def recent_tasks_from_json(items: Optional[list[dict[str, Any]]], tenant_id: uuid.UUID) -> list[TaskEntity]:
+    """Entities from a ``recent_tasks`` array; priorities arrive as stored ordinals."""
+    return [
+        TaskEntity(
+            id=uuid.UUID(item["id"]),
+            tenant_id=tenant_id,
+            project_id=uuid.UUID(item["project_id"]),
+            title=item["title"],
+            status=item["status"],
+            assignee=item["assignee"],
+            created_at=_timestamp(item["created_at"]),
+            priority=PRIORITY_NAMES[item["priority"]],
+            due_date=_timestamp(item["due_date"]),
+        )
+        for item in items or ()
+    ]
@@ -0,0 +1,93 @@
+"""Keyset (cursor) pagination helpers.
+
+A cursor is an opaque token holding the active sort, the sort value of the
+last row returned and that row's id. The next page seeks straight past that
+row in the index instead of reading and discarding ``offset`` rows.
+"""
+
+import base64
+import json
+import uuid
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import and_, literal, or_, tuple_
+from sqlalchemy.sql.elements import ColumnElement
+
+
+def _dump_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    return value
+
+
+def _load_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        return datetime.fromisoformat(value["dt"])
+    return value
+
+
+def encode_cursor(sort: str, value: Any, row_id: uuid.UUID) -> str:
+    """Encode the position after a row into an opaque, URL-safe cursor."""
+    raw = json.dumps({"s": sort, "v": _dump_value(value), "id": str(row_id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str) -> tuple[Any, uuid.UUID]:
+    """Decode a cursor produced by :func:`encode_cursor` for the given sort.
+
+    Raises ``ValueError`` when the token is malformed or was issued for a
+    different sort order than the one requested.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if data["s"] != sort:
+            raise ValueError("Cursor does not match the requested sort")
+        return _load_value(data["v"]), uuid.UUID(data["id"])
+    except (KeyError, TypeError, AttributeError, json.JSONDecodeError) as exc:
+        raise ValueError("Malformed cursor") from exc
+
+
+def keyset_order(column, id_column, desc: bool) -> tuple:
+    """ORDER BY clause for a keyset page: the sort column, then id as tie-breaker."""
+    if desc:
+        return column.desc(), id_column.desc()
+    return column.asc(), id_column.asc()
+
+
+def keyset_after(
+    column, id_column, value: Any, row_id: uuid.UUID, desc: bool, nullable: bool = False
+) -> ColumnElement:
+    """Predicate selecting rows strictly after ``(value, row_id)`` in keyset order.
+
+    Follows PostgreSQL's default NULL placement (last when ascending, first
+    when descending) so that nullable sort columns page consistently with
+    :func:`keyset_order`. Non-null positions use a row comparison, which
+    PostgreSQL turns into a single index range condition.
+    """
+    if value is None:
+        if desc:
+            return or_(and_(column.is_(None), id_column < row_id), column.is_not(None))
+        return and_(column.is_(None), id_column > row_id)
+
+    # Bind with the columns' types so custom types (e.g. priority ordinals) convert.
+    position = tuple_(literal(value, column.type), literal(row_id, id_column.type))
+    if desc:
+        return tuple_(column, id_column) < position
+    after = tuple_(column, id_column) > position
+    if nullable:
+        return or_(after, column.is_(None))
+    return after
+
+
+def next_cursor(rows: list, limit: int, sort: str, key: str) -> tuple[list, Optional[str]]:
+    """Trim a ``limit + 1`` fetch to the page and build the cursor for the next one.
+
+    Returns the page rows and the cursor, which is ``None`` on the last page.
+    """
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    last = page[-1]
+    return page, encode_cursor(sort, getattr(last, key), last.id)
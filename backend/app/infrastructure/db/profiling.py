@@ -0,0 +1,105 @@
+"""Per-request query profiling: fingerprints, slow-query log and N+1 detection.
+
+Every statement seen by the engine cursor hooks is reduced to a fingerprint
+(whitespace collapsed, literals replaced by ``?``, bind-parameter lists
+folded) so ``WHERE id = 1`` and ``WHERE id = 2``, or ``IN`` lists of any
+length, count as the same query. Normalization is cached per distinct
+statement text, so the steady-state cost is a dict lookup per execution.
+
+- Statements slower than ``SLOW_QUERY_MS`` are logged with their route.
+- When a request finishes, fingerprints executed more than
+  ``N_PLUS_ONE_THRESHOLD`` times are logged and counted as a likely N+1.
+
+:func:`max_queries` is the test-side helper for pinning an endpoint's query
+budget.
+"""
+
+import hashlib
+import logging
+import re
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Callable, Iterator
+
+from ..config import get_settings
+from ..metrics import DB_REPEATED_QUERY_REQUESTS, QueryProfile, RequestStats, record_query, request_stats
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+_WHITESPACE = re.compile(r"\s+")
+_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_PARAM = r"(?:\$?\?|%\(\w+\)s|%s|:\w+)"
+_PARAM_LIST = re.compile(rf"\(\s*{_PARAM}(?:\s*,\s*{_PARAM})+\s*\)")
+
+_observers: list[Callable[[RequestStats], None]] = []
+
+
+@lru_cache(maxsize=4096)
+def fingerprint(statement: str) -> tuple[str, str]:
+    """Return ``(key, normalized_sql)`` for a statement; the key is a short hash."""
+    normalized = _WHITESPACE.sub(" ", statement).strip()
+    normalized = _LITERAL.sub("?", normalized)
+    normalized = _PARAM_LIST.sub("(...)", normalized)
+    return hashlib.sha1(normalized.encode()).hexdigest()[:12], normalized
+
+
+def observe_query(statement: str, seconds: float) -> None:
+    """Record one executed statement and log it when it is slow."""
+    key, normalized = fingerprint(statement)
+    stats = record_query(seconds, key, normalized)
+    if settings.slow_query_ms > 0 and seconds * 1000 >= settings.slow_query_ms:
+        route = stats.route if stats is not None else "background"
+        logger.warning("slow query %.1fms on %s [%s]: %s", seconds * 1000, route, key, normalized)
+
+
+def repeated_queries(stats: RequestStats) -> dict[str, QueryProfile]:
+    """Fingerprints the request executed more than ``N_PLUS_ONE_THRESHOLD`` times."""
+    threshold = settings.n_plus_one_threshold
+    if threshold <= 0:
+        return {}
+    return {key: profile for key, profile in stats.fingerprints.items() if profile.count > threshold}
+
+
+def finish_request(stats: RequestStats) -> None:
+    """Flag likely N+1 patterns once a request is done and hand the stats to observers."""
+    repeated = repeated_queries(stats)
+    if repeated:
+        route = stats.route
+        DB_REPEATED_QUERY_REQUESTS.labels(route).inc()
+        for key, profile in repeated.items():
+            logger.warning(
+                "possible N+1 on %s: [%s] ran %d times (%.1fms): %s",
+                route, key, profile.count, profile.seconds * 1000, profile.statement,
+            )
+    for observer in _observers:
+        observer(stats)
+
+
+@contextmanager
+def max_queries(limit: int) -> Iterator[list[RequestStats]]:
+    """Fail with ``AssertionError`` if code in the block runs more than ``limit`` statements.
+
+    Counts each HTTP request served through the metrics middleware inside the
+    block (e.g. via ``TestClient``) separately, plus any statements executed
+    directly in the block itself. Yields the list of captured request stats.
+    """
+    captured: list[RequestStats] = []
+    direct = RequestStats()
+    observer = captured.append
+    token = request_stats.set(direct)
+    _observers.append(observer)
+    try:
+        yield captured
+    finally:
+        _observers.remove(observer)
+        request_stats.reset(token)
+
+    for stats in captured + ([direct] if direct.queries else []):
+        if stats.queries > limit:
+            breakdown = "\n".join(
+                f"  {profile.count}x {profile.statement}"
+                for profile in sorted(stats.fingerprints.values(), key=lambda p: -p.count)
+            )
+            where = stats.route if stats.scope is not None else "block"
+            raise AssertionError(f"{where} ran {stats.queries} queries, expected at most {limit}:\n{breakdown}")
@@ -0,0 +1,144 @@
+"""Background purge of large deleted projects.
+
+Deleting a project cascades to its tasks in the database. For a project
+with more than ``PROJECT_PURGE_THRESHOLD`` tasks that single statement can
+run for minutes, so the API only stamps ``project.deleted_at`` and answers
+``202``. From then on the project and its tasks are hidden from reads and
+writes by id (:func:`visible_tasks`), and
+:func:`run_project_purger` deletes the tasks in batches of
+``PROJECT_PURGE_BATCH_SIZE``, one short transaction each, before removing
+the project row itself. That last transaction records the purge in
+``project_purge``, so the status URL reports ``done`` for
+``PROJECT_PURGE_RECORD_DAYS`` and 404 for ids it never knew.
+
+Each batch locks the project row with ``SKIP LOCKED``, so several workers
+can run the purger without deleting the same rows twice.
+"""
+
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import Select, delete, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .models import Project, ProjectPurge, ProjectStats, Task
+
+logger = logging.getLogger(__name__)
+
+
+def purging_project_ids(tenant_id: uuid.UUID) -> Select:
+    """Ids of the tenant's projects waiting to be purged (partial index ``ix_project_purging``)."""
+    return select(Project.id).where(Project.tenant_id == tenant_id, Project.deleted_at.isnot(None))
+
+
+def visible_tasks(tenant_id: uuid.UUID) -> tuple:
+    """``WHERE`` predicates for the tenant's tasks outside projects being purged.
+
+    Every task read and write by id applies them, so a purging project's
+    tasks are gone from the API as soon as the project is marked.
+    """
+    return Task.tenant_id == tenant_id, Task.project_id.not_in(purging_project_ids(tenant_id))
+
+
+def project_size_query(tenant_id: uuid.UUID, project_id: uuid.UUID) -> Select:
+    """The project's purge marker and task count from the trigger-maintained counters."""
+    return (
+        select(Project.deleted_at, func.coalesce(ProjectStats.total, 0).label("tasks"))
+        .outerjoin(ProjectStats, ProjectStats.project_id == Project.id)
+        .where(Project.id == project_id, Project.tenant_id == tenant_id)
+    )
+
+
+def purge_record_query(tenant_id: uuid.UUID, project_id: uuid.UUID) -> Select:
+    """When the tenant's project finished purging, if that is still on record."""
+    return select(ProjectPurge.purged_at).where(
+        ProjectPurge.project_id == project_id, ProjectPurge.tenant_id == tenant_id
+    )
+
+
+async def mark_for_purge(session: AsyncSession, tenant_id: uuid.UUID, project_id: uuid.UUID) -> None:
+    """Hide the project and queue it for the purge worker; the caller commits."""
+    await session.execute(
+        update(Project)
+        .where(Project.id == project_id, Project.tenant_id == tenant_id, Project.deleted_at.is_(None))
+        .values(deleted_at=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+
+
+def claim_statement() -> Select:
+    """Oldest queued project not being purged by another worker, locked for this batch."""
+    return (
+        select(Project.id, Project.tenant_id)
+        .where(Project.deleted_at.isnot(None))
+        .order_by(Project.deleted_at)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+    )
+
+
+def batch_delete_statement(tenant_id: uuid.UUID, project_id: uuid.UUID, batch_size: int):
+    batch = (
+        select(Task.id)
+        .where(Task.tenant_id == tenant_id, Task.project_id == project_id)
+        .limit(batch_size)
+        .scalar_subquery()
+    )
+    # The outer tenant predicate prunes the DELETE to the tenant's partition; no index leads on id alone.
+    return (
+        delete(Task)
+        .where(Task.tenant_id == tenant_id, Task.id.in_(batch))
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def purge_batch(session_factory, batch_size: int) -> Optional[uuid.UUID]:
+    """Delete one batch of tasks of a queued project; returns its id, or None when idle.
+
+    The project row goes in the same transaction as the batch that comes
+    back short.
+    """
+    async with session_factory() as session:
+        claimed = (await session.execute(claim_statement())).one_or_none()
+        if claimed is None:
+            return None
+        result = await session.execute(batch_delete_statement(claimed.tenant_id, claimed.id, batch_size))
+        finished = result.rowcount < batch_size
+        if finished:
+            await session.execute(
+                delete(Project).where(Project.id == claimed.id).execution_options(synchronize_session=False)
+            )
+            await session.execute(
+                insert(ProjectPurge).values(
+                    project_id=claimed.id, tenant_id=claimed.tenant_id, purged_at=datetime.utcnow()
+                )
+            )
+        await session.commit()
+    if finished:
+        logger.info("purged project %s", claimed.id)
+    return claimed.id
+
+
+async def prune_purge_records(session_factory, retention: timedelta) -> None:
+    """Forget purges finished more than ``retention`` ago; their status URLs then 404."""
+    async with session_factory() as session:
+        await session.execute(delete(ProjectPurge).where(ProjectPurge.purged_at < datetime.utcnow() - retention))
+        await session.commit()
+
+
+async def run_project_purger(
+    session_factory, interval_seconds: float, batch_size: int, record_days: float = 7
+) -> None:
+    """Purge queued projects forever; meant to run as a background task."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            while await purge_batch(session_factory, batch_size) is not None:
+                # Let request handlers run between batches.
+                await asyncio.sleep(0)
+            await prune_purge_records(session_factory, timedelta(days=record_days))
+        except Exception:
+            logger.exception("project purge failed")
@@ -0,0 +1,110 @@
+"""Health and routing state for the optional read replica.
+
+Read-only routes use the replica only while all of these hold:
+
+* ``DATABASE_READ_URL`` is configured;
+* the circuit breaker is closed: a connection failure or disconnect on the
+  replica opens it for ``REPLICA_RETRY_SECONDS``;
+* the replication lag measured by :func:`run_replica_monitor` is at most
+  ``REPLICA_MAX_LAG_SECONDS`` and was measured recently;
+* the tenant has not written in the last ``READ_YOUR_WRITES_SECONDS``
+  (see :func:`pin_to_primary`), so callers read their own writes.
+
+Otherwise reads go to the primary. All state is per worker process.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import uuid
+from typing import Optional
+
+from sqlalchemy import text
+
+from ..cache import TTLCache
+from ..config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Zero while the replica has replayed everything it received, so an idle
+# primary does not read as lag.
+LAG_QUERY = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+
+class ReplicaState:
+    """Circuit breaker plus last measured lag for one replica."""
+
+    def __init__(self, max_lag: float, retry_after: float, probe_ttl: float) -> None:
+        self.max_lag = max_lag
+        self.retry_after = retry_after
+        self.probe_ttl = probe_ttl
+        self.lag: Optional[float] = None
+        self._lag_measured_at = 0.0
+        self._open_until = 0.0
+        self._lock = threading.Lock()
+
+    def usable(self) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            if now < self._open_until:
+                return False
+            if self.lag is None or now - self._lag_measured_at > self.probe_ttl:
+                return False
+            return self.lag <= self.max_lag
+
+    def mark_failed(self) -> None:
+        with self._lock:
+            if time.monotonic() >= self._open_until:
+                logger.warning("read replica unavailable; routing reads to primary for %ss", self.retry_after)
+            self._open_until = time.monotonic() + self.retry_after
+
+    def record_lag(self, lag: float) -> None:
+        with self._lock:
+            if self.lag is not None and self.lag <= self.max_lag < lag:
+                logger.warning("read replica lag %.1fs exceeds %ss; routing reads to primary", lag, self.max_lag)
+            self.lag = lag
+            self._lag_measured_at = time.monotonic()
+
+
+replica = ReplicaState(
+    settings.replica_max_lag_seconds,
+    settings.replica_retry_seconds,
+    # A few missed probes in a row mean the monitor is stuck; stop trusting the last value.
+    probe_ttl=3 * settings.replica_lag_check_seconds,
+)
+
+_primary_pins = TTLCache(100_000, settings.read_your_writes_seconds)
+
+
+def pin_to_primary(tenant_id: uuid.UUID) -> None:
+    """Route the tenant's reads to the primary for ``READ_YOUR_WRITES_SECONDS``."""
+    if settings.read_your_writes_seconds > 0:
+        _primary_pins.set(tenant_id, True)
+
+
+def is_pinned(tenant_id: Optional[uuid.UUID]) -> bool:
+    return tenant_id is not None and _primary_pins.get(tenant_id) is not None
+
+
+async def check_replica_lag(read_engine) -> None:
+    """Measure replication lag once; connection errors open the breaker."""
+    try:
+        async with read_engine.connect() as conn:
+            lag = (await conn.execute(LAG_QUERY)).scalar_one()
+    except Exception:
+        replica.mark_failed()
+        logger.exception("read replica lag check failed")
+        return
+    replica.record_lag(float(lag or 0))
+
+
+async def run_replica_monitor(read_engine, interval_seconds: float) -> None:
+    """Probe replica lag forever; meant to run as a background task."""
+    while True:
+        await check_replica_lag(read_engine)
+        await asyncio.sleep(interval_seconds)
@@ -0,0 +1,52 @@
+"""Text search over generated ``tsvector`` columns with a trigram fallback.
+
+A query matches when every word is a prefix of a word in the document
+(``to_tsquery('simple', 'word:* & ...')`` against the GIN-indexed
+``search_vector``), or when it is close to a word sequence of the title
+(pg_trgm's ``<%`` word similarity, which catches typos). Both indexes lead
+with ``tenant_id`` (btree_gin), so a search only reads the tenant's entries.
+
+Rank is the better of the two scores, so typo matches sort below exact ones.
+"""
+
+import re
+from typing import Optional
+
+from sqlalchemy import Float, func, literal, literal_column, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+SEARCH_CONFIG = "simple"
+
+
+def prefix_tsquery(q: str) -> Optional[str]:
+    """Turn free text into a ``to_tsquery`` string matching every word as a prefix.
+
+    Returns ``None`` when ``q`` has no word characters.
+    """
+    words = re.findall(r"[^\W_]+", q.lower())
+    return " & ".join(f"{word}:*" for word in words) or None
+
+
+def _tsquery(q: str):
+    terms = prefix_tsquery(q)
+    if terms is None:
+        return None
+    return func.to_tsquery(literal_column(f"'{SEARCH_CONFIG}'"), terms)
+
+
+def search_condition(vector, text, q: str) -> ColumnElement:
+    """Rows whose ``vector`` prefix-matches ``q`` or whose ``text`` is similar to it."""
+    fuzzy = literal(q).op("<%")(text)
+    tsquery = _tsquery(q)
+    if tsquery is None:
+        return fuzzy
+    return or_(vector.op("@@")(tsquery), fuzzy)
+
+
+def search_rank(vector, text, q: str) -> ColumnElement:
+    """Relevance score in [0, 1] for rows selected by :func:`search_condition`."""
+    similarity = func.word_similarity(q, text, type_=Float)
+    tsquery = _tsquery(q)
+    if tsquery is None:
+        return similarity
+    return func.greatest(func.ts_rank_cd(vector, tsquery, 32, type_=Float), similarity, type_=Float)
@@ -1,30 +1,168 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+import uuid
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
 
 from ..config import get_settings
+from .instrumentation import TimedAsyncAdaptedQueuePool, instrument_engine
+from .replica import is_pinned, replica
 
 settings = get_settings()
-engine = create_async_engine(
-    settings.database_url_async,
-    echo=False,
-    future=True,
-    pool_size=settings.db_pool_size,
-    max_overflow=settings.db_max_overflow,
-    pool_timeout=settings.db_pool_timeout,
-    pool_recycle=settings.db_pool_recycle,
-)
+
+
+def get_engine() -> AsyncEngine:
+    """The primary engine, created on first use so importing this module opens nothing.
+
+    The app's lifespan calls this at startup and warms the pool (see
+    ``warmup.py``); scripts get it on their first query.
+    """
+    global engine
+    if "engine" not in globals():
+        engine = create_async_engine(
+            settings.database_url_async,
+            echo=False,
+            future=True,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
+            poolclass=TimedAsyncAdaptedQueuePool,
+            pool_logging_name="primary",
+        )
+        instrument_engine(engine)
+    return engine
+
+
+def get_read_engine() -> Optional[AsyncEngine]:
+    """The read replica engine with its own pool, or ``None`` when not configured.
+
+    Created on first use like :func:`get_engine`; see replica.py for routing rules.
+    """
+    global read_engine
+    if "read_engine" not in globals():
+        read_engine = _create_read_engine() if settings.database_url_read else None
+    return read_engine
+
+
+def _create_read_engine() -> AsyncEngine:
+    replica_engine = create_async_engine(
+        settings.database_url_read,
+        echo=False,
+        future=True,
+        pool_size=settings.db_read_pool_size,
+        max_overflow=settings.db_read_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        connect_args={"timeout": settings.replica_connect_timeout_seconds},
+        poolclass=TimedAsyncAdaptedQueuePool,
+        pool_logging_name="replica",
+    )
+    instrument_engine(replica_engine)
+
+    @event.listens_for(replica_engine.sync_engine, "handle_error")
+    def _open_replica_breaker(context) -> None:
+        # No connection yet means connecting failed; otherwise only disconnects
+        # count, so query errors (bad SQL, timeouts) keep the replica in use.
+        if context.connection is None or context.is_disconnect:
+            replica.mark_failed()
+
+    return replica_engine
+
+
+def __getattr__(name: str):
+    # ``session.engine`` / ``session.read_engine`` keep working, created on first access.
+    if name == "engine":
+        return get_engine()
+    if name == "read_engine":
+        return get_read_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+async def dispose_engines() -> None:
+    """Close the pools of the engines created so far."""
+    for name in ("engine", "read_engine"):
+        created = globals().get(name)
+        if created is not None:
+            await created.dispose()
+
+
+class PrimarySession(Session):
+    """Session bound to the primary engine, resolved when it first needs a connection."""
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        return get_engine().sync_engine
+
 
 # Async session factory used across the app via dependency injection
 AsyncSessionLocal = sessionmaker(
-    bind=engine,
     class_=AsyncSession,
+    sync_session_class=PrimarySession,
     expire_on_commit=False,
     autoflush=False,
     autocommit=False,
 )
 
 
+class ReplicaRoutingSession(Session):
+    """Session bound to the replica when it is usable for its tenant, else the primary.
+
+    The choice is made on first use, so sessions that never query never
+    touch either pool. Choosing the replica checks out (and returns) a
+    connection first; if that fails the breaker opens and the session uses
+    the primary instead.
+    """
+
+    _routed_bind = None
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self._routed_bind is None:
+            self._routed_bind = self._choose_bind()
+        return self._routed_bind
+
+    def _choose_bind(self):
+        primary, replica_engine = get_engine(), get_read_engine()
+        if replica_engine is None or not replica.usable() or is_pinned(self.info.get("tenant_id")):
+            return primary.sync_engine
+        try:
+            replica_engine.sync_engine.connect().close()
+        except (DBAPIError, OSError):
+            replica.mark_failed()
+            return primary.sync_engine
+        return replica_engine.sync_engine
+
+
+ReadSessionLocal = sessionmaker(
+    class_=AsyncSession,
+    sync_session_class=ReplicaRoutingSession,
+    expire_on_commit=False,
+    autoflush=False,
+    autocommit=False,
+)
+
+
+def used_replica(session: AsyncSession) -> bool:
+    """Whether ``session`` has run its queries on the read replica."""
+    sync_session = getattr(session, "sync_session", None)
+    bind = getattr(sync_session, "_routed_bind", None)
+    replica_engine = get_read_engine()
+    return replica_engine is not None and bind is replica_engine.sync_engine
+
+
+def read_session(tenant_id: Optional[uuid.UUID] = None) -> AsyncSession:
+    """Session for read-only work; ``tenant_id`` enables read-your-writes pinning."""
+    return ReadSessionLocal(info={"tenant_id": tenant_id})
+
+
 async def get_session() -> AsyncSession:
     """FastAPI dependency that yields an AsyncSession and ensures proper cleanup."""
     async with AsyncSessionLocal() as session:
         yield session
+
+
+async def get_read_session() -> AsyncSession:
+    """Like :func:`get_session`, but routed to the read replica when it is usable."""
+    async with read_session() as session:
+        yield session
@@ -0,0 +1,147 @@
+"""Per-project task counters: dashboard reads and drift reconciliation.
+
+``project_stats`` is kept current by triggers on ``task`` (migration 0005),
+so reads never aggregate tasks. The one time-dependent figure, overdue
+tasks, is counted in the same statement from the partial due-date index,
+which only holds tasks that have a due date.
+
+:func:`reconcile_project_stats` recounts from ``task`` and rewrites rows
+that drifted (manual SQL with triggers disabled, restores, bugs). It runs
+periodically in the app (``STATS_RECONCILE_INTERVAL_SECONDS``) and on demand
+via ``python -m scripts.reconcile_project_stats``; one sweep at a time runs
+across all workers (see ``locks.py``).
+"""
+
+import asyncio
+import logging
+import uuid
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Select, func, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .locks import RECONCILE_LOCK_KEY, exclusive_run
+from .models import Project, ProjectStats, Task, Tenant
+
+logger = logging.getLogger(__name__)
+
+STATUS_COUNTERS = ("todo", "in_progress", "done")
+PRIORITY_COUNTERS = ("low", "medium", "high")
+COUNTERS = ("total",) + STATUS_COUNTERS + PRIORITY_COUNTERS
+
+
+def project_stats_query(tenant_id: uuid.UUID, now: datetime, project_id: Optional[uuid.UUID] = None) -> Select:
+    """Counters plus overdue count for the tenant's projects, newest first.
+
+    Projects without a counters row (no tasks yet) read as zero.
+    """
+    overdue_q = select(Task.project_id, func.count().label("overdue")).where(
+        Task.tenant_id == tenant_id,
+        Task.due_date.isnot(None),
+        Task.due_date < now,
+        Task.status != "done",
+    )
+    scope = [Project.tenant_id == tenant_id, Project.deleted_at.is_(None)]
+    if project_id is not None:
+        overdue_q = overdue_q.where(Task.project_id == project_id)
+        scope.append(Project.id == project_id)
+    overdue = overdue_q.group_by(Task.project_id).subquery("overdue")
+
+    counters = [func.coalesce(getattr(ProjectStats, name), 0).label(name) for name in COUNTERS]
+    return (
+        select(Project.id.label("project_id"), *counters, func.coalesce(overdue.c.overdue, 0).label("overdue"))
+        .select_from(Project)
+        .outerjoin(ProjectStats, ProjectStats.project_id == Project.id)
+        .outerjoin(overdue, overdue.c.project_id == Project.id)
+        .where(*scope)
+        .order_by(Project.created_at.desc(), Project.id.desc())
+    )
+
+
+def recount_statement(tenant_id: uuid.UUID):
+    """Upsert freshly counted rows for a tenant, touching only rows that differ.
+
+    Returns the ids of projects whose counters were inserted or corrected.
+    """
+    counts = (
+        select(
+            Project.id,
+            Project.tenant_id,
+            func.count(Task.id),
+            *[func.count(Task.id).filter(Task.status == name) for name in STATUS_COUNTERS],
+            *[func.count(Task.id).filter(Task.priority == name) for name in PRIORITY_COUNTERS],
+            func.now(),
+        )
+        .select_from(Project)
+        # The tenant_id join lets the planner prune task to the tenant's partition.
+        .outerjoin(Task, (Task.project_id == Project.id) & (Task.tenant_id == Project.tenant_id))
+        .outerjoin(ProjectStats, ProjectStats.project_id == Project.id)
+        .where(Project.tenant_id == tenant_id)
+        .group_by(Project.id, Project.tenant_id)
+        # Task-less projects without a row already read as zero.
+        .having(or_(func.count(Task.id) > 0, func.count(ProjectStats.project_id) > 0))
+    )
+    stmt = insert(ProjectStats).from_select(["project_id", "tenant_id", *COUNTERS, "updated_at"], counts)
+    current = ProjectStats.__table__.c
+    return stmt.on_conflict_do_update(
+        index_elements=[ProjectStats.project_id],
+        set_={**{name: stmt.excluded[name] for name in COUNTERS}, "updated_at": stmt.excluded.updated_at},
+        where=or_(*[current[name].is_distinct_from(stmt.excluded[name]) for name in COUNTERS]),
+    ).returning(ProjectStats.project_id)
+
+
+async def reconcile_tenant_stats(session: AsyncSession, tenant_id: uuid.UUID) -> Optional[int]:
+    """Rebuild one tenant's counters; returns rows repaired, or None if skipped.
+
+    Runs at REPEATABLE READ so a task write committing mid-recount makes the
+    upsert fail with a serialization error instead of overwriting the
+    trigger's increment with a stale count; that tenant is retried next run.
+    """
+    await session.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+    try:
+        repaired = (await session.execute(recount_statement(tenant_id))).scalars().all()
+        await session.commit()
+    except DBAPIError as exc:
+        await session.rollback()
+        if getattr(exc.orig, "sqlstate", None) == "40001":
+            return None
+        raise
+    return len(repaired)
+
+
+async def reconcile_project_stats(session_factory) -> Optional[int]:
+    """Reconcile every tenant, one short transaction each; returns rows repaired.
+
+    Returns None without recounting when another worker's sweep is running.
+    """
+    async with exclusive_run(session_factory, RECONCILE_LOCK_KEY) as leader:
+        if not leader:
+            logger.info("project stats reconcile already running elsewhere; skipped")
+            return None
+
+        async with session_factory() as session:
+            tenant_ids = (await session.execute(select(Tenant.id))).scalars().all()
+
+        repaired = 0
+        for tenant_id in tenant_ids:
+            async with session_factory() as session:
+                fixed = await reconcile_tenant_stats(session, tenant_id)
+            if fixed is None:
+                logger.info("project stats reconcile skipped tenant %s (concurrent write)", tenant_id)
+            elif fixed:
+                logger.warning("project stats drifted for tenant %s: %d project(s) repaired", tenant_id, fixed)
+                repaired += fixed
+        return repaired
+
+
+async def run_stats_reconciler(session_factory, interval_seconds: float) -> None:
+    """Reconcile forever, every ``interval_seconds``; meant to run as a background task."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await reconcile_project_stats(session_factory)
+        except Exception:
+            logger.exception("project stats reconcile failed")
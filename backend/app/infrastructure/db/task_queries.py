@@ -0,0 +1,110 @@
+"""Task list queries shared by the task repository, routes and scripts.
+
+Filters and sort orders here match the tenant-leading indexes of
+migration 0003 (see ``scripts/explain_task_indexes.py``).
+"""
+
+import uuid
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import Select, select
+
+from ...application.repositories import TaskFilters
+from .models import Task
+from .purge import visible_tasks
+from .search import search_condition, search_rank
+
+TASK_OUT_COLUMNS = (
+    Task.id, Task.title, Task.status, Task.assignee, Task.priority, Task.due_date, Task.project_id,
+)
+# Page rows also carry created_at, the default keyset column.
+TASK_LIST_COLUMNS = TASK_OUT_COLUMNS + (Task.created_at,)
+
+SORT_COLUMNS = {
+    "created_at": Task.created_at,
+    "due_date": Task.due_date,
+    "priority": Task.priority,
+}
+NULLABLE_SORT_KEYS = {"due_date"}
+
+
+def _value(choice: Any) -> Any:
+    """Plain value of an API enum member (or of a plain string)."""
+    return getattr(choice, "value", choice)
+
+
+def resolve_sort(sort: Optional[str], q: Optional[str] = None) -> tuple[str, bool]:
+    """Parse a ``sort`` query value into (column key, descending).
+
+    Defaults to best match first when searching, otherwise newest first.
+    """
+    if q and not sort:
+        return "rank", True
+    if sort:
+        s = sort.strip().lower()
+        desc = s.startswith('-')
+        key = s[1:] if desc else s
+        if key in SORT_COLUMNS:
+            return key, desc
+    return "created_at", True
+
+
+def sort_column(key: str, q: Optional[str] = None):
+    """Column expression for a key from :func:`resolve_sort`."""
+    if key == "rank":
+        return search_rank(Task.search_vector, Task.title, q)
+    return SORT_COLUMNS[key]
+
+
+def filtered_tasks_query(
+    tenant_id: uuid.UUID,
+    project_id: Optional[uuid.UUID] = None,
+    status_filter: Optional[str] = None,
+    priority_filter: Optional[str] = None,
+    due_before: Optional[datetime] = None,
+    due_after: Optional[datetime] = None,
+    priority_min: Optional[str] = None,
+    priority_max: Optional[str] = None,
+    q: Optional[str] = None,
+) -> Select:
+    """Tenant-scoped task query with the list filters applied (no ordering or paging).
+
+    Priority comparisons run on the stored ordinal, so ``priority_min=medium``
+    matches medium and high. ``q`` matches title words by prefix, or titles
+    similar to it. Tasks of projects being purged in the background are
+    hidden.
+    """
+    base = select(Task).where(*visible_tasks(tenant_id))
+    if project_id:
+        base = base.where(Task.project_id == project_id)
+    if status_filter:
+        base = base.where(Task.status == _value(status_filter))
+    if priority_filter:
+        base = base.where(Task.priority == _value(priority_filter))
+    if due_before:
+        base = base.where(Task.due_date != None).where(Task.due_date <= due_before)  # noqa: E711
+    if due_after:
+        base = base.where(Task.due_date != None).where(Task.due_date >= due_after)  # noqa: E711
+    if priority_min:
+        base = base.where(Task.priority >= _value(priority_min))
+    if priority_max:
+        base = base.where(Task.priority <= _value(priority_max))
+    if q:
+        base = base.where(search_condition(Task.search_vector, Task.title, q))
+    return base
+
+
+def task_filters_query(tenant_id: uuid.UUID, filters: TaskFilters) -> Select:
+    """:func:`filtered_tasks_query` for a :class:`TaskFilters`."""
+    return filtered_tasks_query(
+        tenant_id,
+        project_id=filters.project_id,
+        status_filter=filters.status,
+        priority_filter=filters.priority,
+        due_before=filters.due_before,
+        due_after=filters.due_after,
+        priority_min=filters.priority_min,
+        priority_max=filters.priority_max,
+        q=filters.q,
+    )
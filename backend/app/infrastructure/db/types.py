@@ -0,0 +1,35 @@
+from typing import Optional, Union
+
+from sqlalchemy import SmallInteger
+from sqlalchemy.types import TypeDecorator
+
+from ...domain.entities import PRIORITY_NAMES, PRIORITY_ORDINALS
+
+
+class PriorityOrdinal(TypeDecorator):
+    """Task priority stored as a SMALLINT rank but exposed as its name.
+
+    Bound values (inserts, updates, comparisons such as
+    ``Task.priority >= "medium"``) are converted to ordinals and results back
+    to names, so ORDER BY and range filters run on the integer column and can
+    use its indexes while the API keeps its string contract.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[Union[str, int]], dialect) -> Optional[int]:
+        if value is None or isinstance(value, int):
+            return value
+        try:
+            return PRIORITY_ORDINALS[getattr(value, "value", value)]
+        except KeyError:
+            raise ValueError(f"Unknown priority: {value!r}")
+
+    def process_literal_param(self, value, dialect) -> Optional[int]:
+        return self.process_bind_param(value, dialect)
+
+    def process_result_value(self, value: Optional[int], dialect) -> Optional[str]:
+        if value is None:
+            return None
+        return PRIORITY_NAMES[value]
@@ -0,0 +1,114 @@
+"""Startup warm-up of the primary pool, and the readiness it reports.
+
+A fresh worker otherwise opens its database connections while serving its
+first requests, and each connection then prepares the hot statements on
+first use: asyncpg keeps prepared statements per connection and SQLAlchemy
+compiles each statement shape once per engine. :func:`warm_pool` does that
+before traffic arrives. It opens ``DB_POOL_WARM_CONNECTIONS`` connections
+at once and runs the default task list, project list and principal lookup
+on each, for a tenant that does not exist, so they only touch index pages
+and return nothing. The connections then stay in the pool.
+
+``GET /ready`` passes once a warm-up succeeded. If the database is
+unreachable at startup, :func:`run_pool_warmer` keeps retrying every
+``DB_WARMUP_RETRY_SECONDS``.
+"""
+
+import asyncio
+import contextlib
+import logging
+import threading
+import time
+import uuid
+from typing import Any, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+from ...application.repositories import TaskFilters
+from ..config import get_settings
+from ..repositories.sqlalchemy_repositories import ProjectRepositorySQLAlchemy, TaskRepositorySQLAlchemy
+from .models import User
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+NIL_ID = uuid.UUID(int=0)
+
+
+class Readiness:
+    """Whether this worker's pool has been warmed, for ``GET /ready``."""
+
+    def __init__(self) -> None:
+        self.ready = False
+        self.warm_connections = 0
+        self.warmup_ms: Optional[float] = None
+        self.error: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def mark_ready(self, connections: int, elapsed: float) -> None:
+        with self._lock:
+            self.ready = True
+            self.warm_connections = connections
+            self.warmup_ms = round(elapsed * 1000, 1)
+            self.error = None
+
+    def mark_failed(self, exc: BaseException) -> None:
+        with self._lock:
+            self.error = f"{type(exc).__name__}: {exc}"
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "status": "ready" if self.ready else "warming",
+                "warm_connections": self.warm_connections,
+                "warmup_ms": self.warmup_ms,
+                "error": self.error,
+            }
+
+
+readiness = Readiness()
+
+
+async def prime_connection(conn: AsyncConnection) -> None:
+    """Run the hot statements once on ``conn``, in a transaction that is rolled back."""
+    async with AsyncSession(bind=conn) as session:
+        await TaskRepositorySQLAlchemy(session).page(
+            NIL_ID, TaskFilters(), limit=settings.default_page_size, total_mode=settings.default_total_mode
+        )
+        await ProjectRepositorySQLAlchemy(session).page(
+            NIL_ID, limit=settings.default_page_size, total_mode=settings.default_total_mode
+        )
+        # Same shape as the principal lookup in security/jwt.py.
+        await session.execute(select(User.tenant_id, User.is_active).where(User.id == NIL_ID))
+        await session.rollback()
+
+
+async def warm_pool(engine: AsyncEngine, connections: int) -> int:
+    """Open ``connections`` pooled connections at once and prime each; returns how many."""
+    async with contextlib.AsyncExitStack() as stack:
+        opened = await asyncio.gather(
+            *[stack.enter_async_context(engine.connect()) for _ in range(connections)], return_exceptions=True
+        )
+        # Wait for every attempt before failing so no connection is opened after the stack closes.
+        for result in opened:
+            if isinstance(result, BaseException):
+                raise result
+        await asyncio.gather(*[prime_connection(conn) for conn in opened])
+    return len(opened)
+
+
+async def run_pool_warmer(engine: AsyncEngine, connections: int, retry_seconds: float) -> None:
+    """Warm the pool, retrying until the database answers, then mark the worker ready."""
+    started = time.perf_counter()
+    while True:
+        try:
+            warmed = await warm_pool(engine, connections) if connections > 0 else 0
+        except Exception as exc:
+            readiness.mark_failed(exc)
+            logger.warning("database pool warm-up failed (%s); retrying in %ss", exc, retry_seconds)
+            await asyncio.sleep(retry_seconds)
+            continue
+        readiness.mark_ready(warmed, time.perf_counter() - started)
+        logger.info("database pool warm: %d connection(s) in %.0f ms", warmed, readiness.warmup_ms)
+        return
@@ -0,0 +1,237 @@
+"""Tenant-scoped change events pushed to connected clients.
+
+Write paths publish an :class:`Event` once their transaction has committed
+(see :func:`..tenant_writes.record_tenant_write`); ``GET /events`` (SSE) and
+the ``/events/ws`` WebSocket stream them to every subscriber of the tenant.
+
+Two brokers are available, selected by ``EVENTS_BROKER``:
+
+* ``memory`` delivers within the current process only. Enough for a single
+  worker and for tests.
+* ``postgres`` also fans events out to the other workers through
+  ``LISTEN/NOTIFY`` on one dedicated asyncpg connection per process. Events
+  from other workers additionally invalidate this worker's tenant caches,
+  and :meth:`~InMemoryBroker.announce` carries other cache invalidations
+  (e.g. of a deactivated user's principals) that clients never see.
+
+Delivery is best effort. A subscriber that falls ``EVENTS_QUEUE_SIZE``
+events behind has its backlog dropped and receives a single ``resync``
+event, telling the client to refetch rather than apply deltas.
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+import uuid
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Optional
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+from .config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+CHANNEL = "tenant_events"
+# NOTIFY payloads are limited to 8000 bytes; larger events are sent without data.
+MAX_NOTIFY_BYTES = 7900
+
+
+@dataclass(frozen=True)
+class Event:
+    """One change, e.g. ``task.updated``; ``data`` must be JSON-serializable."""
+    type: str
+    data: Optional[dict[str, Any]] = None
+
+    def to_json(self) -> str:
+        return json.dumps({"type": self.type, "data": self.data}, separators=(",", ":"))
+
+    def summary(self) -> "Event":
+        """The event with only its identifying fields, for size-limited transports."""
+        if not self.data:
+            return self
+        return Event(self.type, {key: self.data[key] for key in ("id", "project_id") if key in self.data})
+
+
+RESYNC = Event("resync")
+
+
+class Subscription:
+    """Bounded queue of events for one connected client."""
+
+    def __init__(self, tenant_id: uuid.UUID, maxsize: int) -> None:
+        self.tenant_id = tenant_id
+        self._queue: asyncio.Queue[Event] = asyncio.Queue(maxsize)
+
+    def push(self, event: Event) -> None:
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # The client is too far behind for deltas to be useful.
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait(RESYNC)
+
+    async def get(self, timeout: float) -> Optional[Event]:
+        """Next event, or None when nothing arrived within ``timeout`` seconds."""
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class InMemoryBroker:
+    """Fan-out to subscribers in this process."""
+
+    def __init__(self, queue_size: int) -> None:
+        self.queue_size = queue_size
+        self._subscribers: dict[uuid.UUID, set[Subscription]] = {}
+
+    async def start(
+        self,
+        on_remote: Callable[[uuid.UUID], None],
+        invalidators: Optional[dict[str, Callable[[uuid.UUID], None]]] = None,
+    ) -> None:
+        """Begin receiving events from other processes; nothing to do in memory."""
+
+    async def stop(self) -> None:
+        pass
+
+    def publish(self, tenant_id: uuid.UUID, event: Event) -> None:
+        self._deliver(tenant_id, event)
+
+    def announce(self, kind: str, key: uuid.UUID) -> None:
+        """Tell the other processes to drop their cached ``kind`` entry for ``key``; none in memory."""
+
+    def _deliver(self, tenant_id: uuid.UUID, event: Event) -> None:
+        for subscription in self._subscribers.get(tenant_id, ()):
+            subscription.push(event)
+
+    @contextlib.asynccontextmanager
+    async def subscribe(self, tenant_id: uuid.UUID) -> AsyncIterator[Subscription]:
+        subscription = Subscription(tenant_id, self.queue_size)
+        self._subscribers.setdefault(tenant_id, set()).add(subscription)
+        try:
+            yield subscription
+        finally:
+            subscribers = self._subscribers.get(tenant_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[tenant_id]
+
+
+class PostgresBroker(InMemoryBroker):
+    """In-process fan-out plus ``LISTEN/NOTIFY`` between worker processes.
+
+    Local subscribers get events immediately; NOTIFYs are sent in order by a
+    background task, so publishing never waits on the database. Each
+    process tags its notifications and ignores its own when they come back.
+    """
+
+    def __init__(self, dsn: str, queue_size: int, reconnect_seconds: float = 5.0) -> None:
+        super().__init__(queue_size)
+        self.dsn = dsn
+        self.reconnect_seconds = reconnect_seconds
+        self.origin = uuid.uuid4().hex
+        self._outbox: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._on_remote: Callable[[uuid.UUID], None] = lambda tenant_id: None
+        self._invalidators: dict[str, Callable[[uuid.UUID], None]] = {}
+
+    async def start(
+        self,
+        on_remote: Callable[[uuid.UUID], None],
+        invalidators: Optional[dict[str, Callable[[uuid.UUID], None]]] = None,
+    ) -> None:
+        self._on_remote = on_remote
+        self._invalidators = dict(invalidators or {})
+        self._outbox = asyncio.Queue(maxsize=10_000)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def publish(self, tenant_id: uuid.UUID, event: Event) -> None:
+        self._deliver(tenant_id, event)
+        if self._outbox is None:
+            return
+        payload = self._payload(tenant_id, event)
+        if len(payload.encode()) > MAX_NOTIFY_BYTES:
+            payload = self._payload(tenant_id, event.summary())
+        self._send(payload, f"{event.type} for tenant {tenant_id}")
+
+    def announce(self, kind: str, key: uuid.UUID) -> None:
+        if self._outbox is None:
+            return
+        self._send(json.dumps({"origin": self.origin, "invalidate": kind, "key": str(key)}), f"{kind} invalidation")
+
+    def _send(self, payload: str, what: str) -> None:
+        try:
+            self._outbox.put_nowait(payload)
+        except asyncio.QueueFull:
+            logger.warning("event outbox full; dropping %s", what)
+
+    def _payload(self, tenant_id: uuid.UUID, event: Event) -> str:
+        return json.dumps({"origin": self.origin, "tenant_id": str(tenant_id), "type": event.type, "data": event.data})
+
+    def _on_notify(self, connection, pid, channel, payload: str) -> None:
+        message = json.loads(payload)
+        if message["origin"] == self.origin:
+            return
+        if "invalidate" in message:
+            invalidator = self._invalidators.get(message["invalidate"])
+            if invalidator is not None:
+                invalidator(uuid.UUID(message["key"]))
+            return
+        tenant_id = uuid.UUID(message["tenant_id"])
+        self._on_remote(tenant_id)
+        self._deliver(tenant_id, Event(message["type"], message["data"]))
+
+    async def _run(self) -> None:
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(self.dsn)
+                await connection.add_listener(CHANNEL, self._on_notify)
+                while True:
+                    try:
+                        payload = await asyncio.wait_for(self._outbox.get(), 30)
+                    except asyncio.TimeoutError:
+                        # Keepalive, so a dead LISTEN connection is noticed and replaced.
+                        await connection.execute("SELECT 1")
+                        continue
+                    await connection.execute("SELECT pg_notify($1, $2)", CHANNEL, payload)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("event broker connection failed; reconnecting in %ss", self.reconnect_seconds)
+            finally:
+                if connection is not None:
+                    with contextlib.suppress(Exception):
+                        await connection.close()
+            await asyncio.sleep(self.reconnect_seconds)
+
+
+def create_broker() -> InMemoryBroker:
+    if settings.events_broker == "postgres":
+        dsn = make_url(settings.database_url_async).set(drivername="postgresql")
+        return PostgresBroker(dsn.render_as_string(hide_password=False), settings.events_queue_size)
+    if settings.web_concurrency > 1:
+        # Other workers would keep serving cached responses, deactivated users
+        # and replica reads that miss the write until their TTLs run out.
+        raise RuntimeError(
+            f"EVENTS_BROKER=memory cannot serve WEB_CONCURRENCY={settings.web_concurrency} workers: "
+            "set EVENTS_BROKER=postgres"
+        )
+    return InMemoryBroker(settings.events_queue_size)
+
+
+broker = create_broker()
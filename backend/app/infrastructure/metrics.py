@@ -0,0 +1,114 @@
+"""Prometheus metrics shared by the API, database and security layers.
+
+Metrics live in the default registry. With ``PROMETHEUS_MULTIPROC_DIR``
+set (required for more than one worker), prometheus_client writes them to
+per-process files that ``GET /metrics`` aggregates across workers, and
+gauges declare how worker values combine.
+
+Per-request database figures are accumulated in :data:`request_stats`, a
+context variable the metrics middleware sets for each request; the engine
+cursor hooks add to whichever request's stats are current, broken down by
+statement fingerprint for the profiler in ``db/profiling.py``.
+"""
+
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from prometheus_client import Counter, Gauge, Histogram
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds", "Request latency by route template and status code.",
+    ["method", "route", "status"], buckets=LATENCY_BUCKETS,
+)
+HTTP_RESPONSE_BYTES = Histogram(
+    "http_response_size_bytes", "Response body size by route template.",
+    ["method", "route"], buckets=SIZE_BUCKETS,
+)
+HTTP_IN_PROGRESS = Gauge(
+    "http_requests_in_progress", "Requests currently being served.", multiprocess_mode="livesum",
+)
+
+DB_QUERIES_PER_REQUEST = Histogram(
+    "db_queries_per_request", "SQL statements executed per request.",
+    ["route"], buckets=(0, 1, 2, 3, 5, 8, 13, 21, 50, 100),
+)
+DB_SECONDS_PER_REQUEST = Histogram(
+    "db_seconds_per_request", "Time spent executing SQL per request.",
+    ["route"], buckets=LATENCY_BUCKETS,
+)
+
+DB_REPEATED_QUERY_REQUESTS = Counter(
+    "db_repeated_query_requests", "Requests that repeated one statement fingerprint past the N+1 threshold.", ["route"],
+)
+
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out", "Connections currently checked out of the pool.", ["pool"], multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow", "Overflow connections open beyond pool_size.", ["pool"], multiprocess_mode="livesum",
+)
+DB_POOL_WAIT_SECONDS = Histogram(
+    "db_pool_wait_seconds", "Time to obtain a connection from the pool (queueing plus any new connect).",
+    ["pool"], buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+DB_POOL_TIMEOUTS = Counter("db_pool_timeouts", "Checkouts that gave up after pool_timeout.", ["pool"])
+
+ADMISSION_REJECTED = Counter(
+    "admission_rejected", "Requests turned away by admission control, by reason.", ["reason"],
+)
+
+PASSWORD_HASH_SECONDS = Histogram(
+    "password_hash_seconds", "bcrypt hash/verify time on the hashing pool.",
+    buckets=(0.01, 0.05, 0.1, 0.2, 0.3, 0.5, 1.0, 2.0),
+)
+PASSWORD_HASH_WAIT_SECONDS = Histogram(
+    "password_hash_wait_seconds", "Queue wait before a hashing thread picked the call up.",
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0),
+)
+PASSWORD_HASH_REJECTED = Counter("password_hash_rejected", "Hashing calls rejected because the queue was full.")
+
+
+@dataclass
+class QueryProfile:
+    """Executions of one statement fingerprint within a request."""
+    statement: str
+    count: int = 0
+    seconds: float = 0.0
+
+
+@dataclass
+class RequestStats:
+    """Database work done on behalf of one request."""
+    queries: int = 0
+    db_seconds: float = 0.0
+    fingerprints: dict[str, QueryProfile] = field(default_factory=dict)
+    scope: Optional[dict[str, Any]] = field(default=None, repr=False)
+
+    @property
+    def route(self) -> str:
+        """Route template of the request, ``unmatched`` before or without routing."""
+        route = self.scope.get("route") if self.scope is not None else None
+        return getattr(route, "path", None) or "unmatched"
+
+
+request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def record_query(seconds: float, fingerprint: Optional[str] = None, statement: str = "") -> Optional[RequestStats]:
+    """Add one executed statement to the current request's stats, if any, and return them."""
+    stats = request_stats.get()
+    if stats is None:
+        return None
+    stats.queries += 1
+    stats.db_seconds += seconds
+    if fingerprint is not None:
+        profile = stats.fingerprints.get(fingerprint)
+        if profile is None:
+            profile = stats.fingerprints[fingerprint] = QueryProfile(statement)
+        profile.count += 1
+        profile.seconds += seconds
+    return stats
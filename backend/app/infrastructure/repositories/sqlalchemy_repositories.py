@@ -1,13 +1,49 @@
 import uuid
-from typing import Optional, Sequence
+from typing import AsyncIterator, Optional, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import Select, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...application.repositories import IProjectRepository, ITaskRepository
+from ...application.repositories import IProjectRepository, ITaskRepository, InvalidCursor, Page, TaskFilters
+from ..db.counting import TotalMode, count_total
 from ..db.models import Project, Task
+from ..db.overview import recent_tasks_from_json, task_counts_from_row, with_project_overview
+from ..db.purge import visible_tasks
+from ..db.pagination import decode_cursor, keyset_after, keyset_order, next_cursor
+from ..db.search import search_condition, search_rank
+from ..db.task_queries import NULLABLE_SORT_KEYS, TASK_LIST_COLUMNS, resolve_sort, sort_column, task_filters_query
 from ...domain.entities import ProjectEntity, TaskEntity
 
+PROJECT_COLUMNS = (Project.id, Project.tenant_id, Project.name, Project.description, Project.created_at)
+TASK_COLUMNS = TASK_LIST_COLUMNS + (Task.tenant_id,)
+
+
+def project_entity(row) -> ProjectEntity:
+    return ProjectEntity(
+        id=row.id, tenant_id=row.tenant_id, name=row.name, description=row.description, created_at=row.created_at
+    )
+
+
+def task_entity(row) -> TaskEntity:
+    return TaskEntity(
+        id=row.id,
+        tenant_id=row.tenant_id,
+        project_id=row.project_id,
+        title=row.title,
+        status=row.status,
+        assignee=row.assignee,
+        created_at=row.created_at,
+        priority=row.priority,
+        due_date=row.due_date,
+    )
+
+
+def _decode(cursor: str, sort_token: str):
+    try:
+        return decode_cursor(cursor, sort_token)
+    except ValueError as exc:
+        raise InvalidCursor(str(exc)) from exc
+
 
 class ProjectRepositorySQLAlchemy(IProjectRepository):
     """Repository implementation for Projects using SQLAlchemy.
@@ -20,62 +56,171 @@ class ProjectRepositorySQLAlchemy(IProjectRepository):
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
+    def _live(self, tenant_id: uuid.UUID) -> Select:
+        """The tenant's projects, minus those waiting for a background purge."""
+        return select(*PROJECT_COLUMNS).where(Project.tenant_id == tenant_id, Project.deleted_at.is_(None))
+
     async def list_by_tenant(self, tenant_id: uuid.UUID) -> Sequence[ProjectEntity]:
         """Return projects for a tenant ordered by creation date (desc)."""
+        result = await self._session.execute(self._live(tenant_id).order_by(Project.created_at.desc()))
+        return [project_entity(row) for row in result]
+
+    async def page(
+        self,
+        tenant_id: uuid.UUID,
+        *,
+        limit: int,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+        q: Optional[str] = None,
+        total_mode: str = "none",
+        task_counts: bool = False,
+        recent_tasks: int = 0,
+    ) -> Page[ProjectEntity]:
+        """Newest first by keyset ``cursor`` or ``offset``; with ``q``, matches only, best first.
+
+        ``task_counts`` and ``recent_tasks`` (how many newest tasks) fill the
+        entities' overview fields from the same statement.
+        """
+        if q:
+            key, column = "rank", search_rank(Project.search_vector, Project.name, q)
+        else:
+            key, column = "created_at", Project.created_at
+        sort_token = f"-{key}"
+        after = _decode(cursor, sort_token) if cursor else None
+
+        base = self._live(tenant_id)
+        if q:
+            base = base.where(search_condition(Project.search_vector, Project.name, q))
+        total = await count_total(self._session, base, TotalMode(total_mode), tenant_id, ("project", q))
+
+        page_q = base.add_columns(column.label("rank")) if q else base
+        page_q = page_q.order_by(*keyset_order(column, Project.id, desc=True))
+        if after:
+            value, after_id = after
+            page_q = page_q.where(keyset_after(column, Project.id, value, after_id, desc=True))
+        else:
+            page_q = page_q.offset(offset)
+        page_q = with_project_overview(page_q, tenant_id, task_counts, recent_tasks)
+
+        result = await self._session.execute(page_q.limit(limit + 1))
+        rows, next_token = next_cursor(list(result.all()), limit, sort_token, key)
+        items = []
+        for row in rows:
+            project = project_entity(row)
+            if task_counts:
+                project.task_counts = task_counts_from_row(row)
+            if recent_tasks:
+                project.recent_tasks = recent_tasks_from_json(row.recent_tasks, tenant_id)
+            items.append(project)
+        return Page(items, next_token, total)
+
+    async def get_many(self, tenant_id: uuid.UUID, ids: Sequence[uuid.UUID]) -> Sequence[ProjectEntity]:
+        """The tenant's live projects among ``ids``, in one query."""
+        if not ids:
+            return []
+        result = await self._session.execute(self._live(tenant_id).where(Project.id.in_(ids)))
+        return [project_entity(row) for row in result]
+
+    async def create(self, tenant_id: uuid.UUID, name: str, description: Optional[str]) -> ProjectEntity:
+        """Create a new project for the given tenant and return its domain entity.
+
+        A single ``INSERT ... RETURNING`` replaces the add/commit/refresh round-trips.
+        """
         result = await self._session.execute(
-            select(Project).where(Project.tenant_id == tenant_id).order_by(Project.created_at.desc())
+            insert(Project)
+            .values(name=name, description=description, tenant_id=tenant_id)
+            .returning(*PROJECT_COLUMNS)
         )
-        rows = result.scalars().all()
-        return [
-            ProjectEntity(
-                id=p.id, tenant_id=p.tenant_id, name=p.name, description=p.description, created_at=p.created_at
+        row = result.one()
+        await self._session.commit()
+        return project_entity(row)
+
+    async def create_many(self, projects: Sequence[ProjectEntity]) -> Sequence[ProjectEntity]:
+        """One executemany ``INSERT`` for entities whose ids are already set; the caller commits."""
+        if projects:
+            await self._session.execute(
+                insert(Project),
+                [
+                    {"id": p.id, "tenant_id": p.tenant_id, "name": p.name, "description": p.description,
+                     "created_at": p.created_at}
+                    for p in projects
+                ],
             )
-            for p in rows
-        ]
+        return projects
 
-    async def create(self, tenant_id: uuid.UUID, name: str, description: Optional[str]) -> ProjectEntity:
-        """Create a new project for the given tenant and return its domain entity."""
-        project = Project(name=name, description=description, tenant_id=tenant_id)
-        self._session.add(project)
-        await self._session.commit()
-        await self._session.refresh(project)
-        return ProjectEntity(
-            id=project.id,
-            tenant_id=project.tenant_id,
-            name=project.name,
-            description=project.description,
-            created_at=project.created_at,
-        )
+    async def stream(self, tenant_id: uuid.UUID, chunk_size: int = 1000) -> AsyncIterator[Sequence[ProjectEntity]]:
+        """The tenant's projects, newest first, fetched ``chunk_size`` rows at a time."""
+        query = self._live(tenant_id).order_by(*keyset_order(Project.created_at, Project.id, desc=True))
+        result = await self._session.stream(query.execution_options(yield_per=chunk_size))
+        async for rows in result.partitions():
+            yield [project_entity(row) for row in rows]
 
 
 class TaskRepositorySQLAlchemy(ITaskRepository):
     """Repository implementation for Tasks using SQLAlchemy.
 
     Ensures every query is scoped by tenant to maintain strict isolation.
+    Queries select plain columns and build slotted entities directly, never
+    ORM instances.
     """
 
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
     async def list_by_tenant(self, tenant_id: uuid.UUID, project_id: Optional[uuid.UUID] = None) -> Sequence[TaskEntity]:
-        """Return tasks in a tenant, optionally filtered by a project."""
-        query = select(Task).where(Task.tenant_id == tenant_id)
+        """Return tasks in a tenant, optionally filtered by a project; purging projects' tasks are left out."""
+        query = select(*TASK_COLUMNS).where(*visible_tasks(tenant_id))
         if project_id:
             query = query.where(Task.project_id == project_id)
         result = await self._session.execute(query.order_by(Task.created_at.desc()))
-        rows = result.scalars().all()
-        return [
-            TaskEntity(
-                id=t.id,
-                tenant_id=t.tenant_id,
-                project_id=t.project_id,
-                title=t.title,
-                status=t.status,
-                assignee=t.assignee,
-                created_at=t.created_at,
-            )
-            for t in rows
-        ]
+        return [task_entity(row) for row in result]
+
+    async def page(
+        self,
+        tenant_id: uuid.UUID,
+        filters: TaskFilters,
+        *,
+        limit: int,
+        sort: Optional[str] = None,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+        total_mode: str = "none",
+    ) -> Page[TaskEntity]:
+        """Filtered page by keyset ``cursor`` (seeks in the index) or ``offset``.
+
+        With ``filters.q`` results are ranked by relevance unless ``sort`` is given.
+        """
+        key, desc = resolve_sort(sort, filters.q)
+        column = sort_column(key, filters.q)
+        sort_token = f"-{key}" if desc else key
+        after = _decode(cursor, sort_token) if cursor else None
+
+        base = task_filters_query(tenant_id, filters)
+        total = await count_total(self._session, base, TotalMode(total_mode), tenant_id, ("task", filters))
+
+        page_q = base.with_only_columns(*TASK_COLUMNS)
+        if key == "rank":
+            page_q = page_q.add_columns(column.label("rank"))
+        page_q = page_q.order_by(*keyset_order(column, Task.id, desc))
+        if after:
+            value, after_id = after
+            page_q = page_q.where(keyset_after(column, Task.id, value, after_id, desc, key in NULLABLE_SORT_KEYS))
+        else:
+            page_q = page_q.offset(offset)
+
+        result = await self._session.execute(page_q.limit(limit + 1))
+        rows, next_token = next_cursor(list(result.all()), limit, sort_token, key)
+        return Page([task_entity(row) for row in rows], next_token, total)
+
+    async def get_many(self, tenant_id: uuid.UUID, ids: Sequence[uuid.UUID]) -> Sequence[TaskEntity]:
+        """The tenant's tasks among ``ids``, in one query; purging projects' tasks are left out."""
+        if not ids:
+            return []
+        result = await self._session.execute(
+            select(*TASK_COLUMNS).where(*visible_tasks(tenant_id), Task.id.in_(ids))
+        )
+        return [task_entity(row) for row in result]
 
     async def create(
         self,
@@ -85,17 +230,47 @@ class TaskRepositorySQLAlchemy(ITaskRepository):
         status: str,
         assignee: Optional[str],
     ) -> TaskEntity:
-        """Create a new task under a project for a tenant and return its domain entity."""
-        task = Task(tenant_id=tenant_id, project_id=project_id, title=title, status=status, assignee=assignee)
-        self._session.add(task)
+        """Create a new task under a project for a tenant and return its domain entity.
+
+        A single ``INSERT ... RETURNING`` replaces the add/commit/refresh round-trips.
+        """
+        result = await self._session.execute(
+            insert(Task)
+            .values(tenant_id=tenant_id, project_id=project_id, title=title, status=status, assignee=assignee)
+            .returning(*TASK_COLUMNS)
+        )
+        row = result.one()
         await self._session.commit()
-        await self._session.refresh(task)
-        return TaskEntity(
-            id=task.id,
-            tenant_id=task.tenant_id,
-            project_id=task.project_id,
-            title=task.title,
-            status=task.status,
-            assignee=task.assignee,
-            created_at=task.created_at,
+        return task_entity(row)
+
+    async def create_many(self, tasks: Sequence[TaskEntity]) -> Sequence[TaskEntity]:
+        """One executemany ``INSERT`` for entities whose ids are already set; the caller commits."""
+        if tasks:
+            await self._session.execute(
+                insert(Task),
+                [
+                    {"id": t.id, "tenant_id": t.tenant_id, "project_id": t.project_id, "title": t.title,
+                     "status": t.status, "assignee": t.assignee, "priority": t.priority, "due_date": t.due_date,
+                     "created_at": t.created_at}
+                    for t in tasks
+                ],
+            )
+        return tasks
+
+    async def stream(
+        self, tenant_id: uuid.UUID, filters: TaskFilters, sort: Optional[str] = None, chunk_size: int = 1000
+    ) -> AsyncIterator[Sequence[TaskEntity]]:
+        """Every matching task from a server-side cursor, ``chunk_size`` rows per chunk.
+
+        Memory stays flat regardless of tenant size; the session must stay
+        open until the iterator is exhausted.
+        """
+        key, desc = resolve_sort(sort)
+        query = (
+            task_filters_query(tenant_id, filters)
+            .with_only_columns(*TASK_COLUMNS)
+            .order_by(*keyset_order(sort_column(key), Task.id, desc))
         )
+        result = await self._session.stream(query.execution_options(yield_per=chunk_size))
+        async for rows in result.partitions():
+            yield [task_entity(row) for row in rows]
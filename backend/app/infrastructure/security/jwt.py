@@ -1,17 +1,21 @@
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
+import time
 from typing import Any, Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import jwt, JWTError
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session, object_session
 import uuid
 
+from ..cache import TTLCache, VersionCounter
 from ..config import get_settings
 from ..db.models import User
-from ..db.session import get_session
+from ..db.session import AsyncSessionLocal, get_read_session, get_session, used_replica
+from ..events import broker
 
 settings = get_settings()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
@@ -24,13 +28,195 @@ class TokenData(BaseModel):
     exp: int
 
 
+@dataclass(frozen=True)
+class Principal:
+    """Authenticated caller resolved from a verified access token."""
+    user_id: uuid.UUID
+    tenant_id: uuid.UUID
+    is_active: bool
+    claims: dict[str, Any] = field(default_factory=dict, compare=False)
+
+
+# Verified principals keyed by raw token. Each entry remembers the user's
+# version when it was cached; invalidate_principal() bumps the version so
+# every cached token of that user misses on its next use.
+principal_cache = TTLCache(settings.principal_cache_max_entries, settings.principal_cache_ttl_seconds)
+_user_versions = VersionCounter()
+
+PRINCIPAL = "principal"
+_PENDING_USERS = "principal_invalidations"
+
+
+def invalidate_principal(user_id: uuid.UUID) -> None:
+    """Drop this worker's cached principals of a user.
+
+    Also called for invalidations announced by other workers; code that
+    changes a user should call :func:`record_user_change` instead.
+    """
+    _user_versions.bump(user_id)
+
+
+def record_user_change(user_id: uuid.UUID) -> None:
+    """Drop cached principals of a user in every worker, e.g. after deactivation or a tenant change.
+
+    Call it once the change has committed. ORM updates and deletes of
+    ``User`` do so automatically; bulk ``UPDATE`` statements that bypass the
+    ORM must call it themselves.
+    """
+    invalidate_principal(user_id)
+    broker.announce(PRINCIPAL, user_id)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _queue_principal_invalidation(mapper, connection, target: User) -> None:
+    # Flush runs before commit; invalidating now would let a concurrent
+    # request re-cache the old row until the TTL, so wait for the commit.
+    session = object_session(target)
+    session.info.setdefault(_PENDING_USERS, set()).add(target.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_principals(session: Session) -> None:
+    for user_id in session.info.pop(_PENDING_USERS, ()):
+        record_user_change(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_principal_invalidations(session: Session) -> None:
+    session.info.pop(_PENDING_USERS, None)
+
+
+def _decode_token(token: str) -> dict[str, Any]:
+    """Verify a token's signature and expiry; ``ValueError`` when it is not valid.
+
+    python-jose pulls in ``cryptography``, tens of milliseconds of import,
+    so it is imported on first use (the app preloads it during startup).
+    """
+    from jose import JWTError, jwt
+
+    try:
+        return jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+    except JWTError as exc:
+        raise ValueError("Invalid token") from exc
+
+
 def create_access_token(subject: dict[str, Any], expires_minutes: Optional[int] = None) -> str:
     """Create a JWT access token with a configurable expiration."""
+    from jose import jwt
+
     expire = datetime.now(timezone.utc) + timedelta(minutes=expires_minutes or settings.access_token_expire_minutes)
     to_encode = {**subject, "exp": expire}
     return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
 
 
+async def _load_user_principal_row(session: AsyncSession, user_id: uuid.UUID):
+    return (await session.execute(select(User.tenant_id, User.is_active).where(User.id == user_id))).one_or_none()
+
+
+async def _load_principal_row(session: AsyncSession, user_id: uuid.UUID):
+    """The user's tenant and status; a user the replica does not know yet is looked up on the primary."""
+    row = await _load_user_principal_row(session, user_id)
+    if row is None and used_replica(session):
+        async with AsyncSessionLocal() as primary:
+            row = await _load_user_principal_row(primary, user_id)
+    return row
+
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+async def get_current_principal(token: str = Depends(oauth2_scheme), session: AsyncSession = Depends(get_read_session)) -> Principal:
+    """Resolve the caller from a Bearer token, consulting the database only on a cache miss.
+
+    The lookup reads from the replica when one is usable; a user it does not
+    know yet (registered moments ago) is looked up again on the primary. The
+    session is lazy, so cache hits never check a connection out of the pool.
+    """
+    credentials_exception = _credentials_exception()
+
+    cached = principal_cache.get(token)
+    if cached is not None:
+        version, principal = cached
+        if version == _user_versions.get(principal.user_id):
+            if not principal.is_active:
+                raise credentials_exception
+            return principal
+
+    try:
+        payload = _decode_token(token)
+        claims = TokenData(**payload)
+        user_id = uuid.UUID(claims.user_id)
+        tenant_id = uuid.UUID(claims.tenant_id)
+    except ValueError:
+        raise credentials_exception
+
+    if settings.auth_trust_token_claims:
+        return Principal(user_id=user_id, tenant_id=tenant_id, is_active=True, claims=payload)
+
+    version = _user_versions.get(user_id)
+    row = await _load_principal_row(session, user_id)
+    if row is None:
+        raise credentials_exception
+
+    principal = Principal(user_id=user_id, tenant_id=row.tenant_id, is_active=row.is_active, claims=payload)
+    ttl = min(settings.principal_cache_ttl_seconds, claims.exp - time.time())
+    if ttl > 0:
+        principal_cache.set(token, (version, principal), ttl=ttl)
+    if not principal.is_active:
+        raise credentials_exception
+    return principal
+
+
+STREAM_TICKET_SCOPE = "events"
+
+
+def create_stream_ticket(principal: Principal) -> str:
+    """Short-lived token that only opens an event stream, for URLs where headers cannot be set.
+
+    It is valid for ``EVENTS_TICKET_TTL_SECONDS``, so one leaked through an
+    access or proxy log is soon useless. It carries the access token's
+    expiry, and the stream ends then as it would with the token itself.
+    Its claims differ from an access token's, so APIs reject it.
+    """
+    from jose import jwt
+
+    session_exp = int(principal.claims.get("exp", time.time() + settings.events_ticket_ttl_seconds))
+    claims = {
+        "sub": str(principal.user_id),
+        "tid": str(principal.tenant_id),
+        "scope": STREAM_TICKET_SCOPE,
+        "session_exp": session_exp,
+        "exp": min(int(time.time()) + settings.events_ticket_ttl_seconds, session_exp),
+    }
+    return jwt.encode(claims, settings.secret_key, algorithm=settings.algorithm)
+
+
+async def get_ticket_principal(ticket: str, session: AsyncSession) -> Principal:
+    """Resolve a stream ticket from :func:`create_stream_ticket`; 401 when invalid, expired or the user is inactive."""
+    try:
+        payload = _decode_token(ticket)
+        if payload.get("scope") != STREAM_TICKET_SCOPE:
+            raise ValueError("Not a stream ticket")
+        user_id = uuid.UUID(payload["sub"])
+        tenant_id = uuid.UUID(payload["tid"])
+        claims = {"exp": int(payload["session_exp"])}
+    except (ValueError, KeyError, TypeError):
+        raise _credentials_exception()
+
+    if settings.auth_trust_token_claims:
+        return Principal(user_id=user_id, tenant_id=tenant_id, is_active=True, claims=claims)
+    row = await _load_principal_row(session, user_id)
+    if row is None or not row.is_active:
+        raise _credentials_exception()
+    return Principal(user_id=user_id, tenant_id=row.tenant_id, is_active=True, claims=claims)
+
+
 async def get_current_user(token: str = Depends(oauth2_scheme), session: AsyncSession = Depends(get_session)) -> User:
     """Resolve the authenticated user from a Bearer token or raise 401."""
     credentials_exception = HTTPException(
@@ -39,12 +225,12 @@ async def get_current_user(token: str = Depends(oauth2_scheme), session: AsyncSe
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+        payload = _decode_token(token)
         user_id_str: str = str(payload.get("user_id"))
         if user_id_str is None:
             raise credentials_exception
         user_id = uuid.UUID(user_id_str)
-    except (JWTError, ValueError):
+    except ValueError:
         raise credentials_exception
 
     result = await session.execute(select(User).where(User.id == user_id))
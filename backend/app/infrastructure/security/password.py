@@ -1,11 +1,128 @@
-from passlib.context import CryptContext
+"""Password hashing with bcrypt.
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+bcrypt is deliberately slow, so the async helpers run it on a dedicated,
+bounded thread pool (the bcrypt extension releases the GIL while hashing)
+instead of blocking the event loop. When more calls are waiting than the
+pool and its queue allow, :class:`HashQueueFull` is raised so callers can
+fail fast rather than pile up behind a login storm.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, TypeVar
+
+from ..config import get_settings
+from ..metrics import PASSWORD_HASH_REJECTED, PASSWORD_HASH_SECONDS, PASSWORD_HASH_WAIT_SECONDS
+
+settings = get_settings()
+
+
+@lru_cache
+def get_pwd_context():
+    """The bcrypt context; passlib is imported on first use (the app preloads it during startup)."""
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.bcrypt_rounds)
+
+
+T = TypeVar("T")
+
+
+class HashQueueFull(Exception):
+    """Raised when the password hashing pool cannot accept more work."""
+
+
+class HashMetrics:
+    """Running totals of queue wait and hashing time for the hashing pool."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.rejected = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.hash_seconds_total = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, wait: float, duration: float) -> None:
+        with self._lock:
+            self.calls += 1
+            self.wait_seconds_total += wait
+            self.wait_seconds_max = max(self.wait_seconds_max, wait)
+            self.hash_seconds_total += duration
+        PASSWORD_HASH_WAIT_SECONDS.observe(wait)
+        PASSWORD_HASH_SECONDS.observe(duration)
+
+    def reject(self) -> None:
+        with self._lock:
+            self.rejected += 1
+        PASSWORD_HASH_REJECTED.inc()
+
+    def snapshot(self) -> dict[str, float]:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "rejected": self.rejected,
+                "wait_seconds_total": self.wait_seconds_total,
+                "wait_seconds_max": self.wait_seconds_max,
+                "hash_seconds_total": self.hash_seconds_total,
+            }
+
+
+class PasswordHasherPool:
+    """Bounded executor for CPU-heavy hashing calls."""
+
+    def __init__(self, workers: int, max_queue: int) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+        self._capacity = workers + max_queue
+        self._pending = 0
+        self.metrics = HashMetrics()
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    async def run(self, fn: Callable[..., T], *args) -> T:
+        """Run ``fn(*args)`` on the pool or raise :class:`HashQueueFull` when saturated."""
+        # Only touched from the event loop thread, so no lock is needed.
+        if self._pending >= self._capacity:
+            self.metrics.reject()
+            raise HashQueueFull()
+
+        submitted = time.perf_counter()
+
+        def job() -> tuple[float, float, T]:
+            started = time.perf_counter()
+            result = fn(*args)
+            return started - submitted, time.perf_counter() - started, result
+
+        self._pending += 1
+        try:
+            wait, duration, result = await asyncio.get_running_loop().run_in_executor(self._executor, job)
+        finally:
+            self._pending -= 1
+        self.metrics.observe(wait, duration)
+        return result
+
+
+hasher_pool = PasswordHasherPool(settings.password_hash_workers, settings.password_hash_max_queue)
 
 
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
 
 
 def verify_password(password: str, hashed: str) -> bool:
-    return pwd_context.verify(password, hashed)
+    return get_pwd_context().verify(password, hashed)
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password on the hashing pool without blocking the event loop."""
+    return await hasher_pool.run(hash_password, password)
+
+
+async def verify_password_async(password: str, hashed: str) -> bool:
+    """Verify a password on the hashing pool without blocking the event loop."""
+    return await hasher_pool.run(verify_password, password, hashed)
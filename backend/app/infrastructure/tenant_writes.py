@@ -0,0 +1,30 @@
+"""Hook run after a tenant's projects or tasks change.
+
+Route handlers call :func:`record_tenant_write` once their transaction has
+committed, so every per-tenant cache is invalidated and change events are
+published from a single place.
+"""
+
+import uuid
+
+from .cache import tenant_versions
+from .db.replica import pin_to_primary
+from .events import Event, broker
+
+
+def invalidate_tenant(tenant_id: uuid.UUID) -> None:
+    """Invalidate cached data derived from the tenant's projects and tasks.
+
+    Also pins the tenant's reads to the primary for a short window, so the
+    writer does not read a replica that has not replayed the write yet.
+    Called for this worker's writes and for writes announced by other workers.
+    """
+    tenant_versions.bump(tenant_id)
+    pin_to_primary(tenant_id)
+
+
+def record_tenant_write(tenant_id: uuid.UUID, *events: Event) -> None:
+    """Invalidate the tenant's caches and publish ``events`` to its subscribers."""
+    invalidate_tenant(tenant_id)
+    for event in events:
+        broker.publish(tenant_id, event)
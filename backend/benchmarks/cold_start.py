@@ -0,0 +1,167 @@
+"""Cold-start benchmark: import, app construction, startup and first requests.
+
+Every run is a fresh interpreter, so nothing is cached between runs. Each
+run times these phases:
+
+- ``import``: ``import app.api.main``;
+- ``create_app``: building the app (routers, models);
+- ``startup``: the lifespan startup (pool warm-up, deferred imports,
+  broker, background jobs);
+- ``first GET /`` and ``first GET /ready``: the first requests through
+  ``httpx.ASGITransport``;
+- with ``--manifest``, also ``first POST /auth/login``,
+  ``first GET /projects/`` and ``first GET /tasks/`` for the first seeded
+  tenant.
+
+The p50 and max of each phase over ``--runs`` runs are printed and saved
+as JSON. ``--baseline`` compares against an earlier result and exits 1
+when any phase's p50 got slower by more than ``--threshold`` percent.
+
+Usage (from ``backend/``; a reachable database makes ``startup`` include
+the pool warm-up, otherwise it waits up to ``DB_POOL_TIMEOUT``):
+
+    python -m benchmarks.cold_start [--runs 5] [--manifest bench_manifest.json] [--out cold.json] [--baseline old.json]
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+from .compare import change_pct
+
+
+class TimedLifespan:
+    """Run the app's lifespan around a block, timing its startup as ``startup``."""
+
+    def __init__(self, app, phases: dict[str, float]) -> None:
+        self.context = app.router.lifespan_context(app)
+        self.phases = phases
+
+    async def __aenter__(self):
+        started = time.perf_counter()
+        await self.context.__aenter__()
+        self.phases["startup"] = time.perf_counter() - started
+
+    async def __aexit__(self, *exc):
+        return await self.context.__aexit__(*exc)
+
+
+async def _child(manifest_path: Optional[str]) -> dict[str, float]:
+    """One cold run in this (fresh) process; returns milliseconds per phase."""
+    phases: dict[str, float] = {}
+
+    started = time.perf_counter()
+    from app.api import main
+    phases["import"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    app = main.create_app()
+    phases["create_app"] = time.perf_counter() - started
+
+    import httpx
+
+    async with TimedLifespan(app, phases):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+            for path in ("/", "/ready"):
+                started = time.perf_counter()
+                await client.get(path)
+                phases[f"first GET {path}"] = time.perf_counter() - started
+
+            if manifest_path:
+                with open(manifest_path) as fh:
+                    manifest = json.load(fh)
+                tenant = manifest["tenants"][0]
+                started = time.perf_counter()
+                response = await client.post(
+                    "/auth/login", data={"username": tenant["email"], "password": manifest["password"]}
+                )
+                phases["first POST /auth/login"] = time.perf_counter() - started
+                response.raise_for_status()
+                headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+                for path in ("/projects/", "/tasks/"):
+                    started = time.perf_counter()
+                    (await client.get(path, headers=headers)).raise_for_status()
+                    phases[f"first GET {path}"] = time.perf_counter() - started
+
+    return {name: seconds * 1000 for name, seconds in phases.items()}
+
+
+def run_once(manifest: Optional[str]) -> dict[str, float]:
+    command = [sys.executable, "-m", "benchmarks.cold_start", "--child"]
+    if manifest:
+        command += ["--manifest", manifest]
+    out = subprocess.run(command, capture_output=True, text=True, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def summarize_runs(runs: list[dict[str, float]]) -> dict[str, dict]:
+    # Imported here: benchmarks.load imports app modules, which would skew a child's import phase.
+    from .load import percentile
+
+    phases = {}
+    for name in runs[0]:
+        values = sorted(run[name] for run in runs if name in run)
+        phases[name] = {"runs": len(values), "p50_ms": percentile(values, 50), "max_ms": values[-1]}
+    return phases
+
+
+def regressions(baseline: dict, current: dict, threshold: float) -> list[str]:
+    """Phases whose p50 grew by more than ``threshold`` percent."""
+    slower = []
+    for name, after in current["phases"].items():
+        before = baseline["phases"].get(name)
+        if before is not None and change_pct(before["p50_ms"], after["p50_ms"]) > threshold:
+            slower.append(name)
+    return slower
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--manifest", help="seed manifest; adds authenticated first requests")
+    parser.add_argument("--out", help="write the JSON result to this file")
+    parser.add_argument("--baseline", help="earlier result to compare against")
+    parser.add_argument("--threshold", type=float, default=20, help="allowed p50 slowdown in percent")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(asyncio.run(_child(args.manifest))))
+        return
+
+    from .load import _git_commit
+
+    result = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "runs": args.runs,
+        },
+        "phases": summarize_runs([run_once(args.manifest) for _ in range(args.runs)]),
+    }
+    print(f"{'phase':<26} {'p50 ms':>9} {'max ms':>9}")
+    for name, stats in result["phases"].items():
+        print(f"{name:<26} {stats['p50_ms']:>9.1f} {stats['max_ms']:>9.1f}")
+    if args.out:
+        with open(args.out, "w") as fh:
+            json.dump(result, fh, indent=2)
+        print(f"results written to {args.out}")
+
+    if args.baseline:
+        with open(args.baseline) as fh:
+            slower = regressions(json.load(fh), result, args.threshold)
+        for name in slower:
+            print(f"REGRESSED: {name}")
+        sys.exit(1 if slower else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Compare two ``benchmarks.load`` results and flag regressions.
+
+A route regresses when its p95 (or p99) latency grows, or its throughput
+drops, by more than ``--threshold`` percent against the baseline. Routes
+with fewer than ``--min-requests`` samples on either side are reported but
+never flagged, since their percentiles are noise. The exit status is 1 when
+anything regressed, so the check can gate a deploy.
+
+Usage (from ``backend/``):
+
+    python -m benchmarks.compare baseline.json current.json [--threshold 10]
+"""
+
+import argparse
+import json
+import sys
+
+# metric -> True when higher is better
+METRICS = {"p95_ms": False, "p99_ms": False, "throughput_rps": True}
+
+
+def change_pct(before: float, after: float) -> float:
+    if before == 0:
+        return 0.0
+    return (after - before) / before * 100
+
+
+def compare(baseline: dict, current: dict, threshold: float, min_requests: int) -> list[dict]:
+    """One row per route present in both results, with per-metric changes and a regression flag."""
+    rows = []
+    base_routes = {**baseline["routes"], "overall": baseline["overall"]}
+    for route, after in {**current["routes"], "overall": current["overall"]}.items():
+        before = base_routes.get(route)
+        if before is None:
+            continue
+        changes = {metric: change_pct(before[metric], after[metric]) for metric in METRICS}
+        enough = min(before["requests"], after["requests"]) >= min_requests
+        regressed = enough and any(
+            (-changes[metric] if higher_is_better else changes[metric]) > threshold
+            for metric, higher_is_better in METRICS.items()
+        )
+        rows.append({"route": route, "before": before, "after": after, "change_pct": changes, "regressed": regressed})
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=10, help="allowed worsening in percent")
+    parser.add_argument("--min-requests", type=int, default=50)
+    args = parser.parse_args()
+
+    with open(args.baseline) as fh:
+        baseline = json.load(fh)
+    with open(args.current) as fh:
+        current = json.load(fh)
+
+    rows = compare(baseline, current, args.threshold, args.min_requests)
+    print(f"baseline {baseline['meta'].get('git_commit')} -> current {current['meta'].get('git_commit')}")
+    print(f"{'route':<28} {'p95 ms':>17} {'p99 ms':>17} {'rps':>17}")
+    for row in rows:
+        cells = [
+            f"{row['before'][m]:>6.1f}->{row['after'][m]:<6.1f}{row['change_pct'][m]:+4.0f}%" for m in METRICS
+        ]
+        flag = "  REGRESSION" if row["regressed"] else ""
+        print(f"{row['route']:<28} {cells[0]:>17} {cells[1]:>17} {cells[2]:>17}{flag}")
+
+    sys.exit(1 if any(row["regressed"] for row in rows) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+"""In-process load and latency benchmark against the ASGI app.
+
+Drives the app from ``app.api.main.create_app()`` through ``httpx.AsyncClient`` with
+``ASGITransport``, so the full request path (routing, dependencies,
+validation, serialization, database) is measured without a network hop
+or server process. Concurrent workers pick calls from a weighted mix and
+run until the duration elapses; per-route throughput and p50/p95/p99
+latency are printed and saved as JSON for ``benchmarks.compare``.
+
+Usage (from ``backend/``, after ``python -m benchmarks.seed``):
+
+    python -m benchmarks.load [--mix default] [--duration 30] [--concurrency 16] [--out results.json]
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import subprocess
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable
+
+import httpx
+
+from .seed import WORDS
+
+# Weights per scenario; each mix should exercise what a release is likely to change.
+MIXES = {
+    "default": {
+        "list_tasks": 30, "filter_tasks": 15, "sort_tasks": 10, "deep_page": 10, "search_tasks": 5,
+        "list_projects": 10, "project_stats": 5, "create_task": 8, "update_task": 5, "login": 2,
+    },
+    "read_heavy": {
+        "list_tasks": 40, "filter_tasks": 20, "sort_tasks": 15, "deep_page": 10, "list_projects": 10,
+        "project_stats": 5,
+    },
+    "write_heavy": {"create_task": 45, "update_task": 35, "list_tasks": 20},
+    "auth": {"login": 100},
+}
+
+
+@dataclass
+class TenantContext:
+    email: str
+    password: str
+    token: str
+    project_ids: list[str]
+    created_task_ids: list[str] = field(default_factory=list)
+
+    @property
+    def headers(self) -> dict:
+        return {"Authorization": f"Bearer {self.token}"}
+
+
+Scenario = Callable[[httpx.AsyncClient, TenantContext, random.Random, "Recorder"], Awaitable[None]]
+
+
+class Recorder:
+    """Collects latencies (seconds) and error counts per route label."""
+
+    def __init__(self) -> None:
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+
+    async def call(self, route: str, request: Awaitable[httpx.Response]) -> httpx.Response | None:
+        started = time.perf_counter()
+        try:
+            response = await request
+        except Exception:
+            self.errors[route] += 1
+            return None
+        self.latencies[route].append(time.perf_counter() - started)
+        if response.status_code >= 400:
+            self.errors[route] += 1
+        return response
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def summarize(recorder: Recorder, elapsed: float) -> dict:
+    routes = {}
+    all_latencies: list[float] = []
+    for route in sorted(set(recorder.latencies) | set(recorder.errors)):
+        values = sorted(recorder.latencies.get(route, []))
+        all_latencies.extend(values)
+        routes[route] = {
+            "requests": len(values),
+            "errors": recorder.errors.get(route, 0),
+            "throughput_rps": len(values) / elapsed if elapsed else 0.0,
+            **{f"p{p}_ms": percentile(values, p) * 1000 for p in (50, 95, 99)},
+            "max_ms": (values[-1] * 1000) if values else 0.0,
+        }
+    all_latencies.sort()
+    overall = {
+        "requests": len(all_latencies),
+        "errors": sum(recorder.errors.values()),
+        "throughput_rps": len(all_latencies) / elapsed if elapsed else 0.0,
+        **{f"p{p}_ms": percentile(all_latencies, p) * 1000 for p in (50, 95, 99)},
+    }
+    return {"routes": routes, "overall": overall}
+
+
+async def list_tasks(client, ctx, rng, rec):
+    await rec.call("GET /tasks/", client.get("/tasks/", params={"limit": 20}, headers=ctx.headers))
+
+
+async def filter_tasks(client, ctx, rng, rec):
+    params = {"limit": 20, "status_filter": rng.choice(["todo", "in_progress", "done"])}
+    if rng.random() < 0.5:
+        params["project_id"] = rng.choice(ctx.project_ids)
+    if rng.random() < 0.3:
+        params["priority_filter"] = rng.choice(["low", "medium", "high"])
+    await rec.call("GET /tasks/ (filter)", client.get("/tasks/", params=params, headers=ctx.headers))
+
+
+async def sort_tasks(client, ctx, rng, rec):
+    params = {"limit": 20, "sort": rng.choice(["due_date", "-due_date", "priority", "-priority", "created_at"])}
+    await rec.call("GET /tasks/ (sort)", client.get("/tasks/", params=params, headers=ctx.headers))
+
+
+async def deep_page(client, ctx, rng, rec):
+    """Follow next_cursor several pages deep, then compare with a deep offset page."""
+    params = {"limit": 50, "total_mode": "none"}
+    for _ in range(5):
+        response = await rec.call("GET /tasks/ (cursor)", client.get("/tasks/", params=params, headers=ctx.headers))
+        if response is None or response.status_code != 200 or not response.json().get("next_cursor"):
+            break
+        params["cursor"] = response.json()["next_cursor"]
+    offset = {"limit": 50, "offset": rng.randrange(1000, 5000), "total_mode": "none"}
+    await rec.call("GET /tasks/ (deep offset)", client.get("/tasks/", params=offset, headers=ctx.headers))
+
+
+async def search_tasks(client, ctx, rng, rec):
+    await rec.call("GET /tasks/ (search)", client.get("/tasks/", params={"q": rng.choice(WORDS)[:4]}, headers=ctx.headers))
+
+
+async def list_projects(client, ctx, rng, rec):
+    await rec.call("GET /projects/", client.get("/projects/", params={"limit": 20}, headers=ctx.headers))
+
+
+async def project_stats(client, ctx, rng, rec):
+    await rec.call("GET /projects/stats", client.get("/projects/stats", headers=ctx.headers))
+
+
+async def create_task(client, ctx, rng, rec):
+    body = {
+        "title": f"bench task {uuid.uuid4().hex[:8]}",
+        "project_id": rng.choice(ctx.project_ids),
+        "priority": rng.choice(["low", "medium", "high"]),
+        "due_date": (datetime.now(timezone.utc) + timedelta(days=rng.randrange(1, 30))).isoformat(),
+    }
+    response = await rec.call("POST /tasks/", client.post("/tasks/", json=body, headers=ctx.headers))
+    if response is not None and response.status_code == 201:
+        ctx.created_task_ids.append(response.json()["id"])
+
+
+async def update_task(client, ctx, rng, rec):
+    if not ctx.created_task_ids:
+        return await create_task(client, ctx, rng, rec)
+    task_id = rng.choice(ctx.created_task_ids)
+    body = {"status": rng.choice(["todo", "in_progress", "done"])}
+    await rec.call("PUT /tasks/{id}", client.put(f"/tasks/{task_id}", json=body, headers=ctx.headers))
+
+
+async def login(client, ctx, rng, rec):
+    form = {"username": ctx.email, "password": ctx.password}
+    await rec.call("POST /auth/login", client.post("/auth/login", data=form))
+
+
+SCENARIOS: dict[str, Scenario] = {
+    fn.__name__: fn
+    for fn in (
+        list_tasks, filter_tasks, sort_tasks, deep_page, search_tasks, list_projects, project_stats,
+        create_task, update_task, login,
+    )
+}
+
+
+async def authenticate(client: httpx.AsyncClient, manifest: dict, limit: int) -> list[TenantContext]:
+    contexts = []
+    for tenant in manifest["tenants"][:limit]:
+        response = await client.post("/auth/login", data={"username": tenant["email"], "password": manifest["password"]})
+        response.raise_for_status()
+        contexts.append(
+            TenantContext(tenant["email"], manifest["password"], response.json()["access_token"], tenant["project_ids"])
+        )
+    return contexts
+
+
+async def worker(client, contexts, mix, rng, recorder, deadline) -> None:
+    names, weights = list(mix), list(mix.values())
+    while time.perf_counter() < deadline:
+        scenario = SCENARIOS[rng.choices(names, weights)[0]]
+        await scenario(client, rng.choice(contexts), rng, recorder)
+
+
+async def run(args: argparse.Namespace) -> dict:
+    from app.api.main import create_app
+    from app.api.response_cache import response_cache
+    from app.infrastructure.admission import admission
+
+    with open(args.manifest) as fh:
+        manifest = json.load(fh)
+    if args.no_response_cache:
+        response_cache.maxsize = 0
+    if not args.admission:
+        # Measure capacity, not the per-tenant rate limits.
+        admission.rate = admission.tenant_max_concurrent = admission.max_concurrent = admission.max_pool_wait = 0
+
+    mix = MIXES[args.mix]
+    transport = httpx.ASGITransport(app=create_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+        contexts = await authenticate(client, manifest, args.tenants)
+        if args.warmup > 0:
+            await asyncio.gather(*[
+                worker(client, contexts, mix, random.Random(args.seed - i), Recorder(), time.perf_counter() + args.warmup)
+                for i in range(args.concurrency)
+            ])
+
+        recorder = Recorder()
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(*[
+            worker(client, contexts, mix, random.Random(args.seed + i), recorder, deadline)
+            for i in range(args.concurrency)
+        ])
+        elapsed = time.perf_counter() - started
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "mix": args.mix,
+            "weights": mix,
+            "duration_s": elapsed,
+            "concurrency": args.concurrency,
+            "tenants": len(contexts),
+            "response_cache": not args.no_response_cache,
+            "admission": args.admission,
+        },
+        **summarize(recorder, elapsed),
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_report(result: dict) -> None:
+    meta = result["meta"]
+    print(f"mix={meta['mix']} concurrency={meta['concurrency']} duration={meta['duration_s']:.1f}s")
+    print(f"{'route':<28} {'reqs':>7} {'err':>5} {'rps':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for route, s in {**result["routes"], "overall": result["overall"]}.items():
+        print(
+            f"{route:<28} {s['requests']:>7} {s['errors']:>5} {s['throughput_rps']:>8.1f} "
+            f"{s['p50_ms']:>8.1f} {s['p95_ms']:>8.1f} {s['p99_ms']:>8.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--manifest", default="bench_manifest.json")
+    parser.add_argument("--mix", choices=sorted(MIXES), default="default")
+    parser.add_argument("--duration", type=float, default=30, help="measured seconds")
+    parser.add_argument("--warmup", type=float, default=3, help="unmeasured seconds before the run")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--tenants", type=int, default=10, help="tenants from the manifest to use")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--no-response-cache", action="store_true", help="measure uncached list queries")
+    parser.add_argument("--admission", action="store_true", help="keep admission control limits (429/503) enabled")
+    parser.add_argument("--out", help="write the JSON result to this file")
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args))
+    print_report(result)
+    if args.out:
+        with open(args.out, "w") as fh:
+            json.dump(result, fh, indent=2)
+        print(f"results written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
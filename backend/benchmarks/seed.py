@@ -0,0 +1,154 @@
+"""Bulk-load a synthetic multi-tenant dataset for load benchmarks.
+
+Creates N tenants, each with one user, M projects per tenant and K tasks
+per project, streamed through ``COPY`` so millions of tasks load in
+seconds. Task fields follow rough real-world shapes: most tasks are todo
+or in progress, about 60% have due dates, and creation times spread over
+the past year. Statement-level triggers keep ``project_stats`` in step as
+the tasks are copied in.
+
+A manifest with each tenant's login and a sample of project ids is written
+for ``benchmarks.load``.
+
+Usage (from ``backend/``, against a migrated database in DATABASE_URL):
+
+    python -m benchmarks.seed --tenants 10 --projects 20 --tasks 500 [--reset] [--manifest bench_manifest.json]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import asyncpg
+
+from app.domain.entities import PRIORITY_ORDINALS
+from app.infrastructure.config import get_settings
+from app.infrastructure.security.password import hash_password
+
+TENANT_PREFIX = "bench-"
+STATUSES = ["todo"] * 5 + ["in_progress"] * 3 + ["done"] * 2
+WORDS = (
+    "api billing cache deploy docs export fix login migrate onboarding payments queue refactor release "
+    "report review search security signup sync test upgrade"
+).split()
+
+
+def asyncpg_dsn(url: str) -> str:
+    """Turn a SQLAlchemy URL (``postgresql+asyncpg://``) into a plain libpq DSN."""
+    return url.replace("+asyncpg", "", 1)
+
+
+def title(rng: random.Random, i: int) -> str:
+    return f"{rng.choice(WORDS).capitalize()} {rng.choice(WORDS)} {rng.choice(WORDS)} #{i}"
+
+
+def task_records(rng: random.Random, tenant_id: uuid.UUID, project_id: uuid.UUID, count: int, now: datetime):
+    for i in range(count):
+        created_at = now - timedelta(seconds=rng.randrange(365 * 24 * 3600))
+        due_date = created_at + timedelta(days=rng.randrange(1, 90)) if rng.random() < 0.6 else None
+        yield (
+            uuid.uuid4(),
+            title(rng, i),
+            rng.choice(STATUSES),
+            f"user{rng.randrange(20)}@example.com" if rng.random() < 0.7 else None,
+            rng.choice(list(PRIORITY_ORDINALS.values())),
+            due_date,
+            project_id,
+            tenant_id,
+            created_at,
+        )
+
+
+async def reset(conn: asyncpg.Connection) -> None:
+    # Users, projects, tasks and stats go with their tenant via ON DELETE CASCADE.
+    await conn.execute("DELETE FROM tenant WHERE name LIKE $1", TENANT_PREFIX + "%")
+
+
+async def seed(args: argparse.Namespace) -> dict:
+    rng = random.Random(args.seed)
+    now = datetime.utcnow()
+    hashed = hash_password(args.password)
+    conn = await asyncpg.connect(asyncpg_dsn(args.database_url or get_settings().database_url_async))
+    manifest = {"password": args.password, "tenants": []}
+    started = time.perf_counter()
+    try:
+        if args.reset:
+            await reset(conn)
+        run = uuid.uuid4().hex[:8]
+        tenants, users, projects = [], [], []
+        for t in range(args.tenants):
+            tenant_id = uuid.uuid4()
+            email = f"{TENANT_PREFIX}{run}-{t}@example.com"
+            tenants.append((tenant_id, f"{TENANT_PREFIX}{run}-{t}", now))
+            users.append((uuid.uuid4(), email, hashed, True, tenant_id, now))
+            project_ids = [uuid.uuid4() for _ in range(args.projects)]
+            projects.extend(
+                (pid, f"{rng.choice(WORDS).capitalize()} project {p}", None, tenant_id, now - timedelta(days=p))
+                for p, pid in enumerate(project_ids)
+            )
+            manifest["tenants"].append(
+                {"tenant_id": str(tenant_id), "email": email, "project_ids": [str(p) for p in project_ids[:20]]}
+            )
+
+        await conn.copy_records_to_table("tenant", records=tenants, columns=["id", "name", "created_at"])
+        await conn.copy_records_to_table(
+            "user", records=users,
+            columns=["id", "email", "hashed_password", "is_active", "tenant_id", "created_at"],
+        )
+        await conn.copy_records_to_table(
+            "project", records=projects, columns=["id", "name", "description", "tenant_id", "created_at"]
+        )
+
+        task_columns = ["id", "title", "status", "assignee", "priority", "due_date", "project_id", "tenant_id", "created_at"]
+        total_tasks = 0
+        by_tenant: dict[uuid.UUID, list[uuid.UUID]] = {}
+        for project_id, _, _, tenant_id, _ in projects:
+            by_tenant.setdefault(tenant_id, []).append(project_id)
+        # One COPY per tenant keeps each transition table (and the stats
+        # trigger's aggregate over it) bounded.
+        for tenant_id, project_ids in by_tenant.items():
+            records = (
+                record
+                for project_id in project_ids
+                for record in task_records(rng, tenant_id, project_id, args.tasks, now)
+            )
+            await conn.copy_records_to_table("task", records=records, columns=task_columns)
+            total_tasks += len(project_ids) * args.tasks
+
+        for table in ("tenant", "user", "project", "task", "project_stats"):
+            await conn.execute(f'ANALYZE "{table}"')
+    finally:
+        await conn.close()
+
+    elapsed = time.perf_counter() - started
+    print(
+        f"seeded {args.tenants} tenants, {len(projects)} projects, {total_tasks} tasks "
+        f"in {elapsed:.1f}s ({total_tasks / max(elapsed, 1e-9):,.0f} tasks/s)"
+    )
+    return manifest
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tenants", type=int, default=10)
+    parser.add_argument("--projects", type=int, default=20, help="projects per tenant")
+    parser.add_argument("--tasks", type=int, default=500, help="tasks per project")
+    parser.add_argument("--password", default="bench-password")
+    parser.add_argument("--seed", type=int, default=42, help="random seed for reproducible data")
+    parser.add_argument("--reset", action="store_true", help="delete previously seeded bench tenants first")
+    parser.add_argument("--manifest", default="bench_manifest.json")
+    parser.add_argument("--database-url", help="defaults to DATABASE_URL")
+    args = parser.parse_args()
+
+    manifest = asyncio.run(seed(args))
+    with open(args.manifest, "w") as fh:
+        json.dump(manifest, fh, indent=2)
+    print(f"manifest written to {args.manifest}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Compare list-page serialization paths on real result rows.
+
+``model`` is the previous path: validate every row into ``TaskOut``, build
+``TaskListResponse`` and ``model_dump_json()`` it. ``direct`` is
+``PageSerializer``, which dumps the rows straight to JSON. The two outputs
+are checked to be byte-identical before timing.
+
+Rows come from an in-memory SQLite table with the same column types as the
+list query, so no Postgres is needed.
+
+Usage (from ``backend/``):
+
+    python -m benchmarks.serialization [--rows 100] [--iterations 2000] [--json]
+"""
+
+import argparse
+import json
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import Column, DateTime, MetaData, String, Table, Uuid, create_engine, select
+
+from app.api.routes.tasks import TaskListResponse, TaskOut, task_page_serializer
+from app.infrastructure.db.counting import TotalMode
+
+
+def make_rows(count: int) -> list:
+    metadata = MetaData()
+    table = Table(
+        "task", metadata,
+        Column("id", Uuid), Column("title", String), Column("status", String), Column("assignee", String),
+        Column("priority", String), Column("due_date", DateTime), Column("project_id", Uuid),
+        Column("created_at", DateTime),
+    )
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    now = datetime.utcnow()
+    project_id = uuid.uuid4()
+    with engine.begin() as conn:
+        conn.execute(table.insert(), [
+            {
+                "id": uuid.uuid4(),
+                "title": f"Task {i} with a realistic title",
+                "status": ("todo", "in_progress", "done")[i % 3],
+                "assignee": None if i % 2 else "alice@example.com",
+                "priority": ("low", "medium", "high")[i % 3],
+                "due_date": now + timedelta(days=i) if i % 4 else None,
+                "project_id": project_id,
+                "created_at": now - timedelta(minutes=i),
+            }
+            for i in range(count)
+        ])
+    with engine.connect() as conn:
+        return conn.execute(select(table)).all()
+
+
+def via_models(rows) -> bytes:
+    items = [TaskOut.model_validate(row) for row in rows]
+    return TaskListResponse(
+        total=len(rows), items=items, next_cursor=None, has_more=False, total_mode=TotalMode.exact
+    ).model_dump_json().encode()
+
+
+def via_serializer(rows) -> bytes:
+    return task_page_serializer.dump_json(
+        rows, total=len(rows), next_cursor=None, has_more=False, total_mode=TotalMode.exact
+    )
+
+
+def per_call_us(fn, rows, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn(rows)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--json", action="store_true", help="print JSON instead of a table")
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    assert via_models(rows) == via_serializer(rows), "serializer output differs from the response model"
+
+    results = {
+        "rows": args.rows,
+        "model_us": per_call_us(via_models, rows, args.iterations),
+        "direct_us": per_call_us(via_serializer, rows, args.iterations),
+    }
+    results["speedup"] = results["model_us"] / results["direct_us"]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"rows per page: {args.rows}")
+    print(f"model validate + dump: {results['model_us']:8.1f} us/page")
+    print(f"PageSerializer:        {results['direct_us']:8.1f} us/page")
+    print(f"speedup:               {results['speedup']:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,4 +11,10 @@ autoupgrade() {
 
 autoupgrade
 
+# Multi-worker metrics: stale per-process files from a previous run would be aggregated too
+if [ -n "$PROMETHEUS_MULTIPROC_DIR" ]; then
+  rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+  mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+fi
+
 exec uvicorn app.api.main:app --host 0.0.0.0 --port 12000
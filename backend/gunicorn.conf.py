@@ -0,0 +1,28 @@
+"""Gunicorn settings for running the app with uvicorn workers.
+
+    gunicorn -c gunicorn.conf.py 'app.api.main:create_app()'
+
+With more than one worker, EVENTS_BROKER defaults to ``postgres`` here.
+
+Prometheus multiprocess mode needs PROMETHEUS_MULTIPROC_DIR set to an empty
+directory; ``child_exit`` drops a dead worker's live gauges from the
+aggregate shown on ``/metrics``.
+"""
+
+import os
+
+from prometheus_client import multiprocess
+
+bind = "0.0.0.0:12000"
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = int(os.getenv("WEB_CONCURRENCY", "2"))
+# Workers inherit the environment. Several workers need the postgres broker so
+# writes and user changes reach every worker's caches; the app refuses to
+# start with EVENTS_BROKER=memory and WEB_CONCURRENCY above 1.
+os.environ["WEB_CONCURRENCY"] = str(workers)
+if workers > 1:
+    os.environ.setdefault("EVENTS_BROKER", "postgres")
+
+
+def child_exit(server, worker):
+    multiprocess.mark_process_dead(worker.pid)
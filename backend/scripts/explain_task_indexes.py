@@ -0,0 +1,123 @@
+"""Report which index PostgreSQL picks for each list_tasks filter/sort combination.
+
+Builds the same queries as ``GET /tasks/`` (via ``filtered_tasks_query`` and
+the keyset ordering), runs ``EXPLAIN (FORMAT JSON)`` for each and prints the
+indexes used, whether an explicit Sort node was needed, and whether the
+plan fell back to a sequential scan.
+
+Usage (from ``backend/``, with SYNC_DATABASE_URL set):
+
+    python -m scripts.explain_task_indexes [--tenant-id UUID] [--project-id UUID] [--analyze] [--json]
+
+Without ``--tenant-id`` the tenant with the most tasks is used, since small
+tenants can legitimately be planned as sequential scans.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, func, select
+
+from app.api.routes.tasks import PriorityEnum, SORT_COLUMNS, StatusEnum, filtered_tasks_query
+from app.infrastructure.db.models import Task
+from app.infrastructure.db.pagination import keyset_order
+
+FILTERS = {
+    "none": {},
+    "project": {"project_id": True},
+    "status": {"status_filter": StatusEnum.todo},
+    "priority": {"priority_filter": PriorityEnum.high},
+    "project+status": {"project_id": True, "status_filter": StatusEnum.todo},
+    "project+priority": {"project_id": True, "priority_filter": PriorityEnum.high},
+    "due_range": {"due_before": True, "due_after": True},
+    "project+due_range": {"project_id": True, "due_before": True, "due_after": True},
+}
+SORTS = ["-created_at", "created_at", "due_date", "-due_date", "priority", "-priority"]
+
+
+def _walk(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _walk(child)
+
+
+def summarize(plan: dict) -> dict:
+    nodes = list(_walk(plan))
+    return {
+        "indexes": sorted({n["Index Name"] for n in nodes if "Index Name" in n}),
+        "sort_node": any(n["Node Type"] in ("Sort", "Incremental Sort") for n in nodes),
+        "seq_scan": any(n["Node Type"] == "Seq Scan" for n in nodes),
+        "cost": plan.get("Total Cost"),
+        "actual_ms": plan.get("Actual Total Time"),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tenant-id", type=uuid.UUID)
+    parser.add_argument("--project-id", type=uuid.UUID)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--analyze", action="store_true", help="run EXPLAIN ANALYZE (executes the queries)")
+    parser.add_argument("--json", action="store_true", help="print JSON instead of a table")
+    args = parser.parse_args()
+
+    engine = create_engine(os.environ["SYNC_DATABASE_URL"])
+    with engine.connect() as conn:
+        tenant_id, project_id = args.tenant_id, args.project_id
+        if tenant_id is None:
+            tenant_id = conn.execute(
+                select(Task.tenant_id).group_by(Task.tenant_id).order_by(func.count().desc()).limit(1)
+            ).scalar_one()
+        if project_id is None:
+            project_id = conn.execute(
+                select(Task.project_id)
+                .where(Task.tenant_id == tenant_id)
+                .group_by(Task.project_id)
+                .order_by(func.count().desc())
+                .limit(1)
+            ).scalar_one()
+
+        now = datetime.utcnow()
+        explain = "EXPLAIN (ANALYZE, FORMAT JSON)" if args.analyze else "EXPLAIN (FORMAT JSON)"
+        report = []
+        for (name, spec), sort in itertools.product(FILTERS.items(), SORTS):
+            kwargs = dict(spec)
+            if kwargs.get("project_id"):
+                kwargs["project_id"] = project_id
+            if kwargs.get("due_before"):
+                kwargs["due_before"] = now + timedelta(days=7)
+            if kwargs.get("due_after"):
+                kwargs["due_after"] = now - timedelta(days=7)
+
+            desc = sort.startswith("-")
+            column = SORT_COLUMNS[sort.lstrip("-")]
+            query = (
+                filtered_tasks_query(tenant_id, **kwargs)
+                .order_by(*keyset_order(column, Task.id, desc))
+                .limit(args.limit + 1)
+            )
+            sql = query.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True})
+            plan = conn.exec_driver_sql(f"{explain} {sql}").scalar_one()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            report.append({"filters": name, "sort": sort, **summarize(plan[0]["Plan"])})
+
+    if args.json:
+        print(json.dumps({"tenant_id": str(tenant_id), "project_id": str(project_id), "plans": report}, indent=2))
+        return
+
+    print(f"tenant={tenant_id} project={project_id}")
+    print(f"{'filters':<20} {'sort':<12} {'sort node':<10} {'seq scan':<9} indexes")
+    for row in report:
+        print(
+            f"{row['filters']:<20} {row['sort']:<12} {'yes' if row['sort_node'] else 'no':<10} "
+            f"{'yes' if row['seq_scan'] else 'no':<9} {', '.join(row['indexes']) or '-'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
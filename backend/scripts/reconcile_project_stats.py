@@ -0,0 +1,32 @@
+"""Recount project_stats from task and repair drifted rows.
+
+The app already does this every STATS_RECONCILE_INTERVAL_SECONDS; run this
+after bulk maintenance (restores, manual SQL with triggers disabled) or
+from cron when the in-app job is disabled.
+
+Usage (from ``backend/``, with DATABASE_URL set):
+
+    python -m scripts.reconcile_project_stats
+"""
+
+import asyncio
+import logging
+
+from app.infrastructure.db.session import AsyncSessionLocal, dispose_engines
+from app.infrastructure.db.stats import reconcile_project_stats
+
+
+async def main() -> None:
+    try:
+        repaired = await reconcile_project_stats(AsyncSessionLocal)
+    finally:
+        await dispose_engines()
+    if repaired is None:
+        print("another reconcile is running; nothing done")
+    else:
+        print(f"repaired {repaired} project_stats row(s)")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
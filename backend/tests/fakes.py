@@ -0,0 +1,84 @@
+"""Stand-ins for an ``AsyncSession`` and its results, shared by the unit tests.
+
+The code under test only reads results through a handful of ``Result``
+methods, so one canned value serves all of them: a row, a scalar, or a
+list of rows depending on what the test hands it.
+"""
+
+from sqlalchemy.dialects.postgresql import asyncpg
+
+
+def compile_pg(statement) -> str:
+    """Render ``statement`` as the asyncpg driver would send it."""
+    return str(statement.compile(dialect=asyncpg.dialect()))
+
+
+class FakeRow:
+    """A row readable by attribute and through ``_mapping``."""
+
+    def __init__(self, **values):
+        self.__dict__.update(values)
+
+    @property
+    def _mapping(self):
+        return vars(self)
+
+
+class FakeResult:
+    def __init__(self, value=None, rowcount=0):
+        self.value = value
+        self.rowcount = rowcount
+
+    def one_or_none(self):
+        return self.value
+
+    def scalar_one_or_none(self):
+        return self.value
+
+    def scalar_one(self):
+        return self.value
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.value if self.value is not None else []
+
+    def __iter__(self):
+        return iter(self.all())
+
+
+class FakeSession:
+    """Replays canned results in order and records the SQL executed."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.statements = []
+        self.committed = False
+
+    async def execute(self, statement):
+        self.statements.append(compile_pg(statement))
+        return self.results.pop(0) if self.results else FakeResult()
+
+    async def commit(self):
+        self.committed = True
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class CapturingSession:
+    """Answers every statement with the same rows and keeps the statement objects."""
+
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.statements = []
+        self.params = []
+
+    async def execute(self, statement, params=None):
+        self.statements.append(statement)
+        self.params.append(params)
+        return FakeResult(self.rows)
@@ -0,0 +1,109 @@
+import uuid
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import dependencies
+from app.infrastructure.admission import AdmissionController, Overloaded, TenantThrottled, TokenBucket
+from app.infrastructure.db.instrumentation import TimedAsyncAdaptedQueuePool
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def controller(clock=None, pool_wait=0.0, **limits) -> AdmissionController:
+    options = {"rate": 0, "burst": 1, "tenant_max_concurrent": 0, "max_concurrent": 0, "max_pool_wait": 0}
+    options.update(limits)
+    return AdmissionController(pool_wait=lambda: pool_wait, clock=clock or Clock(), **options)
+
+
+def test_token_bucket_refills_at_rate():
+    bucket = TokenBucket(rate=2, burst=2, now=0)
+    assert bucket.take(0) == 0 and bucket.take(0) == 0
+    assert bucket.take(0) == pytest.approx(0.5)
+    assert bucket.take(0.5) == 0
+    assert bucket.take(100) == 0 and bucket.tokens == pytest.approx(1)
+
+
+def test_tenant_rate_limit_is_per_tenant():
+    clock = Clock()
+    admission = controller(clock, rate=1, burst=2)
+    noisy, quiet = uuid.uuid4(), uuid.uuid4()
+
+    admission.admit(noisy)
+    admission.admit(noisy)
+    with pytest.raises(TenantThrottled) as rejected:
+        admission.admit(noisy)
+    assert rejected.value.reason == "tenant_rate" and rejected.value.retry_after == pytest.approx(1)
+    admission.admit(quiet)
+
+    clock.now = 1.0
+    admission.admit(noisy)
+
+
+def test_concurrency_caps_release_slots():
+    admission = controller(tenant_max_concurrent=2, max_concurrent=3)
+    a, b = uuid.uuid4(), uuid.uuid4()
+
+    admission.admit(a)
+    admission.admit(a)
+    with pytest.raises(TenantThrottled, match="tenant_concurrency"):
+        admission.admit(a)
+    admission.admit(b)
+    with pytest.raises(Overloaded, match="concurrency"):
+        admission.admit(b)
+
+    admission.release(a)
+    admission.admit(b)
+    for tenant in (a, b, b):
+        admission.release(tenant)
+    assert admission.in_flight == 0 and admission._active == {}
+
+
+def test_sheds_when_pool_wait_exceeds_threshold():
+    with pytest.raises(Overloaded) as rejected:
+        controller(pool_wait=2.5, max_pool_wait=0.5).admit(uuid.uuid4())
+    assert rejected.value.reason == "pool_wait" and rejected.value.retry_after == 2.5
+    controller(pool_wait=0.1, max_pool_wait=0.5).admit(uuid.uuid4())
+
+
+def test_pool_wait_estimate_only_counts_when_exhausted(monkeypatch):
+    pool = TimedAsyncAdaptedQueuePool(lambda: None, pool_size=2, max_overflow=1)
+    pool.wait_ewma = 0.8
+    assert pool.estimated_wait() == 0.0
+
+    monkeypatch.setattr(pool, "checkedout", lambda: 3)
+    assert pool.estimated_wait() == 0.8
+    pool._waiting.append(0.0)  # a checkout that has been waiting since perf_counter() == 0
+    assert pool.estimated_wait() > 0.8
+
+
+def test_rejections_map_to_429_and_503(monkeypatch):
+    tenant_id = uuid.uuid4()
+    admission = controller(rate=1, burst=1)
+    monkeypatch.setattr(dependencies, "admission", admission)
+
+    app = FastAPI()
+    app.dependency_overrides[dependencies.get_current_tenant_id] = lambda: tenant_id
+
+    @app.get("/work", dependencies=[Depends(dependencies.admit_tenant_request)])
+    async def work():
+        return {"in_flight": admission.in_flight}
+
+    client = TestClient(app)
+    assert client.get("/work").json() == {"in_flight": 1}
+    assert admission.in_flight == 0
+
+    throttled = client.get("/work")
+    assert throttled.status_code == 429 and throttled.headers["retry-after"] == "1"
+
+    admission.rate, admission.max_pool_wait = 0, 0.5
+    admission._pool_wait = lambda: 3.2
+    shed = client.get("/work")
+    assert shed.status_code == 503 and shed.headers["retry-after"] == "4"
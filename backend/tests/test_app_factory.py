@@ -0,0 +1,106 @@
+import asyncio
+import subprocess
+import sys
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import main
+from app.infrastructure.db import warmup
+
+
+class FakeConnection:
+    def __init__(self, engine):
+        self.engine = engine
+
+    async def __aenter__(self):
+        if self.engine.fail_after is not None and self.engine.opened >= self.engine.fail_after:
+            raise ConnectionRefusedError("database down")
+        self.engine.opened += 1
+        self.engine.open_now += 1
+        self.engine.peak = max(self.engine.peak, self.engine.open_now)
+        await asyncio.sleep(0)
+        return self
+
+    async def __aexit__(self, *exc):
+        self.engine.open_now -= 1
+
+
+class FakeEngine:
+    def __init__(self, fail_after=None):
+        self.fail_after = fail_after
+        self.opened = self.open_now = self.peak = 0
+
+    def connect(self):
+        return FakeConnection(self)
+
+
+@pytest.fixture
+def fresh_readiness(monkeypatch):
+    state = warmup.Readiness()
+    monkeypatch.setattr(warmup, "readiness", state)
+    return state
+
+
+def test_import_defers_routes_models_and_auth_libraries():
+    code = (
+        "import sys, app.api.main; "
+        "print(sorted(m for m in ('app.api.routes.tasks', 'app.infrastructure.db.models', "
+        "'app.infrastructure.db.session', 'jose', 'passlib') if m in sys.modules))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert out.strip() == "[]"
+
+
+def test_module_app_is_built_once_on_access():
+    app = main.app
+    assert isinstance(app, FastAPI)
+    assert main.app is app
+    assert {"/", "/ready", "/tasks/", "/projects/"} <= {route.path for route in app.routes}
+
+
+@pytest.mark.asyncio
+async def test_warm_pool_holds_connections_open_together(monkeypatch):
+    primed = []
+
+    async def prime(conn):
+        primed.append(conn)
+
+    monkeypatch.setattr(warmup, "prime_connection", prime)
+    engine = FakeEngine()
+    assert await warmup.warm_pool(engine, 4) == 4
+    assert engine.peak == 4 and engine.open_now == 0
+    assert len(primed) == 4
+
+
+@pytest.mark.asyncio
+async def test_failed_warm_up_releases_connections_and_retries(monkeypatch, fresh_readiness):
+    monkeypatch.setattr(warmup, "prime_connection", lambda conn: asyncio.sleep(0))
+    engine = FakeEngine(fail_after=2)
+
+    with pytest.raises(ConnectionRefusedError):
+        await warmup.warm_pool(engine, 3)
+    assert engine.open_now == 0
+
+    warmer = asyncio.create_task(warmup.run_pool_warmer(engine, 3, retry_seconds=0.01))
+    await asyncio.sleep(0.03)
+    assert not fresh_readiness.ready and "database down" in fresh_readiness.error
+
+    engine.fail_after = None
+    await asyncio.wait_for(warmer, 1)
+    assert fresh_readiness.snapshot()["status"] == "ready"
+    assert fresh_readiness.warm_connections == 3
+
+
+def test_ready_endpoint_reflects_warm_up(monkeypatch, fresh_readiness):
+    monkeypatch.setattr("app.api.routes.health.readiness", fresh_readiness)
+    client = TestClient(main.create_app())
+
+    response = client.get("/ready")
+    assert response.status_code == 503 and response.json()["status"] == "warming"
+
+    fresh_readiness.mark_ready(5, 0.25)
+    response = client.get("/ready")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ready", "warm_connections": 5, "warmup_ms": 250.0, "error": None}
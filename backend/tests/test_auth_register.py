@@ -0,0 +1,56 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError
+
+from app.api.routes import auth
+
+from fakes import FakeResult
+
+
+class RacingSession:
+    """The pre-check finds no user, but another signup commits the email before this one."""
+
+    def __init__(self, winner_id):
+        self.lookups = [FakeResult(None), FakeResult(winner_id)]
+        self.rolled_back = 0
+
+    async def execute(self, statement):
+        return self.lookups.pop(0)
+
+    def add(self, obj):
+        pass
+
+    async def flush(self):
+        pass
+
+    async def commit(self):
+        raise IntegrityError("INSERT INTO users", {}, Exception("duplicate key value violates unique constraint"))
+
+    async def rollback(self):
+        self.rolled_back += 1
+
+
+@pytest.fixture(autouse=True)
+def fast_hash(monkeypatch):
+    async def hash_password(password):
+        return "hashed"
+
+    monkeypatch.setattr(auth, "hash_password_async", hash_password)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_signup_with_same_email_is_400_not_500():
+    session = RacingSession(winner_id="someone-else")
+    request = auth.RegisterRequest(email="a@example.com", password="secret", tenant_name="acme")
+    with pytest.raises(HTTPException) as exc:
+        await auth.register(request, session)
+    assert exc.value.status_code == 400 and exc.value.detail == "Email already registered"
+    assert session.rolled_back == 2
+
+
+@pytest.mark.asyncio
+async def test_other_integrity_errors_are_not_reported_as_taken_email():
+    session = RacingSession(winner_id=None)
+    request = auth.RegisterRequest(email="b@example.com", password="secret", tenant_name="taken-name")
+    with pytest.raises(IntegrityError):
+        await auth.register(request, session)
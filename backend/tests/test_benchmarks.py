@@ -0,0 +1,51 @@
+from benchmarks.cold_start import regressions, summarize_runs
+from benchmarks.compare import compare
+from benchmarks.load import Recorder, percentile, summarize
+from benchmarks.seed import asyncpg_dsn
+
+
+def test_nearest_rank_percentiles():
+    values = [i / 1000 for i in range(1, 101)]
+    assert percentile(values, 50) == 0.05
+    assert percentile(values, 99) == 0.099
+    assert percentile([0.2], 95) == 0.2
+    assert percentile([], 50) == 0.0
+
+
+def test_summarize_counts_errors_per_route():
+    recorder = Recorder()
+    recorder.latencies["GET /tasks/"] = [0.010, 0.020, 0.030]
+    recorder.errors["POST /tasks/"] = 2
+    result = summarize(recorder, elapsed=3.0)
+    assert result["routes"]["GET /tasks/"]["throughput_rps"] == 1.0
+    assert result["routes"]["GET /tasks/"]["p50_ms"] == 20.0
+    assert result["routes"]["POST /tasks/"] == {
+        "requests": 0, "errors": 2, "throughput_rps": 0.0, "p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0,
+    }
+    assert result["overall"]["requests"] == 3 and result["overall"]["errors"] == 2
+
+
+def result(p95, rps, requests=500):
+    stats = {"requests": requests, "p95_ms": p95, "p99_ms": p95, "throughput_rps": rps}
+    return {"routes": {"GET /tasks/": stats}, "overall": stats}
+
+
+def test_compare_flags_latency_and_throughput_regressions():
+    base = result(p95=10.0, rps=100.0)
+    assert not any(r["regressed"] for r in compare(base, result(10.5, 97.0), threshold=10, min_requests=50))
+    assert all(r["regressed"] for r in compare(base, result(12.0, 100.0), threshold=10, min_requests=50))
+    assert all(r["regressed"] for r in compare(base, result(10.0, 80.0), threshold=10, min_requests=50))
+    # Too few samples to trust.
+    assert not any(r["regressed"] for r in compare(base, result(50.0, 10.0, requests=5), threshold=10, min_requests=50))
+
+
+def test_asyncpg_dsn_strips_driver():
+    assert asyncpg_dsn("postgresql+asyncpg://u:p@h/db") == "postgresql://u:p@h/db"
+
+
+def test_cold_start_summary_and_regressions():
+    phases = summarize_runs([{"import": 300.0, "startup": 50.0}, {"import": 320.0, "startup": 70.0}])
+    assert phases["import"] == {"runs": 2, "p50_ms": 300.0, "max_ms": 320.0}
+    baseline = {"phases": phases}
+    slower = {"phases": {"import": {"p50_ms": 390.0}, "startup": {"p50_ms": 52.0}, "first GET /": {"p50_ms": 9.0}}}
+    assert regressions(baseline, slower, threshold=20) == ["import"]
@@ -0,0 +1,67 @@
+import uuid
+import pytest
+from pydantic import ValidationError
+
+from app.api.routes.tasks import BulkModeEnum, BulkTaskRequest, plan_bulk
+
+
+def test_bulk_request_parses_operations_by_kind():
+    project_id, task_id = uuid.uuid4(), uuid.uuid4()
+    req = BulkTaskRequest(
+        mode="best_effort",
+        operations=[
+            {"op": "create", "data": {"title": "A", "project_id": str(project_id)}},
+            {"op": "update", "id": str(task_id), "data": {"status": "done"}},
+            {"op": "delete", "id": str(task_id)},
+        ],
+    )
+    assert req.mode is BulkModeEnum.best_effort
+    assert [op.op for op in req.operations] == ["create", "update", "delete"]
+
+    with pytest.raises(ValidationError):
+        BulkTaskRequest(operations=[{"op": "update", "data": {}}])
+    with pytest.raises(ValidationError):
+        BulkTaskRequest(operations=[])
+
+
+def test_plan_groups_valid_operations_and_reports_failures():
+    tenant_id, project_id, other_project = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    task_id, missing_task = uuid.uuid4(), uuid.uuid4()
+    req = BulkTaskRequest(
+        operations=[
+            {"op": "create", "data": {"title": "A", "project_id": str(project_id), "priority": "high"}},
+            {"op": "create", "data": {"title": "B", "project_id": str(other_project)}},
+            {"op": "update", "id": str(task_id), "data": {"title": "renamed"}},
+            {"op": "delete", "id": str(missing_task)},
+        ],
+    )
+
+    plan = plan_bulk(req.operations, tenant_id, {project_id}, {task_id})
+
+    assert plan.failed
+    assert [r.status for r in plan.results] == [201, 404, 200, 404]
+    assert len(plan.inserts) == 1
+    assert plan.inserts[0]["priority"] == "high" and plan.inserts[0]["tenant_id"] == tenant_id
+    assert plan.results[0].id == plan.inserts[0]["id"]
+    assert plan.updates == [{"id": task_id, "tenant_id": tenant_id, "title": "renamed"}]
+    assert plan.delete_ids == []
+
+
+def test_plan_rejects_later_operations_on_the_same_task():
+    tenant_id, task_id, other_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    req = BulkTaskRequest(
+        mode="best_effort",
+        operations=[
+            {"op": "delete", "id": str(task_id)},
+            {"op": "update", "id": str(task_id), "data": {"title": "too late"}},
+            {"op": "delete", "id": str(task_id)},
+            {"op": "update", "id": str(other_id), "data": {"status": "done"}},
+        ],
+    )
+
+    plan = plan_bulk(req.operations, tenant_id, set(), {task_id, other_id})
+
+    assert plan.failed
+    assert [r.status for r in plan.results] == [204, 409, 409, 200]
+    assert plan.delete_ids == [task_id]
+    assert plan.updates == [{"id": other_id, "tenant_id": tenant_id, "status": "done"}]
@@ -0,0 +1,60 @@
+import uuid
+import pytest
+from datetime import datetime
+
+from app.api.routes.tasks import resolve_sort
+from app.infrastructure.db.models import Task
+from app.infrastructure.db.pagination import decode_cursor, encode_cursor, keyset_after, next_cursor
+
+from fakes import FakeRow, compile_pg
+
+
+def test_cursor_roundtrip_datetime_and_none():
+    row_id = uuid.uuid4()
+    now = datetime(2025, 8, 20, 12, 30, 0, 123456)
+
+    token = encode_cursor("-created_at", now, row_id)
+    assert decode_cursor(token, "-created_at") == (now, row_id)
+
+    token = encode_cursor("due_date", None, row_id)
+    assert decode_cursor(token, "due_date") == (None, row_id)
+
+
+def test_cursor_rejects_other_sort_and_garbage():
+    token = encode_cursor("priority", "high", uuid.uuid4())
+    with pytest.raises(ValueError):
+        decode_cursor(token, "-priority")
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor", "priority")
+
+
+def test_next_cursor_only_when_more_rows():
+    rows = [FakeRow(id=uuid.uuid4(), created_at=datetime(2025, 1, d)) for d in (3, 2, 1)]
+
+    page, token = next_cursor(rows, 3, "-created_at", "created_at")
+    assert page == rows and token is None
+
+    page, token = next_cursor(rows, 2, "-created_at", "created_at")
+    assert page == rows[:2]
+    assert decode_cursor(token, "-created_at") == (rows[1].created_at, rows[1].id)
+
+
+def test_keyset_predicates():
+    row_id = uuid.uuid4()
+    now = datetime.utcnow()
+
+    sql = compile_pg(keyset_after(Task.created_at, Task.id, now, row_id, desc=True))
+    assert "(task.created_at, task.id) <" in sql
+
+    sql = compile_pg(keyset_after(Task.due_date, Task.id, now, row_id, desc=False, nullable=True))
+    assert "(task.due_date, task.id) >" in sql and "task.due_date IS NULL" in sql
+
+    sql = compile_pg(keyset_after(Task.due_date, Task.id, None, row_id, desc=True, nullable=True))
+    assert "task.due_date IS NOT NULL" in sql
+
+
+def test_resolve_sort_defaults():
+    assert resolve_sort(None) == ("created_at", True)
+    assert resolve_sort("-due_date") == ("due_date", True)
+    assert resolve_sort("priority") == ("priority", False)
+    assert resolve_sort("unknown") == ("created_at", True)
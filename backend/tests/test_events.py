@@ -0,0 +1,147 @@
+import asyncio
+import json
+import time
+import uuid
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from app.api.routes import events as events_routes
+from app.infrastructure import events, tenant_writes
+from app.infrastructure.events import Event, InMemoryBroker, PostgresBroker
+from app.infrastructure.security.jwt import Principal
+
+
+def principal(tenant_id, ttl=3600):
+    return Principal(user_id=uuid.uuid4(), tenant_id=tenant_id, is_active=True, claims={"exp": time.time() + ttl})
+
+
+@pytest.mark.asyncio
+async def test_events_reach_only_the_tenants_subscribers():
+    broker = InMemoryBroker(queue_size=10)
+    a, b = uuid.uuid4(), uuid.uuid4()
+    async with broker.subscribe(a) as sub_a, broker.subscribe(b) as sub_b:
+        broker.publish(a, Event("task.created", {"id": "1"}))
+        assert await sub_a.get(1) == Event("task.created", {"id": "1"})
+        assert await sub_b.get(0.01) is None
+    assert broker._subscribers == {}
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_gets_resync_instead_of_backlog():
+    broker = InMemoryBroker(queue_size=3)
+    tenant_id = uuid.uuid4()
+    async with broker.subscribe(tenant_id) as subscription:
+        for i in range(5):
+            broker.publish(tenant_id, Event("task.updated", {"id": str(i)}))
+        assert await subscription.get(1) == events.RESYNC
+        assert await subscription.get(1) == Event("task.updated", {"id": "4"})
+
+
+@pytest.mark.asyncio
+async def test_postgres_broker_relays_other_workers_and_skips_its_own():
+    broker = PostgresBroker("postgresql://unused", queue_size=10)
+    remote = []
+    broker._on_remote = remote.append
+    broker._outbox = asyncio.Queue()
+    tenant_id = uuid.uuid4()
+
+    async with broker.subscribe(tenant_id) as subscription:
+        broker.publish(tenant_id, Event("task.updated", {"id": "1", "project_id": "p", "title": "x" * 9000}))
+        assert (await subscription.get(1)).data["title"] == "x" * 9000
+        sent = json.loads(broker._outbox.get_nowait())
+        assert sent["data"] == {"id": "1", "project_id": "p"}
+
+        broker._on_notify(None, 1, events.CHANNEL, json.dumps(sent))
+        assert remote == [] and await subscription.get(0.01) is None
+
+        other = {**sent, "origin": "another-worker"}
+        broker._on_notify(None, 1, events.CHANNEL, json.dumps(other))
+        assert remote == [tenant_id]
+        assert await subscription.get(1) == Event("task.updated", {"id": "1", "project_id": "p"})
+
+
+def test_postgres_broker_relays_invalidations_to_other_workers_only():
+    broker = PostgresBroker("postgresql://unused", queue_size=10)
+    invalidated = []
+    broker._invalidators = {"principal": invalidated.append}
+    broker._outbox = asyncio.Queue()
+    user_id = uuid.uuid4()
+
+    broker.announce("principal", user_id)
+    sent = json.loads(broker._outbox.get_nowait())
+    broker._on_notify(None, 1, events.CHANNEL, json.dumps(sent))
+    assert invalidated == []
+
+    broker._on_notify(None, 1, events.CHANNEL, json.dumps({**sent, "origin": "another-worker"}))
+    assert invalidated == [user_id]
+
+
+@pytest.mark.asyncio
+async def test_sse_stream_frames_events_and_heartbeats(monkeypatch):
+    broker = InMemoryBroker(queue_size=10)
+    monkeypatch.setattr(events_routes, "broker", broker)
+    monkeypatch.setattr(events_routes.settings, "events_heartbeat_seconds", 0.01)
+    tenant_id = uuid.uuid4()
+
+    stream = events_routes.sse_stream(principal(tenant_id))
+    assert await stream.__anext__() == b"retry: 3000\n\n"
+    assert await stream.__anext__() == b": ping\n\n"
+    broker.publish(tenant_id, Event("task.deleted", {"id": "1"}))
+    assert await stream.__anext__() == b'data: {"type":"task.deleted","data":{"id":"1"}}\n\n'
+    await stream.aclose()
+    assert broker._subscribers == {}
+
+
+@pytest.mark.asyncio
+async def test_stream_ends_when_token_expires(monkeypatch):
+    monkeypatch.setattr(events_routes, "broker", InMemoryBroker(queue_size=10))
+    chunks = [chunk async for chunk in events_routes.sse_stream(principal(uuid.uuid4(), ttl=0.05))]
+    assert chunks[0] == b"retry: 3000\n\n" and len(chunks) <= 2
+
+
+def test_websocket_receives_events_published_after_commit(monkeypatch):
+    broker = InMemoryBroker(queue_size=10)
+    monkeypatch.setattr(events_routes, "broker", broker)
+    monkeypatch.setattr(tenant_writes, "broker", broker)
+    tenant_id = uuid.uuid4()
+
+    async def authenticate(ticket):
+        if ticket != "good":
+            raise events_routes.HTTPException(status_code=401)
+        return principal(tenant_id)
+
+    monkeypatch.setattr(events_routes, "authenticate_ticket", authenticate)
+    app = FastAPI()
+    app.include_router(events_routes.router, prefix="/events")
+
+    @app.post("/touch")
+    async def touch():
+        tenant_writes.record_tenant_write(tenant_id, Event("project.updated", {"id": "p1"}))
+        tenant_writes.record_tenant_write(uuid.uuid4(), Event("project.updated", {"id": "other"}))
+
+    with TestClient(app) as client:
+        with client.websocket_connect("/events/ws?ticket=good") as websocket:
+            client.post("/touch")
+            assert websocket.receive_json() == {"type": "project.updated", "data": {"id": "p1"}}
+
+        with pytest.raises(WebSocketDisconnect) as rejected:
+            with client.websocket_connect("/events/ws?ticket=bad") as websocket:
+                websocket.receive_json()
+        assert rejected.value.code == 1008
+
+
+def test_memory_broker_refuses_several_workers(monkeypatch):
+    monkeypatch.setattr(events.settings, "events_broker", "memory")
+    monkeypatch.setattr(events.settings, "web_concurrency", 2)
+    with pytest.raises(RuntimeError, match="EVENTS_BROKER=postgres"):
+        events.create_broker()
+
+    monkeypatch.setattr(events.settings, "events_broker", "postgres")
+    assert isinstance(events.create_broker(), PostgresBroker)
+
+    monkeypatch.setattr(events.settings, "events_broker", "memory")
+    monkeypatch.setattr(events.settings, "web_concurrency", 1)
+    assert type(events.create_broker()) is InMemoryBroker
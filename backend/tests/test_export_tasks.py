@@ -0,0 +1,78 @@
+import asyncio
+import csv
+import io
+import json
+import uuid
+from datetime import datetime
+
+import httpx
+import pytest
+from fastapi import Depends, FastAPI
+
+from app.api import dependencies
+from app.api.routes import tasks as task_routes
+from app.api.routes.tasks import EXPORT_FIELDS, csv_chunk, ndjson_chunk
+from app.infrastructure.admission import AdmissionController
+
+
+def make_row(title, due_date=None):
+    return (uuid.uuid4(), title, "todo", None, "high", due_date, uuid.uuid4(), datetime(2025, 8, 20, 9, 0))
+
+
+def test_ndjson_chunk_one_object_per_line():
+    rows = [make_row("A", datetime(2025, 9, 1)), make_row('B "quoted"')]
+    lines = ndjson_chunk(rows).decode().splitlines()
+    assert len(lines) == 2
+    first = json.loads(lines[0])
+    assert list(first) == EXPORT_FIELDS
+    assert first["id"] == str(rows[0][0]) and first["due_date"] == "2025-09-01T00:00:00"
+    assert json.loads(lines[1])["title"] == 'B "quoted"' and json.loads(lines[1])["assignee"] is None
+
+
+def test_csv_chunk_header_and_rows():
+    rows = [make_row("A, with comma")]
+    text = (csv_chunk([], header=True) + csv_chunk(rows)).decode()
+    parsed = list(csv.reader(io.StringIO(text)))
+    assert parsed[0] == EXPORT_FIELDS
+    assert parsed[1][1] == "A, with comma" and parsed[1][3] == "" and parsed[1][4] == "high"
+
+
+class NullSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+@pytest.mark.asyncio
+async def test_open_exports_hold_their_tenants_admission_slot(monkeypatch):
+    tenant_id = uuid.uuid4()
+    admission = AdmissionController(
+        rate=0, burst=1, tenant_max_concurrent=1, max_concurrent=0, max_pool_wait=0, pool_wait=lambda: 0.0
+    )
+    monkeypatch.setattr(dependencies, "admission", admission)
+    streaming, finish = asyncio.Event(), asyncio.Event()
+
+    async def stream_tasks(repo, tenant_id, filters, sort, chunk_size):
+        streaming.set()
+        await finish.wait()
+        yield []
+
+    monkeypatch.setattr(task_routes, "AsyncSessionLocal", NullSession)
+    monkeypatch.setattr(task_routes.task_uc, "stream_tasks", stream_tasks)
+
+    app = FastAPI()
+    app.dependency_overrides[dependencies.get_current_tenant_id] = lambda: tenant_id
+    app.include_router(task_routes.router, prefix="/tasks", dependencies=[Depends(dependencies.admit_tenant_request)])
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        first = asyncio.create_task(client.get("/tasks/export"))
+        await asyncio.wait_for(streaming.wait(), 1)
+
+        assert admission.in_flight == 1
+        assert (await client.get("/tasks/export")).status_code == 429
+
+        finish.set()
+        assert (await first).status_code == 200
+    assert admission.in_flight == 0 and admission._active == {}
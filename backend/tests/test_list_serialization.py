@@ -0,0 +1,42 @@
+import uuid
+from datetime import datetime
+
+from app.api.routes.projects import ProjectListResponse, ProjectOut, project_page_serializer
+from app.api.routes.tasks import TaskListResponse, TaskOut, task_page_serializer
+from app.infrastructure.db.counting import TotalMode
+
+from fakes import FakeRow
+
+
+def task_rows():
+    return [
+        FakeRow(
+            id=uuid.uuid4(), title='Ship "v2" — ünïcode', status="todo", assignee=None, priority="high",
+            due_date=datetime(2025, 9, 1, 12, 30, 15, 123456), project_id=uuid.uuid4(),
+            created_at=datetime(2025, 8, 1), rank=0.42,
+        ),
+        FakeRow(
+            id=uuid.uuid4(), title="Plain", status="done", assignee="bob@example.com", priority="low",
+            due_date=None, project_id=uuid.uuid4(), created_at=datetime(2025, 8, 2),
+        ),
+    ]
+
+
+def test_task_page_bytes_match_response_model():
+    rows = task_rows()
+    fields = {"total": None, "next_cursor": "abc", "has_more": True, "total_mode": TotalMode.none}
+    expected = TaskListResponse(items=[TaskOut.model_validate(r) for r in rows], **fields).model_dump_json().encode()
+    assert task_page_serializer.dump_json(rows, **fields) == expected
+
+
+def test_project_page_bytes_match_response_model():
+    rows = [
+        FakeRow(id=uuid.uuid4(), name="Alpha", description=None, created_at=datetime(2025, 8, 1)),
+        FakeRow(id=uuid.uuid4(), name="Beta", description="Second\nline", created_at=datetime(2025, 8, 2)),
+    ]
+    expected = ProjectListResponse(
+        total=2, items=[ProjectOut.model_validate(r) for r in rows]
+    ).model_dump_json().encode()
+    # Omitted fields fall back to the response model's defaults.
+    assert project_page_serializer.dump_json(rows, total=2) == expected
+    assert project_page_serializer.dump_json([], total=0) == ProjectListResponse(total=0, items=[]).model_dump_json().encode()
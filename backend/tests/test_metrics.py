@@ -0,0 +1,67 @@
+from types import SimpleNamespace
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.api import metrics as api_metrics
+from app.infrastructure.db.instrumentation import instrument_engine
+from app.infrastructure.metrics import RequestStats, record_query, request_stats
+
+
+def make_app():
+    app = FastAPI()
+    app.add_middleware(api_metrics.MetricsMiddleware)
+    app.include_router(api_metrics.router)
+
+    @app.get("/widgets/{widget_id}")
+    async def widget(widget_id: int):
+        record_query(0.002)
+        record_query(0.003)
+        return {"id": widget_id}
+
+    return app
+
+
+def sample(body: str, prefix: str) -> float:
+    for line in body.splitlines():
+        if line.startswith(prefix):
+            return float(line.rsplit(" ", 1)[1])
+    return 0.0
+
+
+def test_requests_labelled_by_route_template_with_db_stats():
+    client = TestClient(make_app())
+    before = client.get("/metrics").text
+    count_key = 'http_request_duration_seconds_count{method="GET",route="/widgets/{widget_id}",status="200"}'
+    queries_key = 'db_queries_per_request_sum{route="/widgets/{widget_id}"}'
+
+    assert client.get("/widgets/1").status_code == 200
+    assert client.get("/widgets/2").status_code == 200
+    assert client.get("/nope").status_code == 404
+
+    body = client.get("/metrics").text
+    assert sample(body, count_key) - sample(before, count_key) == 2
+    assert sample(body, queries_key) - sample(before, queries_key) == 4
+    assert 'route="unmatched",status="404"' in body
+    assert "db_pool_wait_seconds" in body and "password_hash_seconds" in body
+
+
+def test_engine_hooks_count_queries_for_current_request():
+    engine = create_engine("sqlite://")
+    instrument_engine(SimpleNamespace(sync_engine=engine))
+
+    stats = RequestStats()
+    token = request_stats.set(stats)
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+    finally:
+        request_stats.reset(token)
+    assert stats.queries == 2 and stats.db_seconds > 0
+
+    # Outside a request nothing is recorded and nothing fails.
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    assert stats.queries == 2
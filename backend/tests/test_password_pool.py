@@ -0,0 +1,32 @@
+import asyncio
+import threading
+import pytest
+
+from app.infrastructure.security.password import HashQueueFull, PasswordHasherPool
+
+
+@pytest.mark.asyncio
+async def test_pool_runs_off_loop_and_records_metrics():
+    pool = PasswordHasherPool(workers=2, max_queue=0)
+    caller = threading.get_ident()
+
+    result = await pool.run(lambda x: (x * 2, threading.get_ident()), 21)
+    assert result[0] == 42 and result[1] != caller
+    assert pool.metrics.snapshot()["calls"] == 1
+    assert pool.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_pool_rejects_when_queue_full():
+    pool = PasswordHasherPool(workers=1, max_queue=1)
+    release = threading.Event()
+
+    running = [asyncio.ensure_future(pool.run(release.wait)) for _ in range(2)]
+    await asyncio.sleep(0)
+    with pytest.raises(HashQueueFull):
+        await pool.run(release.wait)
+
+    release.set()
+    await asyncio.gather(*running)
+    assert pool.metrics.snapshot()["rejected"] == 1
+    assert pool.metrics.snapshot()["calls"] == 2
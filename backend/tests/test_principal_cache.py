@@ -0,0 +1,129 @@
+import uuid
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from app.infrastructure.db.models import User
+
+from app.infrastructure.security import jwt as jwt_module
+from app.infrastructure.security.jwt import create_access_token, get_current_principal, invalidate_principal
+
+from fakes import FakeRow, FakeResult
+
+
+class FakeSession:
+    def __init__(self, row):
+        self.row = row
+        self.calls = 0
+
+    async def execute(self, query):
+        self.calls += 1
+        return FakeResult(self.row)
+
+
+def make_token(user_id, tenant_id):
+    return create_access_token({"user_id": str(user_id), "tenant_id": str(tenant_id)})
+
+
+@pytest.mark.asyncio
+async def test_principal_cached_until_invalidated():
+    user_id, tenant_id = uuid.uuid4(), uuid.uuid4()
+    token = make_token(user_id, tenant_id)
+    session = FakeSession(FakeRow(tenant_id=tenant_id, is_active=True))
+
+    first = await get_current_principal(token, session)
+    second = await get_current_principal(token, session)
+    assert first.tenant_id == second.tenant_id == tenant_id
+    assert session.calls == 1
+
+    invalidate_principal(user_id)
+    session.row = FakeRow(tenant_id=tenant_id, is_active=False)
+    with pytest.raises(HTTPException) as exc:
+        await get_current_principal(token, session)
+    assert exc.value.status_code == 401
+    with pytest.raises(HTTPException):
+        await get_current_principal(token, session)
+    assert session.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_unknown_user_and_bad_token_rejected():
+    session = FakeSession(None)
+    with pytest.raises(HTTPException):
+        await get_current_principal(make_token(uuid.uuid4(), uuid.uuid4()), session)
+    with pytest.raises(HTTPException):
+        await get_current_principal("not-a-jwt", session)
+
+
+@pytest.mark.asyncio
+async def test_trusted_claims_skip_database(monkeypatch):
+    monkeypatch.setattr(jwt_module.settings, "auth_trust_token_claims", True)
+    user_id, tenant_id = uuid.uuid4(), uuid.uuid4()
+    session = FakeSession(None)
+
+    principal = await get_current_principal(make_token(user_id, tenant_id), session)
+    assert principal.user_id == user_id and principal.tenant_id == tenant_id
+    assert session.calls == 0
+
+
+class RecordingBroker:
+    def __init__(self):
+        self.announced = []
+
+    def announce(self, kind, key):
+        self.announced.append((kind, key))
+
+
+def test_user_changes_invalidate_on_commit_in_every_worker(monkeypatch):
+    broker = RecordingBroker()
+    monkeypatch.setattr(jwt_module, "broker", broker)
+    session = Session()
+    user = User(id=uuid.uuid4(), email="a@example.com", hashed_password="x", tenant_id=uuid.uuid4())
+    session.add(user)
+    before = jwt_module._user_versions.get(user.id)
+
+    # Flushed but not committed: a request in this window must still cache with the old version.
+    jwt_module._queue_principal_invalidation(None, None, user)
+    assert jwt_module._user_versions.get(user.id) == before and broker.announced == []
+
+    jwt_module._invalidate_committed_principals(session)
+    assert jwt_module._user_versions.get(user.id) != before
+    assert broker.announced == [(jwt_module.PRINCIPAL, user.id)]
+
+    jwt_module._queue_principal_invalidation(None, None, user)
+    jwt_module._discard_principal_invalidations(session)
+    jwt_module._invalidate_committed_principals(session)
+    assert len(broker.announced) == 1
+
+
+@pytest.mark.asyncio
+async def test_stream_tickets_only_open_streams():
+    user_id, tenant_id = uuid.uuid4(), uuid.uuid4()
+    token = make_token(user_id, tenant_id)
+    session = FakeSession(FakeRow(tenant_id=tenant_id, is_active=True))
+    principal = await get_current_principal(token, session)
+
+    ticket = jwt_module.create_stream_ticket(principal)
+    streamer = await jwt_module.get_ticket_principal(ticket, session)
+    assert streamer.user_id == user_id and streamer.tenant_id == tenant_id
+    # The stream still ends when the access token does, not when the ticket does.
+    assert streamer.claims["exp"] == principal.claims["exp"]
+
+    with pytest.raises(HTTPException):
+        await get_current_principal(ticket, session)
+    with pytest.raises(HTTPException):
+        await jwt_module.get_ticket_principal(token, session)
+
+    session.row = FakeRow(tenant_id=tenant_id, is_active=False)
+    with pytest.raises(HTTPException):
+        await jwt_module.get_ticket_principal(ticket, session)
+
+
+@pytest.mark.asyncio
+async def test_expired_stream_ticket_rejected(monkeypatch):
+    monkeypatch.setattr(jwt_module.settings, "events_ticket_ttl_seconds", -10)
+    tenant_id = uuid.uuid4()
+    session = FakeSession(FakeRow(tenant_id=tenant_id, is_active=True))
+    principal = await get_current_principal(make_token(uuid.uuid4(), tenant_id), session)
+    with pytest.raises(HTTPException):
+        await jwt_module.get_ticket_principal(jwt_module.create_stream_ticket(principal), session)
@@ -0,0 +1,24 @@
+import uuid
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.api.routes.tasks import PriorityEnum, filtered_tasks_query
+from app.infrastructure.db.models import Task
+from app.infrastructure.db.types import PriorityOrdinal
+
+
+def test_priority_ordinal_roundtrip_and_order():
+    t = PriorityOrdinal()
+    ordinals = [t.process_bind_param(p.value, None) for p in PriorityEnum]
+    assert [t.process_result_value(o, None) for o in ordinals] == [p.value for p in PriorityEnum]
+    assert sorted(["high", "low", "medium"], key=lambda p: t.process_bind_param(p, None)) == ["low", "medium", "high"]
+    assert t.process_bind_param(None, None) is None
+
+
+def test_priority_range_filter_compiles_to_ordinals():
+    q = filtered_tasks_query(uuid.uuid4(), priority_min=PriorityEnum.medium, priority_max=PriorityEnum.high)
+    sql = str(q.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    assert "task.priority >= 2" in sql and "task.priority <= 3" in sql
+
+    sql = str(select(Task.id).order_by(Task.priority.desc()).compile(dialect=postgresql.dialect()))
+    assert "ORDER BY task.priority DESC" in sql
@@ -0,0 +1,70 @@
+import uuid
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.routes.projects import ProjectListItem, parse_include
+from app.infrastructure.db.overview import recent_tasks_from_json
+from app.infrastructure.repositories.sqlalchemy_repositories import ProjectRepositorySQLAlchemy
+
+from fakes import CapturingSession, FakeRow, compile_pg
+
+TENANT_ID = uuid.uuid4()
+
+
+def test_parse_include():
+    assert parse_include(None) == set()
+    assert parse_include("task_counts, recent_tasks") == {"task_counts", "recent_tasks"}
+    with pytest.raises(HTTPException) as exc:
+        parse_include("task_counts,members")
+    assert exc.value.status_code == 400
+
+
+def test_recent_tasks_from_json_restores_types():
+    task_id, project_id = uuid.uuid4(), uuid.uuid4()
+    items = [{
+        "id": str(task_id), "project_id": str(project_id), "title": "Ship", "status": "todo", "assignee": None,
+        "priority": 3, "due_date": None, "created_at": "2025-09-01T10:30:00.123456",
+    }]
+    [task] = recent_tasks_from_json(items, TENANT_ID)
+    assert task.id == task_id and task.project_id == project_id
+    assert task.priority == "high"
+    assert task.created_at == datetime(2025, 9, 1, 10, 30, 0, 123456)
+    assert recent_tasks_from_json(None, TENANT_ID) == []
+
+
+@pytest.mark.asyncio
+async def test_overview_page_is_one_query_with_lateral_join():
+    project_id = uuid.uuid4()
+    row = FakeRow(
+        id=project_id, tenant_id=TENANT_ID, name="P", description=None, created_at=datetime(2025, 1, 1),
+        tasks_total=2, tasks_todo=1, tasks_in_progress=0, tasks_done=1,
+        recent_tasks=[{
+            "id": str(uuid.uuid4()), "project_id": str(project_id), "title": "T", "status": "done",
+            "assignee": "alice", "priority": 2, "due_date": None, "created_at": "2025-01-02T00:00:00",
+        }],
+    )
+    session = CapturingSession([row])
+
+    page = await ProjectRepositorySQLAlchemy(session).page(TENANT_ID, limit=10, task_counts=True, recent_tasks=3)
+
+    assert len(session.statements) == 1
+    sql = compile_pg(session.statements[0])
+    assert "LEFT OUTER JOIN project_stats ON project_stats.project_id = project.id" in sql
+    assert "JOIN LATERAL (SELECT json_agg(newest ORDER BY newest.created_at DESC, newest.id DESC)" in sql
+    # The tenant is bound inside the lateral subquery so task partitions prune.
+    assert "task.tenant_id = $" in sql and "task.project_id = project.id" in sql
+
+    item = ProjectListItem.model_validate(page.items[0])
+    assert item.task_counts.model_dump() == {"total": 2, "todo": 1, "in_progress": 0, "done": 1}
+    assert [(t.title, t.priority) for t in item.recent_tasks] == [("T", "medium")]
+
+
+@pytest.mark.asyncio
+async def test_plain_page_has_no_overview_joins():
+    session = CapturingSession([])
+    page = await ProjectRepositorySQLAlchemy(session).page(TENANT_ID, limit=10)
+    sql = compile_pg(session.statements[0])
+    assert "project_stats" not in sql and "LATERAL" not in sql
+    assert page.items == []
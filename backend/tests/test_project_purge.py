@@ -0,0 +1,135 @@
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from app.api.routes import projects as project_routes
+from app.api.routes import tasks as task_routes
+from app.api.routes.tasks import filtered_tasks_query
+from app.infrastructure.db.changes import SyncPosition, changes_query
+from app.infrastructure.repositories.sqlalchemy_repositories import TaskRepositorySQLAlchemy
+from app.infrastructure.db import purge
+from app.infrastructure.db.models import Project
+
+from fakes import FakeResult, FakeSession, compile_pg
+
+
+def test_orm_leaves_task_cascade_to_the_database():
+    assert Project.tasks.property.passive_deletes is True
+
+
+def test_purging_projects_are_hidden_from_task_lists():
+    sql = compile_pg(filtered_tasks_query(uuid.uuid4()))
+    assert "task.project_id NOT IN (SELECT project.id" in sql
+    assert "project.deleted_at IS NOT NULL" in sql
+
+
+PURGING = "task.project_id NOT IN (SELECT project.id"
+
+
+def test_purging_projects_tasks_are_not_sync_upserts():
+    sql = compile_pg(changes_query(uuid.uuid4(), SyncPosition(floor=0), 100))
+    upserts, deletions = sql.split("UNION ALL")
+    assert PURGING in upserts and "project.deleted_at IS NOT NULL" in upserts
+    assert PURGING not in deletions
+
+
+@pytest.mark.asyncio
+async def test_repository_lookups_skip_purging_projects_tasks():
+    session = FakeSession()
+    repo = TaskRepositorySQLAlchemy(session)
+    await repo.get_many(uuid.uuid4(), [uuid.uuid4()])
+    await repo.list_by_tenant(uuid.uuid4())
+    assert all(PURGING in sql for sql in session.statements)
+
+
+@pytest.mark.asyncio
+async def test_writes_to_purging_projects_tasks_are_404():
+    # The purging project's task matches no row, exactly like a missing one.
+    update = FakeSession(FakeResult(None))
+    with pytest.raises(task_routes.HTTPException) as exc:
+        await task_routes.update_task(uuid.uuid4(), task_routes.TaskUpdate(title="x"), update, uuid.uuid4())
+    assert exc.value.status_code == 404 and PURGING in update.statements[0]
+
+    unchanged = FakeSession(FakeResult(None))
+    with pytest.raises(task_routes.HTTPException):
+        await task_routes.update_task(uuid.uuid4(), task_routes.TaskUpdate(), unchanged, uuid.uuid4())
+    assert PURGING in unchanged.statements[0]
+
+    delete = FakeSession(FakeResult(None))
+    with pytest.raises(task_routes.HTTPException) as exc:
+        await task_routes.delete_task(uuid.uuid4(), delete, uuid.uuid4())
+    assert exc.value.status_code == 404 and PURGING in delete.statements[0]
+    assert not (update.committed or unchanged.committed or delete.committed)
+
+
+def test_purge_batches_are_bounded_and_skip_locked_projects():
+    assert "FOR UPDATE SKIP LOCKED" in compile_pg(purge.claim_statement())
+    sql = compile_pg(purge.batch_delete_statement(uuid.uuid4(), uuid.uuid4(), 500))
+    assert sql.startswith("DELETE FROM task WHERE task.tenant_id = $1::UUID AND task.id IN (SELECT task.id")
+    assert "LIMIT $" in sql
+
+
+@pytest.mark.asyncio
+async def test_purge_batch_removes_project_after_last_batch():
+    project_id, tenant_id = uuid.uuid4(), uuid.uuid4()
+    claimed = SimpleNamespace(id=project_id, tenant_id=tenant_id)
+
+    full = FakeSession(FakeResult(claimed), FakeResult(rowcount=100))
+    assert await purge.purge_batch(lambda: full, 100) == project_id
+    assert full.committed and not any(s.startswith("DELETE FROM project") for s in full.statements)
+
+    last = FakeSession(FakeResult(claimed), FakeResult(rowcount=40))
+    assert await purge.purge_batch(lambda: last, 100) == project_id
+    assert last.statements[-2].startswith("DELETE FROM project")
+    assert last.statements[-1].startswith("INSERT INTO project_purge") and last.committed
+
+    assert await purge.purge_batch(lambda: FakeSession(FakeResult(None)), 100) is None
+
+
+@pytest.mark.asyncio
+async def test_delete_project_inline_or_queued_by_size(monkeypatch):
+    monkeypatch.setattr(project_routes.settings, "project_purge_threshold", 1000)
+    writes = []
+    monkeypatch.setattr(project_routes, "record_tenant_write", lambda tenant_id, event: writes.append(event.type))
+    tenant_id, project_id = uuid.uuid4(), uuid.uuid4()
+
+    small = FakeSession(FakeResult(SimpleNamespace(deleted_at=None, tasks=10)))
+    assert await project_routes.delete_project(project_id, small, tenant_id) is None
+    assert small.statements[-1].startswith("DELETE FROM project")
+
+    large = FakeSession(FakeResult(SimpleNamespace(deleted_at=None, tasks=200_000)))
+    response = await project_routes.delete_project(project_id, large, tenant_id)
+    assert response.status_code == 202
+    assert response.headers["location"] == f"/projects/{project_id}/purge"
+    assert large.statements[-1].startswith("UPDATE project SET deleted_at")
+    assert writes == ["project.deleted", "project.deleted"]
+
+    again = FakeSession(FakeResult(SimpleNamespace(deleted_at=datetime.utcnow(), tasks=150_000)))
+    assert (await project_routes.delete_project(project_id, again, tenant_id)).status_code == 202
+    assert len(again.statements) == 1 and writes == ["project.deleted", "project.deleted"]
+
+
+@pytest.mark.asyncio
+async def test_purge_status_reports_progress_then_done():
+    tenant_id, project_id = uuid.uuid4(), uuid.uuid4()
+    purging = FakeSession(FakeResult(SimpleNamespace(deleted_at=datetime.utcnow(), tasks=1200)))
+    status = await project_routes.get_purge_status(project_id, purging, tenant_id)
+    assert (status.state, status.remaining_tasks) == ("purging", 1200)
+
+    recorded = FakeSession(FakeResult(None), FakeResult(SimpleNamespace(purged_at=datetime.utcnow())))
+    done = await project_routes.get_purge_status(project_id, recorded, tenant_id)
+    assert (done.state, done.remaining_tasks) == ("done", 0)
+    assert "FROM project_purge" in recorded.statements[-1]
+
+    # Never existed, or finished longer ago than the record is kept.
+    with pytest.raises(project_routes.HTTPException) as unknown:
+        await project_routes.get_purge_status(project_id, FakeSession(FakeResult(None), FakeResult(None)), tenant_id)
+    assert unknown.value.status_code == 404
+
+    with pytest.raises(project_routes.HTTPException) as live:
+        await project_routes.get_purge_status(
+            project_id, FakeSession(FakeResult(SimpleNamespace(deleted_at=None, tasks=3))), tenant_id
+        )
+    assert live.value.status_code == 404
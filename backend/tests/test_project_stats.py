@@ -0,0 +1,118 @@
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import DBAPIError
+
+from app.api.routes.projects import stats_out
+from app.infrastructure.db.locks import RECONCILE_LOCK_KEY, exclusive_run
+from app.infrastructure.db.stats import project_stats_query, reconcile_project_stats, reconcile_tenant_stats
+
+from fakes import FakeResult
+
+
+def test_stats_query_reads_counters_and_partial_due_index():
+    sql = str(project_stats_query(uuid.uuid4(), datetime.utcnow()).compile(dialect=postgresql.dialect()))
+    assert "LEFT OUTER JOIN project_stats" in sql
+    # Only overdue tasks are aggregated; the NOT NULL predicate matches the partial index.
+    assert sql.count("count(*)") == 1
+    assert "task.due_date IS NOT NULL" in sql
+
+
+def test_stats_out_groups_counters():
+    row = SimpleNamespace(
+        project_id=uuid.uuid4(), total=6, todo=3, in_progress=2, done=1, low=1, medium=4, high=1, overdue=2
+    )
+    out = stats_out(row).model_dump()
+    assert out["by_status"] == {"todo": 3, "in_progress": 2, "done": 1}
+    assert out["by_priority"] == {"low": 1, "medium": 4, "high": 1}
+    assert out["total"] == 6 and out["overdue"] == 2
+
+
+class SerializationFailure(Exception):
+    sqlstate = "40001"
+
+
+class FakeSession:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.rolled_back = False
+        self.committed = False
+
+    async def connection(self, execution_options=None):
+        return None
+
+    async def execute(self, statement):
+        if self.fail and "INSERT" in str(statement):
+            raise DBAPIError("INSERT", {}, SerializationFailure())
+        return FakeResult([])
+
+    async def rollback(self):
+        self.rolled_back = True
+
+    async def commit(self):
+        self.committed = True
+
+
+@pytest.mark.asyncio
+async def test_reconcile_skips_tenant_on_concurrent_write():
+    racing = FakeSession(fail=True)
+    assert await reconcile_tenant_stats(racing, uuid.uuid4()) is None
+    assert racing.rolled_back and not racing.committed
+
+
+class LockConnection:
+    """Session-level advisory locks shared by every fake connection, like one database."""
+
+    held: set = set()
+
+    def __init__(self, statements):
+        self.statements = statements
+
+    async def execute(self, statement):
+        sql = str(statement)
+        self.statements.append(sql)
+        (key,) = statement.compile().params.values()
+        if "pg_try_advisory_lock" in sql:
+            acquired = key not in self.held
+            self.held.add(key)
+            return FakeResult(acquired)
+        self.held.discard(key)
+        return FakeResult(True)
+
+
+class SweepSession:
+    def __init__(self, statements):
+        self.statements = statements
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def connection(self, execution_options=None):
+        assert execution_options == {"isolation_level": "AUTOCOMMIT"}
+        return LockConnection(self.statements)
+
+    async def execute(self, statement):
+        self.statements.append(str(statement))
+        return FakeResult([])
+
+
+@pytest.mark.asyncio
+async def test_one_reconcile_sweep_runs_at_a_time():
+    statements = []
+    factory = lambda: SweepSession(statements)
+
+    async with exclusive_run(factory, RECONCILE_LOCK_KEY) as leader:
+        assert leader
+        statements.clear()
+        assert await reconcile_project_stats(factory) is None
+        assert not any("FROM tenant" in sql for sql in statements)
+
+    assert await reconcile_project_stats(factory) == 0
+    assert any("FROM tenant" in sql for sql in statements)
+    assert LockConnection.held == set()
@@ -0,0 +1,92 @@
+import logging
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from app.api import metrics as api_metrics
+from app.infrastructure.db import profiling
+from app.infrastructure.db.instrumentation import instrument_engine
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    instrument_engine(SimpleNamespace(sync_engine=engine))
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE item (id INTEGER PRIMARY KEY, name TEXT)"))
+        conn.execute(text("INSERT INTO item (id, name) VALUES (1, 'a'), (2, 'b'), (3, 'c')"))
+    return engine
+
+
+def make_app(engine):
+    app = FastAPI()
+    app.add_middleware(api_metrics.MetricsMiddleware)
+
+    @app.get("/items")
+    async def items(request: Request):
+        with engine.connect() as conn:
+            ids = conn.execute(text("SELECT id FROM item ORDER BY id")).scalars().all()
+            names = [conn.execute(text(f"SELECT name FROM item WHERE id = {i}")).scalar() for i in ids]
+        stats = request.state.query_stats
+        return {"names": names, "queries": stats.queries, "fingerprints": len(stats.fingerprints)}
+
+    return app
+
+
+def test_fingerprint_ignores_literals_and_in_list_length():
+    one, _ = profiling.fingerprint("SELECT * FROM task WHERE id = 1 AND title = 'x'")
+    two, normalized = profiling.fingerprint("SELECT *\n  FROM task WHERE id = 42 AND title = 'it''s'")
+    assert one == two
+    assert normalized == "SELECT * FROM task WHERE id = ? AND title = ?"
+
+    short, _ = profiling.fingerprint("SELECT * FROM task WHERE id IN ($1, $2)")
+    long, normalized = profiling.fingerprint("SELECT * FROM task WHERE id IN ($1, $2, $3, $4)")
+    assert short == long and normalized.endswith("IN (...)")
+    assert profiling.fingerprint("SELECT * FROM task_1")[0] != profiling.fingerprint("SELECT * FROM task_2")[0]
+
+
+def test_request_stats_and_n_plus_one_flag(engine, monkeypatch, caplog):
+    monkeypatch.setattr(profiling.settings, "n_plus_one_threshold", 2)
+    client = TestClient(make_app(engine))
+
+    with caplog.at_level(logging.WARNING, logger=profiling.__name__):
+        body = client.get("/items").json()
+
+    assert body == {"names": ["a", "b", "c"], "queries": 4, "fingerprints": 2}
+    flagged = [r.getMessage() for r in caplog.records if "possible N+1" in r.getMessage()]
+    assert len(flagged) == 1
+    assert "/items" in flagged[0] and "ran 3 times" in flagged[0] and "WHERE id = ?" in flagged[0]
+
+
+def test_slow_queries_logged_with_route(engine, monkeypatch, caplog):
+    monkeypatch.setattr(profiling.settings, "slow_query_ms", 1e-6)
+    client = TestClient(make_app(engine))
+
+    with caplog.at_level(logging.WARNING, logger=profiling.__name__):
+        client.get("/items")
+
+    slow = [r.getMessage() for r in caplog.records if r.getMessage().startswith("slow query")]
+    assert len(slow) == 4 and all(" on /items " in message for message in slow)
+
+
+def test_max_queries_helper(engine, monkeypatch):
+    monkeypatch.setattr(profiling.settings, "query_timing_header", True)
+    client = TestClient(make_app(engine))
+
+    with profiling.max_queries(4) as requests:
+        response = client.get("/items")
+    assert [stats.queries for stats in requests] == [4]
+    assert response.headers["server-timing"].endswith('desc="4 queries"')
+
+    with pytest.raises(AssertionError, match=r"/items ran 4 queries, expected at most 3"):
+        with profiling.max_queries(3):
+            client.get("/items")
+
+    with pytest.raises(AssertionError, match="3x SELECT name FROM item WHERE id = ?"):
+        with profiling.max_queries(2), engine.connect() as conn:
+            for i in (1, 2, 3):
+                conn.execute(text(f"SELECT name FROM item WHERE id = {i}"))
@@ -0,0 +1,71 @@
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from app.infrastructure.db import session as session_module
+from app.infrastructure.db.replica import ReplicaState, is_pinned
+from app.infrastructure.tenant_writes import record_tenant_write
+
+
+class FakeReplicaEngine:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.sync_engine = self
+
+    def connect(self):
+        if self.fail:
+            raise ConnectionRefusedError("replica down")
+        return SimpleNamespace(close=lambda: None)
+
+
+@pytest.fixture
+def healthy_replica(monkeypatch):
+    state = ReplicaState(max_lag=5, retry_after=30, probe_ttl=60)
+    state.record_lag(0.2)
+    monkeypatch.setattr(session_module, "replica", state)
+    return state
+
+
+def routed_bind(tenant_id=None):
+    return session_module.ReplicaRoutingSession(info={"tenant_id": tenant_id}).get_bind()
+
+
+def test_replica_state_requires_fresh_low_lag_and_closed_breaker():
+    state = ReplicaState(max_lag=5, retry_after=30, probe_ttl=60)
+    assert not state.usable()  # never probed
+    state.record_lag(1.0)
+    assert state.usable()
+    state.record_lag(12.0)
+    assert not state.usable()
+    state.record_lag(0.0)
+    state.mark_failed()
+    assert not state.usable()
+
+    stale = ReplicaState(max_lag=5, retry_after=30, probe_ttl=-1)
+    stale.record_lag(0.0)
+    assert not stale.usable()
+
+
+def test_reads_use_replica_until_tenant_writes(monkeypatch, healthy_replica):
+    fake = FakeReplicaEngine()
+    monkeypatch.setattr(session_module, "read_engine", fake)
+    tenant_id = uuid.uuid4()
+
+    assert routed_bind(tenant_id) is fake
+    record_tenant_write(tenant_id)
+    assert is_pinned(tenant_id)
+    assert routed_bind(tenant_id) is session_module.engine.sync_engine
+    assert routed_bind(uuid.uuid4()) is fake
+
+
+def test_unreachable_replica_falls_back_and_opens_breaker(monkeypatch, healthy_replica):
+    monkeypatch.setattr(session_module, "read_engine", FakeReplicaEngine(fail=True))
+
+    assert routed_bind() is session_module.engine.sync_engine
+    assert not healthy_replica.usable()
+
+
+def test_no_replica_configured_routes_to_primary(monkeypatch, healthy_replica):
+    monkeypatch.setattr(session_module, "read_engine", None)
+    assert routed_bind() is session_module.engine.sync_engine
@@ -0,0 +1,92 @@
+import json
+import uuid
+from datetime import datetime
+
+import pytest
+
+from app.api.routes.tasks import task_page_serializer
+from app.application.repositories import InvalidCursor, Page, TaskFilters
+from app.application.use_cases.tasks import create_tasks, get_tasks, page_tasks
+from app.domain.entities import ProjectEntity, TaskEntity
+from app.infrastructure.db.pagination import decode_cursor
+from app.infrastructure.repositories.sqlalchemy_repositories import (
+    ProjectRepositorySQLAlchemy,
+    TaskRepositorySQLAlchemy,
+)
+
+from fakes import CapturingSession, FakeRow, compile_pg
+
+TENANT_ID = uuid.uuid4()
+
+
+def task_row(day: int) -> FakeRow:
+    return FakeRow(
+        id=uuid.uuid4(), tenant_id=TENANT_ID, project_id=uuid.uuid4(), title=f"T{day}", status="todo",
+        assignee=None, priority="medium", due_date=None, created_at=datetime(2025, 1, day),
+    )
+
+
+def test_entities_are_slotted():
+    task = TaskEntity(id=uuid.uuid4(), tenant_id=TENANT_ID, project_id=uuid.uuid4(), title="t", status="todo", assignee=None)
+    assert not hasattr(task, "__dict__")
+    assert not hasattr(ProjectEntity(id=uuid.uuid4(), tenant_id=TENANT_ID, name="p", description=None), "__dict__")
+    assert Page(items=[task]).has_more is False
+    assert Page(items=[task], next_cursor="abc").has_more is True
+
+
+@pytest.mark.asyncio
+async def test_task_page_fetches_one_extra_row_and_returns_entities():
+    session = CapturingSession([task_row(d) for d in (3, 2, 1)])
+    repo = TaskRepositorySQLAlchemy(session)
+
+    page = await page_tasks(repo, TENANT_ID, TaskFilters(status="todo"), limit=2)
+
+    assert [t.title for t in page.items] == ["T3", "T2"]
+    assert all(isinstance(t, TaskEntity) for t in page.items)
+    assert decode_cursor(page.next_cursor, "-created_at") == (page.items[-1].created_at, page.items[-1].id)
+    assert page.total is None
+    sql = compile_pg(session.statements[0])
+    assert "task.tenant_id = $1" in sql and "task.status = $" in sql
+    assert "ORDER BY task.created_at DESC, task.id DESC" in sql and "LIMIT $" in sql
+
+
+@pytest.mark.asyncio
+async def test_task_page_rejects_cursor_for_other_sort():
+    repo = TaskRepositorySQLAlchemy(CapturingSession())
+    page = await repo.page(TENANT_ID, TaskFilters(), limit=1, sort="priority")
+    assert page.next_cursor is None
+    with pytest.raises(InvalidCursor):
+        await repo.page(TENANT_ID, TaskFilters(), limit=1, cursor="not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_get_many_is_one_tenant_scoped_query():
+    session = CapturingSession()
+    assert await get_tasks(TaskRepositorySQLAlchemy(session), TENANT_ID, []) == []
+    assert session.statements == []
+
+    await get_tasks(TaskRepositorySQLAlchemy(session), TENANT_ID, [uuid.uuid4(), uuid.uuid4()])
+    await ProjectRepositorySQLAlchemy(session).get_many(TENANT_ID, [uuid.uuid4()])
+    task_sql, project_sql = (compile_pg(s) for s in session.statements)
+    assert "task.tenant_id = $1" in task_sql and "task.id IN" in task_sql
+    assert "project.deleted_at IS NULL" in project_sql and "project.id IN" in project_sql
+
+
+@pytest.mark.asyncio
+async def test_create_many_is_one_executemany_insert():
+    session = CapturingSession()
+    rows = [task_row(1), task_row(2)]
+    tasks = [TaskEntity(**vars(r)) for r in rows]
+
+    assert await create_tasks(TaskRepositorySQLAlchemy(session), tasks) == tasks
+    assert len(session.statements) == 1
+    assert "INSERT INTO task" in compile_pg(session.statements[0])
+    assert [p["id"] for p in session.params[0]] == [t.id for t in tasks]
+
+
+def test_page_serializer_accepts_entities():
+    row = task_row(5)
+    entity = TaskEntity(**vars(row))
+    body = json.loads(task_page_serializer.dump_json([entity], next_cursor=None))
+    assert body["items"][0]["title"] == "T5"
+    assert body["items"][0]["id"] == str(row.id)
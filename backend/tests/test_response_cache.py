@@ -0,0 +1,71 @@
+import uuid
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from app.api.response_cache import cached_response, etag_matches
+from app.infrastructure.cache import TTLCache
+from app.infrastructure.tenant_writes import record_tenant_write
+
+
+class Page(BaseModel):
+    items: list[str]
+
+
+def make_client():
+    tenant_id = uuid.uuid4()
+    state = {"items": ["a"], "builds": 0}
+    app = FastAPI()
+
+    @app.get("/things/")
+    async def things(request: Request):
+        async def build():
+            state["builds"] += 1
+            return Page(items=list(state["items"]))
+
+        return await cached_response(request, tenant_id, build)
+
+    return TestClient(app), tenant_id, state
+
+
+def test_cached_page_and_304_until_tenant_write():
+    client, tenant_id, state = make_client()
+
+    first = client.get("/things/", params={"limit": 5})
+    assert first.status_code == 200 and first.json() == {"items": ["a"]}
+    etag = first.headers["etag"]
+
+    again = client.get("/things/", params={"limit": 5}, headers={"If-None-Match": etag})
+    assert again.status_code == 304 and again.headers["etag"] == etag
+    assert state["builds"] == 1
+
+    record_tenant_write(tenant_id)
+    unchanged = client.get("/things/", params={"limit": 5}, headers={"If-None-Match": etag})
+    assert unchanged.status_code == 304 and state["builds"] == 2
+
+    state["items"].append("b")
+    record_tenant_write(tenant_id)
+    changed = client.get("/things/", params={"limit": 5}, headers={"If-None-Match": etag})
+    assert changed.status_code == 200 and changed.json() == {"items": ["a", "b"]}
+    assert changed.headers["etag"] != etag
+
+
+def test_query_params_are_normalized():
+    client, _, state = make_client()
+    client.get("/things/?a=1&b=2")
+    client.get("/things/?b=2&a=1")
+    assert state["builds"] == 1
+
+
+def test_etag_matching_and_byte_budget():
+    assert etag_matches('W/"x", "y"', '"x"')
+    assert etag_matches("*", '"x"')
+    assert not etag_matches('"y"', '"x"')
+
+    cache = TTLCache(maxsize=10, ttl=60, max_bytes=10, sizeof=len)
+    cache.set("a", b"123456")
+    cache.set("b", b"123456")
+    assert cache.get("a") is None and cache.get("b") == b"123456" and cache.nbytes == 6
+    cache.set("huge", b"x" * 11)
+    assert cache.get("huge") is None
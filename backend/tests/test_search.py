@@ -0,0 +1,35 @@
+import uuid
+
+from app.api.routes.tasks import filtered_tasks_query, resolve_sort
+from app.infrastructure.db.models import Task
+from app.infrastructure.db.pagination import decode_cursor, encode_cursor
+from app.infrastructure.db.search import prefix_tsquery, search_rank
+
+from fakes import compile_pg
+
+
+def test_prefix_tsquery_strips_operators():
+    assert prefix_tsquery("Fix login") == "fix:* & login:*"
+    assert prefix_tsquery("a&b | !c:*") == "a:* & b:* & c:*"
+    assert prefix_tsquery("snake_case") == "snake:* & case:*"
+    assert prefix_tsquery("!!") is None
+
+
+def test_search_filter_is_tenant_scoped_with_trigram_fallback():
+    sql = compile_pg(filtered_tasks_query(uuid.uuid4(), q="reprot"))
+    assert "task.tenant_id =" in sql
+    assert "task.search_vector @@ to_tsquery('simple'" in sql
+    assert "<% task.title" in sql
+
+    fuzzy_only = compile_pg(filtered_tasks_query(uuid.uuid4(), q="??"))
+    assert "@@" not in fuzzy_only and "<% task.title" in fuzzy_only
+
+
+def test_search_defaults_to_rank_order_with_round_tripping_cursor():
+    assert resolve_sort(None, "report") == ("rank", True)
+    assert resolve_sort("due_date", "report") == ("due_date", False)
+    assert resolve_sort(None) == ("created_at", True)
+
+    row_id = uuid.uuid4()
+    assert decode_cursor(encode_cursor("-rank", 0.0607927, row_id), "-rank") == (0.0607927, row_id)
+    assert "greatest(ts_rank_cd" in compile_pg(search_rank(Task.search_vector, Task.title, "report"))
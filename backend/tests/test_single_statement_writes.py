@@ -0,0 +1,101 @@
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.routes import projects as project_routes
+from app.api.routes import tasks as task_routes
+
+from fakes import FakeResult, FakeSession
+
+
+@pytest.fixture
+def writes(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(task_routes, "record_tenant_write", lambda tenant_id, *events: recorded.extend(events))
+    monkeypatch.setattr(project_routes, "record_tenant_write", lambda tenant_id, *events: recorded.extend(events))
+    return recorded
+
+
+def task_row(**overrides):
+    fields = dict(
+        id=uuid.uuid4(), title="t", status="todo", assignee=None, priority="medium", due_date=None,
+        project_id=uuid.uuid4(),
+    )
+    return SimpleNamespace(**{**fields, **overrides})
+
+
+@pytest.mark.asyncio
+async def test_create_task_in_another_tenants_project_is_404(writes):
+    session = FakeSession(FakeResult(None))
+    body = task_routes.TaskCreate(title="t", project_id=uuid.uuid4())
+    with pytest.raises(HTTPException) as exc:
+        await task_routes.create_task(body, session, uuid.uuid4())
+    assert exc.value.status_code == 404
+    sql = session.statements[0]
+    assert sql.startswith("INSERT INTO task") and "FROM project" in sql
+    assert "project.tenant_id = " in sql and "RETURNING" in sql
+    assert not session.committed and writes == []
+
+
+@pytest.mark.asyncio
+async def test_create_task_returns_inserted_row(writes):
+    row = task_row(title="write docs")
+    session = FakeSession(FakeResult(row))
+    body = task_routes.TaskCreate(title="write docs", project_id=row.project_id)
+    task = await task_routes.create_task(body, session, uuid.uuid4())
+    assert task.id == row.id and task.title == "write docs"
+    assert session.committed and [event.type for event in writes] == ["task.created"]
+
+
+@pytest.mark.asyncio
+async def test_update_and_delete_of_missing_or_foreign_task_are_404(writes):
+    update = FakeSession(FakeResult(None))
+    with pytest.raises(HTTPException) as exc:
+        await task_routes.update_task(uuid.uuid4(), task_routes.TaskUpdate(title="x"), update, uuid.uuid4())
+    assert exc.value.status_code == 404
+    assert update.statements[0].startswith("UPDATE task") and "task.tenant_id = " in update.statements[0]
+
+    delete = FakeSession(FakeResult(None))
+    with pytest.raises(HTTPException) as exc:
+        await task_routes.delete_task(uuid.uuid4(), delete, uuid.uuid4())
+    assert exc.value.status_code == 404
+    assert delete.statements[0].startswith("DELETE FROM task") and "task.tenant_id = " in delete.statements[0]
+    assert not update.committed and not delete.committed and writes == []
+
+
+@pytest.mark.asyncio
+async def test_task_update_without_fields_returns_current_row(writes):
+    row = task_row(title="unchanged")
+    session = FakeSession(FakeResult(row))
+    task = await task_routes.update_task(row.id, task_routes.TaskUpdate(), session, uuid.uuid4())
+    assert task.title == "unchanged"
+    assert session.statements[0].startswith("SELECT")
+    assert not session.committed and writes == []
+
+
+@pytest.mark.asyncio
+async def test_update_and_delete_of_missing_or_foreign_project_are_404(writes):
+    update = FakeSession(FakeResult(None))
+    with pytest.raises(HTTPException) as exc:
+        await project_routes.update_project(uuid.uuid4(), project_routes.ProjectUpdate(name="x"), update, uuid.uuid4())
+    assert exc.value.status_code == 404
+    assert update.statements[0].startswith("UPDATE project") and "project.tenant_id = " in update.statements[0]
+
+    delete = FakeSession(FakeResult(None))
+    with pytest.raises(HTTPException) as exc:
+        await project_routes.delete_project(uuid.uuid4(), delete, uuid.uuid4())
+    assert exc.value.status_code == 404
+    assert len(delete.statements) == 1 and "project.tenant_id = " in delete.statements[0]
+    assert not update.committed and not delete.committed and writes == []
+
+
+@pytest.mark.asyncio
+async def test_project_update_without_fields_returns_current_row(writes):
+    row = SimpleNamespace(id=uuid.uuid4(), name="p", description=None)
+    session = FakeSession(FakeResult(row))
+    project = await project_routes.update_project(row.id, project_routes.ProjectUpdate(), session, uuid.uuid4())
+    assert project.id == row.id and project.name == "p"
+    assert session.statements[0].startswith("SELECT")
+    assert not session.committed and writes == []
@@ -0,0 +1,97 @@
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.routes.tasks import task_changes
+from app.infrastructure.db.changes import (
+    SyncPosition,
+    changes_query,
+    decode_sync_token,
+    encode_sync_token,
+    prune_statement,
+)
+
+from fakes import FakeResult, compile_pg
+
+
+class FakeSession:
+    """Answers the head/pruned lookup first, then the changes query."""
+
+    def __init__(self, seq_value, rows=()):
+        self.results = [FakeResult(seq_value), FakeResult(list(rows))]
+
+    async def execute(self, statement):
+        return self.results.pop(0)
+
+
+def change_row(seq, deleted=False, **overrides):
+    values = dict(
+        seq=seq, deleted=deleted, id=uuid.uuid4(), project_id=uuid.uuid4(), title=None if deleted else "t",
+        status=None if deleted else "todo", assignee=None, priority=None if deleted else "medium",
+        due_date=None, updated_at=datetime(2025, 9, 8),
+    )
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def test_sync_token_round_trips_and_rejects_garbage():
+    first = SyncPosition(floor=41)
+    assert decode_sync_token(encode_sync_token(first)) == first
+    after = SyncPosition(floor=41, seq=57, deleted=True, row_id=uuid.uuid4())
+    assert decode_sync_token(encode_sync_token(after)) == after
+
+    for token in ("", "not-a-token", encode_sync_token(first)[:-2] + "!!"):
+        with pytest.raises(ValueError):
+            decode_sync_token(token)
+
+
+def test_changes_query_resumes_after_the_position():
+    tenant_id = uuid.uuid4()
+    full = compile_pg(changes_query(tenant_id, SyncPosition(floor=5), 100))
+    assert "task.tenant_id =" in full and "task_tombstone.change_seq >" in full
+    assert "UNION ALL" in full and "(task.change_seq, task.id) >" not in full
+
+    after_upsert = compile_pg(changes_query(tenant_id, SyncPosition(5, 9, False, uuid.uuid4()), 100))
+    assert "(task.change_seq, task.id) > ($" in after_upsert
+    assert "task_tombstone.change_seq >=" in after_upsert
+
+    after_delete = compile_pg(changes_query(tenant_id, SyncPosition(5, 9, True, uuid.uuid4()), 100))
+    assert "(task_tombstone.change_seq, task_tombstone.task_id) > ($" in after_delete
+    assert "::BIGINT, $" in after_delete
+
+
+def test_prune_statement_advances_pruned_seq():
+    sql = compile_pg(prune_statement(datetime(2025, 1, 1), 500))
+    assert sql.startswith("WITH gone AS")
+    assert "DELETE FROM task_tombstone" in sql and "RETURNING task_tombstone.tenant_id" in sql
+    assert "SET pruned_seq=greatest(tenant_change_seq.pruned_seq" in sql
+
+
+@pytest.mark.asyncio
+async def test_changes_pages_split_upserts_and_deletions():
+    tenant_id = uuid.uuid4()
+    rows = [change_row(3), change_row(3, deleted=True), change_row(4)]
+    page = await task_changes(session=FakeSession(2, rows), tenant_id=tenant_id, since=None, limit=2)
+
+    assert page.has_more
+    assert [u.id for u in page.upserts] == [rows[0].id]
+    assert [d.id for d in page.deletions] == [rows[1].id]
+    assert decode_sync_token(page.next_token) == SyncPosition(floor=2, seq=3, deleted=True, row_id=rows[1].id)
+
+    empty = await task_changes(session=FakeSession(0), tenant_id=tenant_id, since=page.next_token, limit=2)
+    assert not empty.has_more and empty.next_token == page.next_token
+
+
+@pytest.mark.asyncio
+async def test_changes_rejects_bad_and_expired_tokens():
+    with pytest.raises(HTTPException) as bad:
+        await task_changes(session=FakeSession(0), tenant_id=uuid.uuid4(), since="garbage", limit=10)
+    assert bad.value.status_code == 400
+
+    stale = encode_sync_token(SyncPosition(floor=1, seq=3, deleted=False, row_id=uuid.uuid4()))
+    with pytest.raises(HTTPException) as expired:
+        await task_changes(session=FakeSession(10), tenant_id=uuid.uuid4(), since=stale, limit=10)
+    assert expired.value.status_code == 410
@@ -0,0 +1,88 @@
+"""EXPLAIN checks that tenant-scoped task queries read one hash partition.
+
+Needs ``TEST_DATABASE_URL`` (a sync URL, e.g. ``postgresql+psycopg2://...``)
+pointing at a database migrated to head; statements are only planned,
+never executed.
+"""
+
+import os
+import re
+import uuid
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, delete, text, update
+from sqlalchemy.dialects import postgresql
+
+from app.api.routes.tasks import TASK_LIST_COLUMNS, StatusEnum, filtered_tasks_query
+from app.infrastructure.db.changes import SyncPosition, changes_query
+from app.infrastructure.db.models import Task
+from app.infrastructure.db.purge import batch_delete_statement
+from app.infrastructure.db.stats import project_stats_query, recount_statement
+from app.infrastructure.repositories.sqlalchemy_repositories import TaskRepositorySQLAlchemy
+
+from fakes import CapturingSession
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+pytestmark = pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL not set")
+
+PARTITION = re.compile(r"^task_p\d+$")
+TENANT_ID = uuid.uuid4()
+
+
+def _walk(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _walk(child)
+
+
+@pytest.fixture(scope="module")
+def conn():
+    engine = create_engine(TEST_DATABASE_URL)
+    with engine.connect() as connection:
+        yield connection
+    engine.dispose()
+
+
+def task_partitions_scanned(conn, statement) -> set[str]:
+    sql = statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    plan = conn.execute(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar_one()[0]["Plan"]
+    return {n["Relation Name"] for n in _walk(plan) if PARTITION.match(n.get("Relation Name", ""))}
+
+
+def test_task_table_is_hash_partitioned(conn):
+    strategy = conn.execute(
+        text("SELECT partstrat FROM pg_partitioned_table WHERE partrelid = 'task'::regclass")
+    ).scalar_one_or_none()
+    assert strategy == "h"
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [{}, {"project_id": uuid.uuid4()}, {"status_filter": StatusEnum.todo}, {"q": "report"}],
+    ids=["tenant", "project", "status", "search"],
+)
+def test_list_queries_prune_to_one_partition(conn, filters):
+    query = filtered_tasks_query(TENANT_ID, **filters).with_only_columns(*TASK_LIST_COLUMNS)
+    assert len(task_partitions_scanned(conn, query.order_by(Task.created_at.desc()).limit(20))) == 1
+
+
+def test_writes_and_background_queries_prune_to_one_partition(conn):
+    scope = (Task.id == uuid.uuid4(), Task.tenant_id == TENANT_ID)
+    statements = [
+        update(Task).where(*scope).values(title="x"),
+        delete(Task).where(*scope),
+        changes_query(TENANT_ID, SyncPosition(floor=0, seq=5, row_id=uuid.uuid4()), 100),
+        project_stats_query(TENANT_ID, datetime.utcnow()),
+        recount_statement(TENANT_ID),
+        batch_delete_statement(TENANT_ID, uuid.uuid4(), 1000),
+    ]
+    for statement in statements:
+        assert len(task_partitions_scanned(conn, statement)) == 1, statement
+
+
+@pytest.mark.asyncio
+async def test_repository_queries_prune_to_one_partition(conn):
+    session = CapturingSession()
+    await TaskRepositorySQLAlchemy(session).list_by_tenant(TENANT_ID, project_id=uuid.uuid4())
+    assert len(task_partitions_scanned(conn, session.statements[0])) == 1
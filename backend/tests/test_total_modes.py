@@ -0,0 +1,58 @@
+import uuid
+import pytest
+
+from sqlalchemy import select
+
+from app.infrastructure.cache import TTLCache
+from app.infrastructure.db.counting import TotalMode, count_total
+from app.infrastructure.db.models import Task
+from app.infrastructure.tenant_writes import record_tenant_write
+
+from fakes import FakeResult
+
+
+class FakeSession:
+    def __init__(self, total):
+        self.total = total
+        self.calls = 0
+
+    async def execute(self, query):
+        self.calls += 1
+        return FakeResult(self.total)
+
+
+def test_ttl_cache_lru_eviction_and_expiry():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+
+    expired = TTLCache(maxsize=2, ttl=-1)
+    expired.set("a", 1)
+    assert expired.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_count_none_skips_query():
+    session = FakeSession(5)
+    total = await count_total(session, select(Task), TotalMode.none, uuid.uuid4(), ("task",))
+    assert total is None and session.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_count_cached_until_tenant_write():
+    tenant_id = uuid.uuid4()
+    session = FakeSession(5)
+    query = select(Task).where(Task.tenant_id == tenant_id)
+
+    assert await count_total(session, query, TotalMode.cached, tenant_id, ("task", None)) == 5
+    session.total = 6
+    assert await count_total(session, query, TotalMode.cached, tenant_id, ("task", None)) == 5
+    assert session.calls == 1
+
+    record_tenant_write(tenant_id)
+    assert await count_total(session, query, TotalMode.cached, tenant_id, ("task", None)) == 6
+    assert session.calls == 2
@@ -1,6 +1,7 @@
-import React, { useEffect, useState } from 'react'
+import React, { useEffect, useRef, useState } from 'react'
 import { useParams } from 'react-router-dom'
 import api from '../../lib/api'
+import { subscribeEvents } from '../../lib/events'
 
 export default function ProjectDetailPage() {
   const { id } = useParams()
@@ -36,14 +37,57 @@ export default function ProjectDetailPage() {
 
   useEffect(() => { load() }, [id, statusFilter, priorityFilter, sort, limit, offset])
 
+  const matchesFilters = (t) =>
+    (!statusFilter || t.status === statusFilter) && (!priorityFilter || t.priority === priorityFilter)
+
+  // Apply changes to the visible page: our own from the API responses, other
+  // users' from the event stream (which echoes ours too; applying twice is
+  // harmless). Only changes that can move rows across pages or sort positions
+  // trigger a refetch.
+  const applyEvent = ({ type, data }) => {
+    if (type === 'resync' || type === 'task.bulk') {
+      load()
+    } else if (type === 'project.deleted' && data.id === id) {
+      setTasks([])
+      setError('This project was deleted')
+    } else if (!data || data.project_id !== id) {
+      return
+    } else if (type === 'task.created') {
+      if (!matchesFilters(data)) return
+      if (sort === '-created_at' && offset === 0) {
+        setTasks(prev => prev.some(t => t.id === data.id) ? prev : [data, ...prev].slice(0, limit))
+      } else {
+        load()
+      }
+    } else if (type === 'task.updated') {
+      const current = tasks.find(t => t.id === data.id)
+      const sortKey = sort.replace(/^-/, '')
+      if (current && matchesFilters(data) && current[sortKey] === data[sortKey]) {
+        setTasks(prev => prev.map(t => (t.id === data.id ? { ...t, ...data } : t)))
+      } else if (current || ((statusFilter || priorityFilter) && matchesFilters(data))) {
+        // Left the page, moved in the sort order, or just entered the filtered view.
+        load()
+      }
+    } else if (type === 'task.deleted') {
+      setTasks(prev => prev.filter(t => t.id !== data.id))
+    }
+  }
+
+  // One stream per page; handlers read the latest filters through refs.
+  const applyEventRef = useRef(applyEvent)
+  const loadRef = useRef(load)
+  applyEventRef.current = applyEvent
+  loadRef.current = load
+  useEffect(() => subscribeEvents((e) => applyEventRef.current(e), () => loadRef.current()), [id])
+
   const createTask = async (e) => {
     e.preventDefault()
     try {
-      await api.post('/tasks/', { title, status, assignee: assignee || null, project_id: id })
+      const { data } = await api.post('/tasks/', { title, status, assignee: assignee || null, project_id: id })
+      applyEvent({ type: 'task.created', data })
       setTitle('')
       setStatus('todo')
       setAssignee('')
-      load()
     } catch (e) {
       setError('Failed to create task')
     }
@@ -66,13 +110,13 @@ export default function ProjectDetailPage() {
   const saveEdit = async () => {
     if (!editingId) return
     try {
-      await api.put(`/tasks/${editingId}`, {
+      const { data } = await api.put(`/tasks/${editingId}`, {
         title: editTitle,
         status: editStatus,
         assignee: editAssignee || null,
       })
+      applyEvent({ type: 'task.updated', data })
       cancelEdit()
-      load()
     } catch (e) {
       setError('Failed to update task')
     }
@@ -80,8 +124,8 @@ export default function ProjectDetailPage() {
 
   const updateStatus = async (taskId, newStatus) => {
     try {
-      await api.put(`/tasks/${taskId}`, { status: newStatus })
-      load()
+      const { data } = await api.put(`/tasks/${taskId}`, { status: newStatus })
+      applyEvent({ type: 'task.updated', data })
     } catch (e) {
       setError('Failed to update')
     }
@@ -90,7 +134,7 @@ export default function ProjectDetailPage() {
   const deleteTask = async (taskId) => {
     try {
       await api.delete(`/tasks/${taskId}`)
-      load()
+      applyEvent({ type: 'task.deleted', data: { id: taskId, project_id: id } })
     } catch (e) {
       setError('Failed to delete')
     }
@@ -0,0 +1,58 @@
+import api from './api'
+
+// Subscribe to the tenant's change feed (GET /events, Server-Sent Events).
+// onEvent receives { type, data } objects such as task.updated; onReconnect
+// runs after the connection recovers, since events sent meanwhile are lost.
+// Returns a function that closes the stream.
+export function subscribeEvents(onEvent, onReconnect) {
+  if (typeof EventSource === 'undefined') return () => {}
+
+  let source = null
+  let retryTimer = null
+  let closed = false
+  let interrupted = false
+
+  const retry = () => {
+    if (!closed) retryTimer = setTimeout(open, 3000)
+  }
+
+  const open = async () => {
+    if (!localStorage.getItem('token') || closed) return
+    // EventSource cannot send headers, and URLs end up in server logs, so the
+    // stream is opened with a short-lived ticket rather than the access token.
+    let ticket
+    try {
+      ({ data: { ticket } } = await api.post('/events/ticket'))
+    } catch (e) {
+      interrupted = true
+      retry()
+      return
+    }
+    if (closed) return
+    source = new EventSource(`${api.defaults.baseURL}/events?ticket=${encodeURIComponent(ticket)}`)
+    source.onopen = () => {
+      if (interrupted && onReconnect) onReconnect()
+      interrupted = false
+    }
+    source.onmessage = (e) => {
+      try {
+        onEvent(JSON.parse(e.data))
+      } catch (err) {
+        // Ignore malformed messages rather than dropping the stream.
+      }
+    }
+    source.onerror = () => {
+      interrupted = true
+      // The browser retries on its own unless the server refused the stream
+      // (e.g. the ticket or token expired); then reopen with a new ticket.
+      if (source.readyState === EventSource.CLOSED) retry()
+    }
+  }
+
+  open()
+  return () => {
+    closed = true
+    clearTimeout(retryTimer)
+    if (source) source.close()
+  }
+}